@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
     
     # Third-party apps
     'rest_framework',
@@ -48,6 +49,10 @@ INSTALLED_APPS = [
     'mentorship',
     'jobs',
     'forums',
+    'imaging',
+    'tasks',
+    'notifications',
+    'stats',
 ]
 
 MIDDLEWARE = [
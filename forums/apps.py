@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+class ForumsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'forums'
+    
+    def ready(self):
+        from . import signals
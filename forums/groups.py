@@ -0,0 +1,94 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from .models import StudyGroup, StudyGroupMember, StudyGroupJoinRequest
+
+# Roles allowed to decide join requests
+MANAGER_ROLES = ('admin', 'moderator')
+
+class GroupError(Exception):
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+def add_member(study_group_id, user, role='member'):
+    """
+    Claim a seat with one conditional UPDATE, then insert the membership.
+    Concurrent joins can never take more seats than max_members.
+    """
+    with transaction.atomic():
+        seated = StudyGroup.objects.filter(pk=study_group_id, member_count__lt=F('max_members'))\
+            .update(member_count=F('member_count') + 1)
+        if not seated:
+            raise GroupError('Group is full.', status_code=409)
+        
+        try:
+            with transaction.atomic():
+                return StudyGroupMember.objects.create(study_group_id=study_group_id, user=user, role=role)
+        except IntegrityError:
+            # Raising rolls the seat back too
+            raise GroupError('Already a member of this group.')
+
+def remove_member(study_group_id, user):
+    """Delete the membership and free its seat; returns False if there was none"""
+    with transaction.atomic():
+        deleted, _ = StudyGroupMember.objects.filter(study_group_id=study_group_id, user=user).delete()
+        if not deleted:
+            return False
+        StudyGroup.objects.filter(pk=study_group_id, member_count__gt=0)\
+            .update(member_count=F('member_count') - 1)
+    return True
+
+def is_manager(study_group_id, user):
+    return StudyGroupMember.objects.filter(
+        study_group_id=study_group_id, user=user, role__in=MANAGER_ROLES
+    ).exists()
+
+def request_to_join(study_group, user, message=''):
+    if StudyGroupMember.objects.filter(study_group=study_group, user=user).exists():
+        raise GroupError('Already a member of this group.')
+    try:
+        with transaction.atomic():
+            return StudyGroupJoinRequest.objects.create(study_group=study_group, user=user, message=message)
+    except IntegrityError:
+        raise GroupError('You already have a pending request for this group.')
+
+def decide_join_request(join_request_id, study_group_id, manager, approve):
+    """Approve or reject a pending request; approval takes a seat in the same transaction"""
+    if not is_manager(study_group_id, manager):
+        raise GroupError('Only group admins and moderators can decide join requests.', status_code=403)
+    
+    with transaction.atomic():
+        decided = StudyGroupJoinRequest.objects.filter(
+            pk=join_request_id, study_group_id=study_group_id, status='pending'
+        ).update(
+            status='approved' if approve else 'rejected',
+            decided_by=manager,
+            decided_at=timezone.now()
+        )
+        if not decided:
+            raise GroupError('This request has already been processed.', status_code=409)
+        
+        join_request = StudyGroupJoinRequest.objects.select_related('user').get(pk=join_request_id)
+        if approve:
+            add_member(study_group_id, join_request.user)
+    return join_request
+
+def cancel_join_request(join_request_id, user):
+    cancelled = StudyGroupJoinRequest.objects.filter(pk=join_request_id, user=user, status='pending')\
+        .update(status='cancelled', decided_at=timezone.now())
+    if not cancelled:
+        raise GroupError('No pending request to cancel.', status_code=409)
+    return StudyGroupJoinRequest.objects.get(pk=join_request_id)
+
+def sync_member_counts(study_group_id=None):
+    """Recount memberships in a single UPDATE, for one group or all of them"""
+    members = StudyGroupMember.objects.filter(study_group_id=OuterRef('pk'))\
+        .values('study_group_id').annotate(total=Count('id')).values('total')
+    
+    groups = StudyGroup.objects.all()
+    if study_group_id is not None:
+        groups = groups.filter(pk=study_group_id)
+    return groups.update(member_count=Coalesce(Subquery(members), Value(0)))
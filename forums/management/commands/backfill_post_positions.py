@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from forums.models import ForumTopic, ForumPost
+
+class Command(BaseCommand):
+    help = 'Number forum posts within their topics and resync reply counts'
+    
+    def handle(self, *args, **options):
+        topics = ForumTopic.objects.annotate(posts_total=Count('posts')).values_list('id', 'posts_total')
+        
+        numbered = 0
+        for topic_id, posts_total in topics.iterator(chunk_size=500):
+            with transaction.atomic():
+                posts = list(ForumPost.objects.filter(topic_id=topic_id).order_by('created_at', 'id').only('id', 'position'))
+                for position, post in enumerate(posts, start=1):
+                    post.position = position
+                ForumPost.objects.bulk_update(posts, ['position'], batch_size=1000)
+                ForumTopic.objects.filter(pk=topic_id).update(reply_count=posts_total)
+            numbered += len(posts)
+        
+        self.stdout.write(self.style.SUCCESS(f'Numbered {numbered} posts.'))
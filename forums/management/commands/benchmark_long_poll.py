@@ -0,0 +1,71 @@
+import asyncio
+import statistics
+import time
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+from forums.models import StudyGroupMember
+from users.serializers import ClaimsTokenObtainPairSerializer
+
+class Command(BaseCommand):
+    help = (
+        'Load-test a running server: hold --pollers message long-polls open while '
+        'measuring throughput and latency of ordinary requests (see README "Serving modes")'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='Base URL of the server under test')
+        parser.add_argument('--group', type=int, required=True, help='Study group id to poll')
+        parser.add_argument('--pollers', type=int, default=50, help='Concurrent long-polls held open')
+        parser.add_argument('--clients', type=int, default=20, help='Concurrent clients sending ordinary requests')
+        parser.add_argument('--duration', type=int, default=20, help='Seconds to measure for')
+    
+    def handle(self, *args, **options):
+        member = StudyGroupMember.objects.filter(study_group_id=options['group']).select_related('user').first()
+        if member is None:
+            raise CommandError('The study group has no members to authenticate as.')
+        token = str(ClaimsTokenObtainPairSerializer.get_token(member.user).access_token)
+        
+        latencies, errors = asyncio.run(self.run(options, token))
+        duration = options['duration']
+        self.stdout.write(f"Long-polls held open: {options['pollers']}")
+        self.stdout.write(f'Requests completed:   {len(latencies)} ({len(latencies) / duration:.1f}/s)')
+        self.stdout.write(f'Errors:               {errors}')
+        if len(latencies) >= 2:
+            percentiles = statistics.quantiles(latencies, n=100)
+            self.stdout.write(f'Latency p50/p95/max:  {percentiles[49] * 1000:.0f} / {percentiles[94] * 1000:.0f} / {max(latencies) * 1000:.0f} ms')
+    
+    async def run(self, options, token):
+        base = f"{options['url'].rstrip('/')}/api/forums/groups/{options['group']}/messages/poll/"
+        headers = {'Authorization': f'Bearer {token}'}
+        limits = httpx.Limits(max_connections=options['pollers'] + options['clients'])
+        deadline = time.monotonic() + options['duration']
+        latencies = []
+        errors = 0
+        
+        async with httpx.AsyncClient(headers=headers, limits=limits, timeout=60) as client:
+            async def poller():
+                # Nothing new arrives, so each poll waits out its full timeout
+                while time.monotonic() < deadline:
+                    try:
+                        await client.get(base, params={'after': 2 ** 62, 'wait': 25})
+                    except httpx.HTTPError:
+                        pass
+            
+            async def requester():
+                nonlocal errors
+                while time.monotonic() < deadline:
+                    started = time.monotonic()
+                    try:
+                        response = await client.get(base, params={'wait': 0})
+                        response.raise_for_status()
+                    except httpx.HTTPError:
+                        errors += 1
+                        continue
+                    latencies.append(time.monotonic() - started)
+            
+            pollers = [asyncio.create_task(poller()) for _ in range(options['pollers'])]
+            await asyncio.gather(*(requester() for _ in range(options['clients'])))
+            for task in pollers:
+                task.cancel()
+            await asyncio.gather(*pollers, return_exceptions=True)
+        return latencies, errors
@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from forums.groups import sync_member_counts
+
+class Command(BaseCommand):
+    help = 'Recount study group members from their memberships'
+    
+    def handle(self, *args, **options):
+        count = sync_member_counts()
+        self.stdout.write(self.style.SUCCESS(f'Synced member counts for {count} study groups.'))
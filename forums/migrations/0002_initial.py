@@ -0,0 +1,158 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('learning_paths', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('forums', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='topicreadmarker',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='topic_read_markers', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='studygroupmessage',
+            name='sender',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='study_group_messages', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='studygroupmessage',
+            name='study_group',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='forums.studygroup'),
+        ),
+        migrations.AddField(
+            model_name='studygroupmember',
+            name='study_group',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='members', to='forums.studygroup'),
+        ),
+        migrations.AddField(
+            model_name='studygroupmember',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='study_groups', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='studygroupjoinrequest',
+            name='decided_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='studygroupjoinrequest',
+            name='study_group',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='join_requests', to='forums.studygroup'),
+        ),
+        migrations.AddField(
+            model_name='studygroupjoinrequest',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='study_group_join_requests', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='studygroup',
+            name='creator',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='created_study_groups', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='studygroup',
+            name='learning_path',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='study_groups', to='learning_paths.learningpath'),
+        ),
+        migrations.AddField(
+            model_name='studygroup',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='study_groups', to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='postlike',
+            name='post',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='likes', to='forums.forumpost'),
+        ),
+        migrations.AddField(
+            model_name='postlike',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_likes', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='forumtopic',
+            name='author',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='forum_topics', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='forumtopic',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='topics', to='forums.forumcategory'),
+        ),
+        migrations.AddField(
+            model_name='forumtopic',
+            name='learning_path',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='forum_topics', to='learning_paths.learningpath'),
+        ),
+        migrations.AddField(
+            model_name='forumtopic',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='forum_topics', to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='forumpost',
+            name='author',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='forum_posts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='forumpost',
+            name='topic',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='posts', to='forums.forumtopic'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='topicreadmarker',
+            unique_together={('user', 'topic')},
+        ),
+        migrations.AddIndex(
+            model_name='studygroupmessage',
+            index=models.Index(fields=['study_group', 'id'], name='forums_sgmessage_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studygroupmember',
+            index=models.Index(fields=['user', 'study_group'], name='forums_sgmember_user_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='studygroupmember',
+            unique_together={('study_group', 'user')},
+        ),
+        migrations.AddIndex(
+            model_name='studygroupjoinrequest',
+            index=models.Index(fields=['study_group', 'status', 'created_at'], name='forums_joinreq_queue_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='studygroupjoinrequest',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('study_group', 'user'), name='forums_one_pending_join_request'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='postlike',
+            unique_together={('post', 'user')},
+        ),
+        migrations.AddIndex(
+            model_name='forumtopic',
+            index=models.Index(fields=['category', '-is_pinned', '-hot_score'], name='forums_topic_hot_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forumtopic',
+            index=models.Index(fields=['-is_pinned', '-hot_score'], name='forums_topic_hot_all_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forumtopic',
+            index=models.Index(fields=['category', '-last_activity'], name='forums_topic_activity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='forumpost',
+            index=models.Index(fields=['topic', 'position'], name='forums_post_position_idx'),
+        ),
+    ]
@@ -7,6 +7,7 @@ class ForumCategory(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField()
     icon = models.ImageField(upload_to='forum_categories/', blank=True, null=True)
+    icon_variants = models.JSONField(default=dict, blank=True)
     
     # Category statistics
     topic_count = models.PositiveIntegerField(default=0)
@@ -36,11 +37,21 @@ class ForumTopic(models.Model):
     # Topic statistics
     view_count = models.PositiveIntegerField(default=0)
     reply_count = models.PositiveIntegerField(default=0)
+    hot_score = models.FloatField(default=0)  # Bumped on activity, decayed hourly (see forums.ranking)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     last_activity = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            # Front page of a category: pinned first, then hottest, as one index range scan
+            models.Index(fields=['category', '-is_pinned', '-hot_score'], name='forums_topic_hot_idx'),
+            models.Index(fields=['-is_pinned', '-hot_score'], name='forums_topic_hot_all_idx'),
+            # Category listing sorted with ?ordering=-last_activity
+            models.Index(fields=['category', '-last_activity'], name='forums_topic_activity_idx'),
+        ]
+    
     def __str__(self):
         return self.title
 
@@ -52,6 +63,7 @@ class ForumPost(models.Model):
     
     # Post metadata
     is_solution = models.BooleanField(default=False)
+    position = models.PositiveIntegerField(default=0)  # 1-based reply number within the topic
     
     # Post statistics
     like_count = models.PositiveIntegerField(default=0)
@@ -59,9 +71,31 @@ class ForumPost(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['topic', 'position'], name='forums_post_position_idx'),
+        ]
+    
     def __str__(self):
         return f"Post by {self.author.username} in {self.topic.title}"
 
+class TopicReadMarker(models.Model):
+    """How far a user has read a topic: one row per user and topic"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='topic_read_markers')
+    topic = models.ForeignKey(ForumTopic, on_delete=models.CASCADE, related_name='read_markers')
+    
+    # Watermark: the last post read and its position, so unread = reply_count - position
+    last_read_post_id = models.PositiveBigIntegerField(default=0)
+    last_read_position = models.PositiveIntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ('user', 'topic')
+    
+    def __str__(self):
+        return f"{self.user.username} read {self.topic.title} to #{self.last_read_position}"
+
 class PostLike(models.Model):
     """Likes on forum posts"""
     post = models.ForeignKey(ForumPost, on_delete=models.CASCADE, related_name='likes')
@@ -83,6 +117,7 @@ class StudyGroup(models.Model):
     # Group details
     is_private = models.BooleanField(default=False)
     max_members = models.PositiveIntegerField(default=10)
+    member_count = models.PositiveIntegerField(default=0)  # Kept in sync by forums.groups
     
     # Related entities
     learning_path = models.ForeignKey(LearningPath, on_delete=models.SET_NULL, null=True, blank=True, related_name='study_groups')
@@ -113,10 +148,47 @@ class StudyGroupMember(models.Model):
     
     class Meta:
         unique_together = ('study_group', 'user')
+        indexes = [
+            # Membership lookups by user ("my groups", visibility checks)
+            models.Index(fields=['user', 'study_group'], name='forums_sgmember_user_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} in {self.study_group.name}"
 
+class StudyGroupJoinRequest(models.Model):
+    """Requests to join private study groups, decided by group admins and moderators"""
+    study_group = models.ForeignKey(StudyGroup, on_delete=models.CASCADE, related_name='join_requests')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='study_group_join_requests')
+    message = models.TextField(blank=True)
+    
+    # Request status
+    status = models.CharField(max_length=50, choices=[
+        ('pending', 'Pending'),
+        ('approved', 'Approved'),
+        ('rejected', 'Rejected'),
+        ('cancelled', 'Cancelled'),
+    ], default='pending')
+    decided_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    decided_at = models.DateTimeField(null=True, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['study_group', 'user'],
+                condition=models.Q(status='pending'),
+                name='forums_one_pending_join_request'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['study_group', 'status', 'created_at'], name='forums_joinreq_queue_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} -> {self.study_group.name} ({self.status})"
+
 class StudyGroupMessage(models.Model):
     """Messages in study groups"""
     study_group = models.ForeignKey(StudyGroup, on_delete=models.CASCADE, related_name='messages')
@@ -127,5 +199,11 @@ class StudyGroupMessage(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            # History and long-poll both page a group's messages by id
+            models.Index(fields=['study_group', 'id'], name='forums_sgmessage_feed_idx'),
+        ]
+    
     def __str__(self):
         return f"Message from {self.sender.username} in {self.study_group.name}"
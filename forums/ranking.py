@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.db.models import F
+from .models import ForumTopic
+
+# Score added to a topic for each kind of activity
+HOT_WEIGHTS = {
+    'create': 2.0,
+    'reply': 3.0,
+    'like': 1.0,
+    'view': 0.1,
+}
+
+# Scores below this after decay are flattened to zero so old topics stop being rewritten
+HOT_FLOOR = 0.01
+
+def bump(topic_id, event, **updates):
+    """Add an event's weight to the topic's hot score, plus any other column updates, in one UPDATE"""
+    return ForumTopic.objects.filter(pk=topic_id).update(
+        hot_score=F('hot_score') + HOT_WEIGHTS[event],
+        **updates
+    )
+
+def decay_factor(interval_hours):
+    """Multiplier that halves a score every FORUM_HOT_HALF_LIFE_HOURS"""
+    half_life = getattr(settings, 'FORUM_HOT_HALF_LIFE_HOURS', 24)
+    return 0.5 ** (interval_hours / half_life)
+
+def decay_hot_scores(interval_hours=1):
+    """Decay every live score in place; returns the number of topics touched"""
+    live = ForumTopic.objects.filter(hot_score__gt=0)
+    live.filter(hot_score__lt=HOT_FLOOR).update(hot_score=0)
+    return live.update(hot_score=F('hot_score') * decay_factor(interval_hours))
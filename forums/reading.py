@@ -0,0 +1,76 @@
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+from .models import ForumPost, ForumTopic, TopicReadMarker
+
+def with_read_state(queryset, user):
+    """Annotate topics with the user's read watermark; unread counts need no post scan"""
+    markers = TopicReadMarker.objects.filter(user=user, topic=OuterRef('pk'))
+    return queryset.annotate(
+        last_read_post_id=Subquery(markers.values('last_read_post_id')[:1]),
+        last_read_position=Subquery(markers.values('last_read_position')[:1]),
+    )
+
+def mark_read(user, post_ids):
+    """
+    Move the user's watermarks forward to the given posts, one row per topic,
+    in one bulk upsert. Watermarks never move backwards.
+    """
+    posts = ForumPost.objects.filter(id__in=post_ids).values_list('topic_id', 'id', 'position')
+    
+    # Furthest post per topic in this batch
+    furthest = {}
+    for topic_id, post_id, position in posts:
+        if topic_id not in furthest or position > furthest[topic_id][1]:
+            furthest[topic_id] = (post_id, position)
+    
+    current = dict(
+        TopicReadMarker.objects.filter(user=user, topic_id__in=list(furthest))
+        .values_list('topic_id', 'last_read_position')
+    )
+    now = timezone.now()
+    markers = [
+        TopicReadMarker(
+            user=user,
+            topic_id=topic_id,
+            last_read_post_id=post_id,
+            last_read_position=position,
+            updated_at=now
+        )
+        for topic_id, (post_id, position) in furthest.items()
+        if position > current.get(topic_id, 0)
+    ]
+    
+    TopicReadMarker.objects.bulk_create(
+        markers,
+        update_conflicts=True,
+        unique_fields=['user', 'topic'],
+        update_fields=['last_read_post_id', 'last_read_position', 'updated_at']
+    )
+    return len(markers)
+
+def mark_topic_read(user, topic):
+    """Mark everything currently in the topic as read"""
+    latest = ForumPost.objects.filter(topic=topic).order_by('-position').values_list('id', flat=True).first()
+    if latest is None:
+        return 0
+    return mark_read(user, [latest])
+
+def close_position_gap(topic_id, post_id, position):
+    """
+    After a post is deleted, shift later posts and read watermarks down by one and
+    drop the topic's reply_count, so positions stay 1..reply_count and unread counts hold
+    """
+    with transaction.atomic():
+        # Same lock as a new reply takes, so numbering never interleaves
+        if not ForumTopic.objects.select_for_update().filter(pk=topic_id).exists():
+            return
+        ForumPost.objects.filter(topic_id=topic_id, position__gt=position).update(position=F('position') - 1)
+        TopicReadMarker.objects.filter(topic_id=topic_id, last_read_position__gte=position, last_read_position__gt=0)\
+            .update(last_read_position=F('last_read_position') - 1)
+        # Watermarks on the deleted post fall back to the post before it
+        previous_id = ForumPost.objects.filter(topic_id=topic_id, position=position - 1)\
+            .values_list('id', flat=True).first()
+        TopicReadMarker.objects.filter(topic_id=topic_id, last_read_post_id=post_id)\
+            .update(last_read_post_id=previous_id or 0)
+        ForumTopic.objects.filter(pk=topic_id, reply_count__gt=0).update(reply_count=F('reply_count') - 1)
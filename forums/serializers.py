@@ -1,12 +1,15 @@
 from rest_framework import serializers
 from .models import (
     ForumCategory, ForumTopic, ForumPost, PostLike,
-    StudyGroup, StudyGroupMember, StudyGroupMessage
+    StudyGroup, StudyGroupMember, StudyGroupMessage, StudyGroupJoinRequest
 )
 from users.serializers import UserProfileSerializer
 from learning_paths.serializers import LearningPathSerializer, SkillSerializer
+from imaging.fields import ImageVariantsField
 
 class ForumCategorySerializer(serializers.ModelSerializer):
+    icon_variants = ImageVariantsField('icon')
+    
     class Meta:
         model = ForumCategory
         fields = '__all__'
@@ -17,11 +20,20 @@ class ForumTopicSerializer(serializers.ModelSerializer):
     category = ForumCategorySerializer(read_only=True)
     learning_path = LearningPathSerializer(read_only=True)
     skills = SkillSerializer(many=True, read_only=True)
+    last_read_post_id = serializers.SerializerMethodField()
+    unread_count = serializers.SerializerMethodField()
     
     class Meta:
         model = ForumTopic
         fields = '__all__'
-        read_only_fields = ('author', 'view_count', 'reply_count', 'created_at', 'updated_at', 'last_activity')
+        read_only_fields = ('author', 'view_count', 'reply_count', 'hot_score', 'created_at', 'updated_at', 'last_activity')
+    
+    def get_last_read_post_id(self, obj):
+        # Annotated by forums.reading.with_read_state
+        return getattr(obj, 'last_read_post_id', None)
+    
+    def get_unread_count(self, obj):
+        return max(0, obj.reply_count - (getattr(obj, 'last_read_position', None) or 0))
 
 class ForumPostSerializer(serializers.ModelSerializer):
     author = UserProfileSerializer(read_only=True)
@@ -30,7 +42,7 @@ class ForumPostSerializer(serializers.ModelSerializer):
     class Meta:
         model = ForumPost
         fields = '__all__'
-        read_only_fields = ('author', 'like_count', 'created_at', 'updated_at')
+        read_only_fields = ('author', 'like_count', 'position', 'created_at', 'updated_at')
     
     def get_is_liked(self, obj):
         request = self.context.get('request')
@@ -42,15 +54,11 @@ class StudyGroupSerializer(serializers.ModelSerializer):
     creator = UserProfileSerializer(read_only=True)
     learning_path = LearningPathSerializer(read_only=True)
     skills = SkillSerializer(many=True, read_only=True)
-    member_count = serializers.SerializerMethodField()
     
     class Meta:
         model = StudyGroup
         fields = '__all__'
-        read_only_fields = ('creator', 'created_at', 'updated_at')
-    
-    def get_member_count(self, obj):
-        return obj.members.count()
+        read_only_fields = ('creator', 'member_count', 'created_at', 'updated_at')
 
 class StudyGroupMemberSerializer(serializers.ModelSerializer):
     user = UserProfileSerializer(read_only=True)
@@ -61,6 +69,14 @@ class StudyGroupMemberSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ('joined_at',)
 
+class StudyGroupJoinRequestSerializer(serializers.ModelSerializer):
+    user = UserProfileSerializer(read_only=True)
+    
+    class Meta:
+        model = StudyGroupJoinRequest
+        fields = ('id', 'study_group', 'user', 'message', 'status', 'decided_at', 'created_at')
+        read_only_fields = ('study_group', 'status', 'decided_at', 'created_at')
+
 class StudyGroupMessageSerializer(serializers.ModelSerializer):
     sender = UserProfileSerializer(read_only=True)
     
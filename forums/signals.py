@@ -0,0 +1,12 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .models import ForumPost, ForumTopic
+from .reading import close_position_gap
+
+@receiver(post_delete, sender=ForumPost)
+def forum_post_deleted(sender, instance, origin=None, **kwargs):
+    # Deleting a whole topic takes its posts with it; nothing is left to renumber
+    if isinstance(origin, ForumTopic) or (isinstance(origin, QuerySet) and origin.model is ForumTopic):
+        return
+    close_position_gap(instance.topic_id, instance.pk, instance.position)
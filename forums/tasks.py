@@ -0,0 +1,7 @@
+from datetime import timedelta
+from tasks.queue import periodic_task
+from .ranking import decay_hot_scores
+
+@periodic_task(every=timedelta(hours=1))
+def decay_topic_hot_scores():
+    decay_hot_scores(interval_hours=1)
@@ -0,0 +1,75 @@
+import asyncio
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from forums.models import StudyGroup, StudyGroupMember, StudyGroupMessage
+from rest_framework_simplejwt.tokens import AccessToken
+from users.models import User
+
+def bearer(user):
+    return {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+
+def poll_url(group):
+    return f'/api/forums/groups/{group.pk}/messages/poll/'
+
+class StudyGroupPollTests(TestCase):
+    """The async message feed, called through the ASGI handler"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create_user(username='member', email='member@example.com', password='x')
+        cls.outsider = User.objects.create_user(username='outsider', email='outsider@example.com', password='x')
+        cls.group = StudyGroup.objects.create(name='Group', description='', creator=cls.member)
+        StudyGroupMember.objects.create(study_group=cls.group, user=cls.member)
+        cls.messages = [
+            StudyGroupMessage.objects.create(study_group=cls.group, sender=cls.member, content=f'Message {n}')
+            for n in range(3)
+        ]
+    
+    async def test_returns_messages_after_the_given_id(self):
+        response = await self.async_client.get(
+            poll_url(self.group), {'after': self.messages[0].pk}, headers=bearer(self.member), secure=True
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['content'] for row in response.json()['results']], ['Message 1', 'Message 2'])
+    
+    async def test_requires_a_token(self):
+        response = await self.async_client.get(poll_url(self.group), secure=True)
+        self.assertEqual(response.status_code, 401)
+    
+    async def test_refuses_non_members(self):
+        response = await self.async_client.get(poll_url(self.group), headers=bearer(self.outsider), secure=True)
+        self.assertEqual(response.status_code, 403)
+    
+    async def test_only_get_is_allowed(self):
+        response = await self.async_client.post(poll_url(self.group), headers=bearer(self.member), secure=True)
+        self.assertEqual(response.status_code, 405)
+
+@override_settings(LONG_POLL_INTERVAL=0.1)
+class StudyGroupLongPollTests(TransactionTestCase):
+    """A waiting poll answers as soon as a message arrives; it closes its connection between checks"""
+    
+    def setUp(self):
+        self.member = User.objects.create_user(username='member', email='member@example.com', password='x')
+        self.group = StudyGroup.objects.create(name='Group', description='', creator=self.member)
+        StudyGroupMember.objects.create(study_group=self.group, user=self.member)
+    
+    async def test_waits_for_a_new_message(self):
+        def send():
+            StudyGroupMessage.objects.create(study_group=self.group, sender=self.member, content='Hello')
+            connection.close()
+        
+        async def send_later():
+            await asyncio.sleep(0.3)
+            # On its own thread: the test client runs the sync middleware on the main one
+            await sync_to_async(send, thread_sensitive=False)()
+        
+        poll = self.async_client.get(poll_url(self.group), {'wait': 5}, headers=bearer(self.member), secure=True)
+        response, _ = await asyncio.gather(poll, send_later())
+        self.assertEqual([row['content'] for row in response.json()['results']], ['Hello'])
+    
+    async def test_empty_after_the_wait(self):
+        response = await self.async_client.get(
+            poll_url(self.group), {'wait': 1}, headers=bearer(self.member), secure=True
+        )
+        self.assertEqual(response.json()['results'], [])
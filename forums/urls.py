@@ -3,7 +3,8 @@ from rest_framework.routers import DefaultRouter
 from rest_framework_nested import routers
 from .views import (
     ForumCategoryViewSet, ForumTopicViewSet, ForumPostViewSet,
-    StudyGroupViewSet, StudyGroupMemberViewSet, StudyGroupMessageViewSet
+    StudyGroupViewSet, StudyGroupMemberViewSet, StudyGroupMessageViewSet,
+    StudyGroupJoinRequestViewSet, poll_study_group_messages
 )
 
 router = DefaultRouter()
@@ -19,8 +20,11 @@ topics_router.register(r'posts', ForumPostViewSet, basename='forum-post')
 groups_router = routers.NestedSimpleRouter(router, r'groups', lookup='study_group')
 groups_router.register(r'members', StudyGroupMemberViewSet, basename='study-group-member')
 groups_router.register(r'messages', StudyGroupMessageViewSet, basename='study-group-message')
+groups_router.register(r'join-requests', StudyGroupJoinRequestViewSet, basename='study-group-join-request')
 
 urlpatterns = [
+    # Async long-poll; listed first so the nested router doesn't read 'poll' as a message id
+    path('groups/<int:study_group_pk>/messages/poll/', poll_study_group_messages, name='study-group-message-poll'),
     path('', include(router.urls)),
     path('', include(topics_router.urls)),
     path('', include(groups_router.urls)),
@@ -1,18 +1,32 @@
-from rest_framework import viewsets, permissions, status, filters
+from rest_framework import viewsets, mixins, permissions, serializers, status, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError as DRFValidationError
 from rest_framework.response import Response
 from django.utils import timezone
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.http import JsonResponse
 from .models import (
     ForumCategory, ForumTopic, ForumPost, PostLike,
-    StudyGroup, StudyGroupMember, StudyGroupMessage
+    StudyGroup, StudyGroupMember, StudyGroupMessage, StudyGroupJoinRequest
 )
 from .serializers import (
     ForumCategorySerializer, ForumTopicSerializer, ForumPostSerializer,
-    StudyGroupSerializer, StudyGroupMemberSerializer, StudyGroupMessageSerializer
+    StudyGroupSerializer, StudyGroupMemberSerializer, StudyGroupMessageSerializer,
+    StudyGroupJoinRequestSerializer
+)
+from .ranking import HOT_WEIGHTS, bump
+from .reading import with_read_state, mark_read, mark_topic_read
+from .groups import (
+    GroupError, add_member, remove_member, is_manager, request_to_join,
+    decide_join_request, cancel_join_request
 )
 from users.permissions import IsOwnerOrReadOnly
+from users.tasks import award_xp
+from nyure_education.db_router import ReplicaReadMixin
+from nyure_education.async_api import POLL_LIMIT, async_get_view, poll_params, long_poll, serialize
 
-class ForumCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class ForumCategoryViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     queryset = ForumCategory.objects.all()
     serializer_class = ForumCategorySerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -20,7 +34,7 @@ class ForumCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'topic_count', 'post_count']
 
-class ForumTopicViewSet(viewsets.ModelViewSet):
+class ForumTopicViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     serializer_class = ForumTopicSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -28,7 +42,8 @@ class ForumTopicViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'updated_at', 'last_activity', 'view_count', 'reply_count']
     
     def get_queryset(self):
-        queryset = ForumTopic.objects.all()
+        # Attach the user's read watermark for unread counts
+        queryset = with_read_state(ForumTopic.objects.all(), self.request.user)
         
         # Filter by category
         category_id = self.request.query_params.get('category')
@@ -45,6 +60,10 @@ class ForumTopicViewSet(viewsets.ModelViewSet):
         if skills:
             queryset = queryset.filter(skills__id__in=skills).distinct()
         
+        # Hot ranking: pinned topics first, then by decayed activity score (matches forums_topic_hot_idx)
+        if self.request.query_params.get('ordering') == 'hot':
+            queryset = queryset.order_by('-is_pinned', '-hot_score', '-id')
+        
         return queryset
     
     def perform_create(self, serializer):
@@ -55,31 +74,61 @@ class ForumTopicViewSet(viewsets.ModelViewSet):
         except ForumCategory.DoesNotExist:
             raise serializers.ValidationError({'category_id': 'Category not found.'})
         
-        # Create topic
-        topic = serializer.save(author=self.request.user, category=category)
-        
-        # Update category statistics
-        category.topic_count += 1
-        category.post_count += 1
-        category.save()
+        # Create topic; category counters follow through stats.signals
+        serializer.save(author=self.request.user, category=category, hot_score=HOT_WEIGHTS['create'])
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         
-        # Increment view count
+        # Increment view count and hot score in SQL rather than rewriting the whole row
+        bump(instance.pk, 'view', view_count=F('view_count') + 1)
         instance.view_count += 1
-        instance.save()
         
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
+    
+    @action(detail=True, methods=['post'])
+    def mark_read(self, request, pk=None):
+        topic = self.get_object()
+        post_id = request.data.get('post_id')
+        
+        # Read up to a given post, or the whole topic
+        if post_id:
+            if not ForumPost.objects.filter(pk=post_id, topic=topic).exists():
+                return Response({'detail': 'Post not found in this topic.'}, status=status.HTTP_400_BAD_REQUEST)
+            mark_read(request.user, [post_id])
+        else:
+            mark_topic_read(request.user, topic)
+        
+        return Response({'detail': 'Topic marked as read.'})
+    
+    @action(detail=False, methods=['post'])
+    def mark_read_bulk(self, request):
+        # Body: {"post_ids": [...]}, the furthest post read in each topic
+        post_ids = request.data.get('post_ids')
+        if not isinstance(post_ids, list) or not all(isinstance(post_id, int) for post_id in post_ids):
+            return Response({'detail': 'post_ids must be a list of post IDs.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        updated = mark_read(request.user, post_ids[:500])
+        return Response({'detail': f'{updated} topics marked as read.'})
 
 class ForumPostViewSet(viewsets.ModelViewSet):
     serializer_class = ForumPostSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
+    throttle_scopes = {'like': 'like'}
     
     def get_queryset(self):
         topic_id = self.kwargs.get('topic_pk')
-        return ForumPost.objects.filter(topic_id=topic_id).order_by('created_at')
+        queryset = ForumPost.objects.filter(topic_id=topic_id).order_by('position', 'created_at')
+        
+        # Only posts after a given post, e.g. the topic's last_read_post_id to jump to the first unread
+        after = self.request.query_params.get('after')
+        if after and after.isdigit():
+            position = ForumPost.objects.filter(pk=after, topic_id=topic_id).values_list('position', flat=True).first()
+            if position is not None:
+                queryset = queryset.filter(position__gt=position)
+        
+        return queryset
     
     def perform_create(self, serializer):
         topic_id = self.kwargs.get('topic_pk')
@@ -93,18 +142,18 @@ class ForumPostViewSet(viewsets.ModelViewSet):
         if topic.is_locked:
             raise serializers.ValidationError({'topic': 'This topic is locked.'})
         
-        # Create post
-        post = serializer.save(author=self.request.user, topic=topic)
-        
-        # Update topic statistics
-        topic.reply_count += 1
-        topic.last_activity = timezone.now()
-        topic.save()
+        with transaction.atomic():
+            # Lock the topic so each reply gets the next position
+            reply_count = ForumTopic.objects.select_for_update().values_list('reply_count', flat=True).get(pk=topic.pk)
+            
+            # Create post
+            post = serializer.save(author=self.request.user, topic=topic, position=reply_count + 1)
+            
+            # Update topic statistics
+            bump(topic.pk, 'reply', reply_count=F('reply_count') + 1, last_activity=timezone.now())
         
-        # Update category statistics
-        category = topic.category
-        category.post_count += 1
-        category.save()
+        # The author has read their own reply
+        mark_read(self.request.user, [post.id])
     
     @action(detail=True, methods=['post'])
     def like(self, request, topic_pk=None, pk=None):
@@ -119,8 +168,8 @@ class ForumPostViewSet(viewsets.ModelViewSet):
         PostLike.objects.create(post=post, user=user)
         
         # Update post statistics
-        post.like_count += 1
-        post.save()
+        ForumPost.objects.filter(pk=post.pk).update(like_count=F('like_count') + 1)
+        bump(post.topic_id, 'like')
         
         return Response({'detail': 'Post liked successfully.'})
     
@@ -135,8 +184,7 @@ class ForumPostViewSet(viewsets.ModelViewSet):
             like.delete()
             
             # Update post statistics
-            post.like_count = max(0, post.like_count - 1)
-            post.save()
+            ForumPost.objects.filter(pk=post.pk, like_count__gt=0).update(like_count=F('like_count') - 1)
             
             return Response({'detail': 'Post unliked successfully.'})
         except PostLike.DoesNotExist:
@@ -155,16 +203,8 @@ class ForumPostViewSet(viewsets.ModelViewSet):
         post.is_solution = True
         post.save()
         
-        # Award XP to post author
-        post_author = post.author
-        post_author.xp_points += 50  # Award XP for helpful answer
-        
-        # Level up if needed (simple level calculation)
-        new_level = max(1, int(post_author.xp_points / 1000) + 1)
-        if new_level > post_author.level:
-            post_author.level = new_level
-        
-        post_author.save()
+        # Award XP to post author for a helpful answer
+        award_xp.delay(post.author_id, 50, f'solution:{post.id}')
         
         return Response({'detail': 'Post marked as solution.'})
 
@@ -178,74 +218,116 @@ class StudyGroupViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         user = self.request.user
         
-        # Get public groups and groups the user is a member of
-        public_groups = StudyGroup.objects.filter(is_private=False)
-        user_groups = StudyGroup.objects.filter(members__user=user)
+        # Public groups plus groups the user is a member of. EXISTS probes the
+        # (user, study_group) index per row, so no join fan-out and no DISTINCT.
+        is_member = StudyGroupMember.objects.filter(study_group=OuterRef('pk'), user=user)
+        queryset = StudyGroup.objects.filter(Q(is_private=False) | Exists(is_member))
         
-        return (public_groups | user_groups).distinct()
+        return self.with_related(queryset)
+    
+    def with_related(self, queryset):
+        # Load nested creator, path and skills up front so a page costs a fixed number of queries
+        return queryset.select_related('creator', 'learning_path__creator')\
+            .prefetch_related('skills', 'learning_path__steps__skills', 'learning_path__skills')
+    
+    @action(detail=False, methods=['get'])
+    def my_groups(self, request):
+        # One membership row per group, so the join needs no DISTINCT
+        queryset = self.with_related(StudyGroup.objects.filter(members__user=request.user))
+        queryset = self.filter_queryset(queryset)
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
     
     def perform_create(self, serializer):
-        group = serializer.save(creator=self.request.user)
-        
-        # Add creator as admin member
-        StudyGroupMember.objects.create(
-            study_group=group,
-            user=self.request.user,
-            role='admin'
-        )
+        with transaction.atomic():
+            group = serializer.save(creator=self.request.user, member_count=1)
+            
+            # Add creator as admin member
+            StudyGroupMember.objects.create(
+                study_group=group,
+                user=self.request.user,
+                role='admin'
+            )
     
     @action(detail=True, methods=['post'])
     def join(self, request, pk=None):
         study_group = self.get_object()
         user = request.user
         
-        # Check if already a member
-        if StudyGroupMember.objects.filter(study_group=study_group, user=user).exists():
-            return Response({'detail': 'Already a member of this group.'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Check if group is full
-        if study_group.members.count() >= study_group.max_members:
-            return Response({'detail': 'Group is full.'}, status=status.HTTP_400_BAD_REQUEST)
-        
         # Check if group is private
         if study_group.is_private:
             return Response({'detail': 'Cannot join private group directly. Request to join instead.'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Join group
-        member = StudyGroupMember.objects.create(
-            study_group=study_group,
-            user=user,
-            role='member'
-        )
+        # Join group, claiming a seat atomically
+        try:
+            member = add_member(study_group.pk, user)
+        except GroupError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
         
         serializer = StudyGroupMemberSerializer(member)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
+    @action(detail=True, methods=['post'])
+    def request_join(self, request, pk=None):
+        study_group = self.get_object()
+        
+        if not study_group.is_private:
+            return Response({'detail': 'This group is public. Join it directly.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            join_request = request_to_join(study_group, request.user, request.data.get('message', ''))
+        except GroupError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
+        
+        serializer = StudyGroupJoinRequestSerializer(join_request)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    
     @action(detail=True, methods=['post'])
     def leave(self, request, pk=None):
         study_group = self.get_object()
         user = request.user
         
-        # Check if a member
-        try:
-            member = StudyGroupMember.objects.get(study_group=study_group, user=user)
-            
-            # Check if the user is the creator/admin
-            if member.role == 'admin' and study_group.creator == user:
-                return Response({'detail': 'Group creator cannot leave. Transfer ownership or delete the group.'}, status=status.HTTP_400_BAD_REQUEST)
-            
-            member.delete()
-            return Response({'detail': 'Left the group successfully.'})
-        except StudyGroupMember.DoesNotExist:
+        # Check if the user is the creator
+        if study_group.creator_id == user.id:
+            return Response({'detail': 'Group creator cannot leave. Transfer ownership or delete the group.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Leave group, freeing the seat
+        if not remove_member(study_group.pk, user):
             return Response({'detail': 'Not a member of this group.'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'detail': 'Left the group successfully.'})
 
-class StudyGroupMemberViewSet(viewsets.ModelViewSet):
+class StudyGroupMemberViewSet(mixins.ListModelMixin,
+                              mixins.RetrieveModelMixin,
+                              mixins.DestroyModelMixin,
+                              viewsets.GenericViewSet):
+    """
+    Members of a study group. Members are added only through the group's join,
+    request_join and join request approval, which enforce capacity.
+    """
     serializer_class = StudyGroupMemberSerializer
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
         study_group_id = self.kwargs.get('study_group_pk')
-        return StudyGroupMember.objects.filter(study_group_id=study_group_id)
+        return StudyGroupMember.objects.filter(study_group_id=study_group_id).select_related('study_group')
+    
+    def perform_destroy(self, instance):
+        user = self.request.user
+        if instance.user_id != user.id and not StudyGroupMember.objects.filter(
+            study_group_id=instance.study_group_id, user=user, role='admin'
+        ).exists():
+            raise PermissionDenied('Only the member or a group admin can remove a member.')
+        if instance.user_id == instance.study_group.creator_id:
+            raise DRFValidationError({'detail': 'The group creator cannot be removed.'})
+        
+        # Go through remove_member so the group's member_count stays right
+        remove_member(instance.study_group_id, instance.user)
     
     @action(detail=True, methods=['post'])
     def change_role(self, request, study_group_pk=None, pk=None):
@@ -276,9 +358,54 @@ class StudyGroupMemberViewSet(viewsets.ModelViewSet):
         serializer = StudyGroupMemberSerializer(member)
         return Response(serializer.data)
 
+class StudyGroupJoinRequestViewSet(viewsets.ReadOnlyModelViewSet):
+    """Pending join requests for a private group, oldest first"""
+    serializer_class = StudyGroupJoinRequestSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        study_group_id = self.kwargs.get('study_group_pk')
+        user = self.request.user
+        queryset = StudyGroupJoinRequest.objects.filter(study_group_id=study_group_id).select_related('user')
+        
+        # Managers see the queue, everyone else only their own requests
+        if not is_manager(study_group_id, user):
+            queryset = queryset.filter(user=user)
+        
+        status_value = self.request.query_params.get('status', 'pending')
+        return queryset.filter(status=status_value).order_by('created_at')
+    
+    @action(detail=True, methods=['post'])
+    def approve(self, request, study_group_pk=None, pk=None):
+        return self.decide(request, study_group_pk, pk, approve=True)
+    
+    @action(detail=True, methods=['post'])
+    def reject(self, request, study_group_pk=None, pk=None):
+        return self.decide(request, study_group_pk, pk, approve=False)
+    
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, study_group_pk=None, pk=None):
+        try:
+            join_request = cancel_join_request(pk, request.user)
+        except GroupError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
+        
+        serializer = StudyGroupJoinRequestSerializer(join_request)
+        return Response(serializer.data)
+    
+    def decide(self, request, study_group_pk, pk, approve):
+        try:
+            join_request = decide_join_request(pk, study_group_pk, request.user, approve)
+        except GroupError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
+        
+        serializer = StudyGroupJoinRequestSerializer(join_request)
+        return Response(serializer.data)
+
 class StudyGroupMessageViewSet(viewsets.ModelViewSet):
     serializer_class = StudyGroupMessageSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scopes = {'create': 'message'}
     
     def get_queryset(self):
         study_group_id = self.kwargs.get('study_group_pk')
@@ -288,7 +415,7 @@ class StudyGroupMessageViewSet(viewsets.ModelViewSet):
         if not StudyGroupMember.objects.filter(study_group_id=study_group_id, user=user).exists():
             return StudyGroupMessage.objects.none()
         
-        return StudyGroupMessage.objects.filter(study_group_id=study_group_id).order_by('created_at')
+        return StudyGroupMessage.objects.filter(study_group_id=study_group_id).order_by('id')
     
     def perform_create(self, serializer):
         study_group_id = self.kwargs.get('study_group_pk')
@@ -299,3 +426,19 @@ class StudyGroupMessageViewSet(viewsets.ModelViewSet):
             raise serializers.ValidationError({'detail': 'You are not a member of this group.'})
         
         serializer.save(study_group_id=study_group_id, sender=user)
+
+@async_get_view
+async def poll_study_group_messages(request, study_group_pk):
+    """
+    Async message feed: messages after ?after=<id>, oldest first. With ?wait=<seconds>
+    the request is held open until one arrives, without tying up a worker under ASGI.
+    """
+    is_member = await StudyGroupMember.objects.filter(study_group_id=study_group_pk, user_id=request.user.pk).aexists()
+    if not is_member:
+        return JsonResponse({'detail': 'You are not a member of this group.'}, status=403)
+    
+    after, wait = poll_params(request)
+    messages = StudyGroupMessage.objects.filter(study_group_id=study_group_pk, id__gt=after)\
+        .select_related('sender').order_by('id')[:POLL_LIMIT]
+    rows = await long_poll(messages, wait)
+    return JsonResponse({'results': await serialize(StudyGroupMessageSerializer, rows)})
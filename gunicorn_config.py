@@ -4,9 +4,17 @@ import os
 # Bind to the port provided by Render
 bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
 
+# Serving mode: "wsgi" (sync workers) or "asgi" (uvicorn workers, so async views such as
+# the message long-polls wait without holding a whole worker). See README "Serving modes".
+server_mode = os.environ.get('SERVER_MODE', 'wsgi')
+if server_mode == 'asgi':
+    wsgi_app = "nyure_education.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+else:
+    wsgi_app = "nyure_education.wsgi:application"
+
 # Worker configuration - adjust based on instance size
 workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
-# worker_class = "gevent" # Uncomment and add gevent to requirements.txt if needed
 worker_connections = 1000
 timeout = 120
 keepalive = 5
@@ -26,6 +34,17 @@ def on_starting(server):
 def on_exit(server):
     server.log.info("Stopping Course Compass server")
 
+def post_worker_init(worker):
+    # Build the skill typeahead index before the first request; it loads lazily if this fails
+    from django.db import connections
+    from learning_paths.typeahead import skill_index
+    try:
+        skill_index.refresh()
+    except Exception as exc:
+        worker.log.warning("Skill typeahead index not preloaded: %s", exc)
+    finally:
+        connections.close_all()
+
 # Max requests per worker before restart
 max_requests = 1000
 max_requests_jitter = 50
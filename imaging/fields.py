@@ -0,0 +1,28 @@
+from django.core.files.storage import default_storage
+from rest_framework import serializers
+from .pipeline import variants_field
+
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only field exposing an image's resized variants as srcset strings per format,
+    e.g. {"webp": "https://.../a.webp 64w, https://.../b.webp 128w", "jpeg": "..."}.
+    Returns None until variants have been generated for the current image.
+    """
+    
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, instance):
+        file = getattr(instance, self.image_field)
+        stored = getattr(instance, variants_field(self.image_field)) or {}
+        if not file or stored.get('source') != file.name:
+            return None
+        
+        srcsets = {}
+        for variant in sorted(stored.get('variants', []), key=lambda v: v['width']):
+            url = default_storage.url(variant['name'])
+            srcsets.setdefault(variant['format'], []).append(f"{url} {variant['width']}w")
+        return {fmt: ', '.join(entries) for fmt, entries in srcsets.items()}
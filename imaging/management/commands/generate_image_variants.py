@@ -0,0 +1,24 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from imaging.pipeline import IMAGE_FIELDS, process_image, variants_field
+
+class Command(BaseCommand):
+    help = 'Build missing or stale image variants for every registered image field'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Rebuild variants even when they look current')
+    
+    def handle(self, *args, **options):
+        for model_label, field_name, widths in IMAGE_FIELDS:
+            model = apps.get_model(model_label)
+            rows = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})\
+                .values_list('pk', field_name, variants_field(field_name))
+            
+            built = 0
+            for pk, name, variants in rows.iterator(chunk_size=500):
+                if not options['force'] and (variants or {}).get('source') == name:
+                    continue
+                process_image(model_label, pk, field_name, widths)
+                built += 1
+            
+            self.stdout.write(self.style.SUCCESS(f'{model_label}.{field_name}: built variants for {built} images'))
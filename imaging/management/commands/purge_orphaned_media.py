@@ -0,0 +1,22 @@
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from nyure_education.storage import orphaned_media
+
+class Command(BaseCommand):
+    help = 'Delete stored media files that no row refers to any more'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24, help='Only files older than this are removed')
+        parser.add_argument('--dry-run', action='store_true', help='List the files without deleting them')
+    
+    def handle(self, *args, **options):
+        count = 0
+        for name in orphaned_media(options['hours']):
+            if options['dry_run']:
+                self.stdout.write(name)
+            else:
+                default_storage.purge(name)
+            count += 1
+        
+        verb = 'Found' if options['dry_run'] else 'Removed'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {count} orphaned media files.'))
@@ -0,0 +1,92 @@
+import hashlib
+import io
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# Widths generated for each kind of image
+AVATAR_WIDTHS = (64, 128, 256)
+ICON_WIDTHS = (32, 64, 128)
+COVER_WIDTHS = (320, 640, 1024)
+
+# (model label, image field, widths) for every image field that gets variants
+IMAGE_FIELDS = [
+    ('users.User', 'avatar', AVATAR_WIDTHS),
+    ('users.Badge', 'icon', ICON_WIDTHS),
+    ('learning_paths.LearningPath', 'image', COVER_WIDTHS),
+    ('resources.Resource', 'thumbnail', COVER_WIDTHS),
+    ('jobs.Company', 'logo', ICON_WIDTHS),
+    ('forums.ForumCategory', 'icon', ICON_WIDTHS),
+    ('progress.Achievement', 'icon', ICON_WIDTHS),
+]
+
+# Format -> (file extension, Pillow save options)
+FORMATS = {
+    'webp': ('webp', {'format': 'WEBP', 'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', {'format': 'JPEG', 'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+def variants_field(field_name):
+    return f'{field_name}_variants'
+
+def encode(image, fmt, width):
+    """Resize a copy of the image to `width` and encode it, returning the bytes"""
+    extension, options = FORMATS[fmt]
+    resized = image.copy()
+    resized.thumbnail((width, width * 4), Image.Resampling.LANCZOS)
+    
+    # JPEG has no alpha channel, so flatten onto white
+    if fmt == 'jpeg' and resized.mode in ('RGBA', 'LA', 'P'):
+        rgba = resized.convert('RGBA')
+        resized = Image.new('RGB', rgba.size, (255, 255, 255))
+        resized.paste(rgba, mask=rgba.getchannel('A'))
+    elif resized.mode not in ('RGB', 'RGBA'):
+        resized = resized.convert('RGB')
+    
+    buffer = io.BytesIO()
+    resized.save(buffer, **options)
+    return buffer.getvalue(), resized.width
+
+def build_variants(file, widths, prefix):
+    """Generate sized WebP/JPEG variants and store them under content-hashed names"""
+    file.open('rb')
+    try:
+        image = ImageOps.exif_transpose(Image.open(file))
+        image.load()
+    finally:
+        file.close()
+    
+    # Never upscale: widths above the original collapse into the original width
+    targets = sorted({min(width, image.width) for width in widths})
+    
+    variants = []
+    for fmt, (extension, _) in FORMATS.items():
+        for width in targets:
+            data, actual_width = encode(image, fmt, width)
+            digest = hashlib.sha256(data).hexdigest()
+            name = f'{prefix}/variants/{digest[:2]}/{digest}.{extension}'
+            if not default_storage.exists(name):
+                name = default_storage.save(name, ContentFile(data))
+            variants.append({'format': fmt, 'width': actual_width, 'name': name})
+    return variants
+
+def process_image(model_label, pk, field_name, widths):
+    """Build variants for one object's image field and record them if the image is unchanged"""
+    model = apps.get_model(model_label)
+    try:
+        instance = model.objects.only('pk', field_name).get(pk=pk)
+    except model.DoesNotExist:
+        return
+    
+    file = getattr(instance, field_name)
+    if not file:
+        return
+    
+    prefix = model._meta.get_field(field_name).upload_to.rstrip('/') or model._meta.model_name
+    variants = build_variants(file, widths, prefix)
+    
+    # The filter guards against the image being replaced while we worked
+    model.objects.filter(pk=pk, **{field_name: file.name}).update(**{
+        variants_field(field_name): {'source': file.name, 'variants': variants}
+    })
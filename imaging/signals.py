@@ -0,0 +1,26 @@
+from functools import partial
+from django.apps import apps
+from django.db.models.signals import post_save
+from .pipeline import IMAGE_FIELDS, variants_field
+from .tasks import build_image_variants
+
+def image_saved(sender, instance, model_label, field_name, widths, **kwargs):
+    """Queue new variants whenever the stored image differs from the one they were built from"""
+    file = getattr(instance, field_name)
+    variants = getattr(instance, variants_field(field_name)) or {}
+    
+    if not file:
+        if variants:
+            sender.objects.filter(pk=instance.pk).update(**{variants_field(field_name): {}})
+        return
+    
+    if variants.get('source') != file.name:
+        build_image_variants.delay(model_label, instance.pk, field_name, list(widths))
+
+for model_label, field_name, widths in IMAGE_FIELDS:
+    post_save.connect(
+        partial(image_saved, model_label=model_label, field_name=field_name, widths=widths),
+        sender=apps.get_model(model_label),
+        weak=False,
+        dispatch_uid=f'imaging:{model_label}.{field_name}'
+    )
@@ -0,0 +1,15 @@
+from datetime import timedelta
+from django.core.files.storage import default_storage
+from tasks.queue import task, periodic_task
+from nyure_education.storage import orphaned_media
+from .pipeline import process_image
+
+@task(max_attempts=3, retry_delay=60)
+def build_image_variants(model_label, pk, field_name, widths):
+    process_image(model_label, pk, field_name, widths)
+
+@periodic_task(every=timedelta(hours=6))
+def purge_orphaned_media():
+    """Delete stored files, such as replaced avatars and deleted resumes, that no row refers to"""
+    for name in orphaned_media():
+        default_storage.purge(name)
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+class JobsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'jobs'
+    
+    def ready(self):
+        from . import signals
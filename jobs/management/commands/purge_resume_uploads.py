@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from jobs.uploads import purge_stale_uploads
+
+class Command(BaseCommand):
+    help = 'Delete unfinished resume uploads and their partial files'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24, help='Age after which unfinished uploads are removed')
+    
+    def handle(self, *args, **options):
+        count = purge_stale_uploads(options['hours'])
+        self.stdout.write(self.style.SUCCESS(f'Removed {count} stale resume uploads.'))
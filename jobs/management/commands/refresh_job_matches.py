@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from jobs.matching import rebuild_all_scores, refresh_user_scores, refresh_listing_scores
+
+class Command(BaseCommand):
+    help = 'Rebuild precomputed job match scores'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help='Only refresh scores for this user ID')
+        parser.add_argument('--listing', type=int, help='Only refresh scores for this job listing ID')
+    
+    def handle(self, *args, **options):
+        if options['user']:
+            count = refresh_user_scores(options['user'])
+        elif options['listing']:
+            count = refresh_listing_scores(options['listing'])
+        else:
+            count = rebuild_all_scores()
+        
+        self.stdout.write(self.style.SUCCESS(f'Stored {count} job match scores.'))
@@ -0,0 +1,121 @@
+from collections import defaultdict
+from django.db import transaction
+from django.utils import timezone
+from progress.models import UserSkill
+from stats.tasks import refresh_skills
+from .models import JobListing, JobMatchScore
+
+# How much a user's proficiency in a required skill counts towards the match
+PROFICIENCY_WEIGHTS = {
+    'beginner': 0.25,
+    'intermediate': 0.5,
+    'advanced': 0.8,
+    'expert': 1.0,
+}
+
+BATCH_SIZE = 1000
+
+def active_listings():
+    """Listings that are open for applications"""
+    return JobListing.objects.filter(is_active=True, expires_at__gte=timezone.now().date())
+
+def expire_listings():
+    """Deactivate listings past their expiry date and drop their match scores; returns how many"""
+    with transaction.atomic():
+        expired = list(JobListing.objects.filter(
+            is_active=True,
+            expires_at__lt=timezone.now().date()
+        ).values_list('id', flat=True))
+        JobListing.objects.filter(id__in=expired).update(is_active=False, updated_at=timezone.now())
+        JobMatchScore.objects.filter(job_listing_id__in=expired).delete()
+        # update() skips the save signals, so the job counts of their skills are refreshed here
+        skill_ids = list(JobListing.skills.through.objects.filter(joblisting_id__in=expired)
+                         .values_list('skill_id', flat=True).distinct())
+    if skill_ids:
+        refresh_skills.delay(skill_ids)
+    return len(expired)
+
+def listing_skill_map(listings=None):
+    """Map listing id -> set of required skill ids, read in a single pass over the M2M table"""
+    if listings is None:
+        listings = active_listings()
+    
+    skill_map = defaultdict(set)
+    rows = JobListing.skills.through.objects.filter(joblisting__in=listings)
+    for listing_id, skill_id in rows.values_list('joblisting_id', 'skill_id').iterator(chunk_size=5000):
+        skill_map[listing_id].add(skill_id)
+    return skill_map
+
+def user_skill_weights(user_id):
+    """Map skill id -> proficiency weight for a single user"""
+    rows = UserSkill.objects.filter(user_id=user_id).values_list('skill_id', 'proficiency')
+    return {skill_id: PROFICIENCY_WEIGHTS.get(proficiency, 0) for skill_id, proficiency in rows}
+
+def score_listing(required_skills, weights):
+    """Return (score, matched_skills) for a listing's required skills against a user's weights"""
+    if not required_skills:
+        return 0, 0
+    
+    matched = required_skills & weights.keys()
+    total = sum(weights[skill_id] for skill_id in matched)
+    return round(100 * total / len(required_skills)), len(matched)
+
+def score_user(user_id, weights, skill_map):
+    """Build score rows for every listing that shares at least one skill with the user"""
+    rows = []
+    for listing_id, required_skills in skill_map.items():
+        score, matched = score_listing(required_skills, weights)
+        if matched:
+            rows.append(JobMatchScore(
+                user_id=user_id,
+                job_listing_id=listing_id,
+                score=score,
+                matched_skills=matched
+            ))
+    return rows
+
+def refresh_user_scores(user_id):
+    """Recompute all match scores for one user, e.g. after their skills change"""
+    weights = user_skill_weights(user_id)
+    rows = []
+    if weights:
+        # Only listings requiring at least one of the user's skills can score
+        shared = JobListing.skills.through.objects.filter(skill_id__in=weights).values('joblisting_id')
+        rows = score_user(user_id, weights, listing_skill_map(active_listings().filter(id__in=shared)))
+    
+    with transaction.atomic():
+        JobMatchScore.objects.filter(user_id=user_id).delete()
+        JobMatchScore.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return len(rows)
+
+def refresh_listing_scores(listing_id):
+    """Recompute match scores for one listing, e.g. after its skills or status change"""
+    required_skills = listing_skill_map(active_listings().filter(id=listing_id)).get(listing_id, set())
+    
+    # Collect the proficiencies of every user holding at least one required skill
+    weights_by_user = defaultdict(dict)
+    user_skills = UserSkill.objects.filter(skill_id__in=required_skills)\
+        .values_list('user_id', 'skill_id', 'proficiency')
+    for user_id, skill_id, proficiency in user_skills.iterator(chunk_size=5000):
+        weights_by_user[user_id][skill_id] = PROFICIENCY_WEIGHTS.get(proficiency, 0)
+    
+    rows = []
+    for user_id, weights in weights_by_user.items():
+        rows.extend(score_user(user_id, weights, {listing_id: required_skills}))
+    
+    with transaction.atomic():
+        JobMatchScore.objects.filter(job_listing_id=listing_id).delete()
+        JobMatchScore.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return len(rows)
+
+def rebuild_all_scores():
+    """
+    Rebuild the whole score table one listing at a time. Each listing commits on its own,
+    so a rebuild never holds one long transaction over the entire table.
+    """
+    JobMatchScore.objects.exclude(job_listing__in=active_listings()).delete()
+    
+    created = 0
+    for listing_id in list(active_listings().values_list('id', flat=True)):
+        created += refresh_listing_scores(listing_id)
+    return created
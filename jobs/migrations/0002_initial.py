@@ -0,0 +1,93 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.conf import settings
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+        ('learning_paths', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savedjob',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='resumeupload',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_uploads', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='jobmatchscore',
+            name='job_listing',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_scores', to='jobs.joblisting'),
+        ),
+        migrations.AddField(
+            model_name='jobmatchscore',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_match_scores', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='company',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_listings', to='jobs.company'),
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='skills',
+            field=models.ManyToManyField(related_name='job_listings', to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='job_listing',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='jobs.joblisting'),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_applications', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='company',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='jobs_company_name_trgm_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='savedjob',
+            unique_together={('user', 'job_listing')},
+        ),
+        migrations.AddIndex(
+            model_name='resumeupload',
+            index=models.Index(fields=['status', 'updated_at'], name='jobs_resume_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobmatchscore',
+            index=models.Index(fields=['user', '-score'], name='jobs_match_user_score_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobmatchscore',
+            unique_together={('user', 'job_listing')},
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['expires_at'], name='jobs_listing_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-posted_at'], name='jobs_listing_recent_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobapplication',
+            unique_together={('user', 'job_listing')},
+        ),
+    ]
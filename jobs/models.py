@@ -1,4 +1,7 @@
+import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from users.models import User
 from learning_paths.models import Skill
 
@@ -8,6 +11,7 @@ class Company(models.Model):
     description = models.TextField()
     website = models.URLField()
     logo = models.ImageField(upload_to='companies/', blank=True, null=True)
+    logo_variants = models.JSONField(default=dict, blank=True)
     
     # Company location
     location = models.CharField(max_length=100)
@@ -28,6 +32,13 @@ class Company(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            # Trigram index for company search and typeahead. It indexes UPPER(name), which is
+            # what icontains and istartswith compare on PostgreSQL; an index on name itself goes unused
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='jobs_company_name_trgm_idx'),
+        ]
+    
     def __str__(self):
         return self.name
 
@@ -81,6 +92,13 @@ class JobListing(models.Model):
     expires_at = models.DateField()
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            # Open listings only; expire_job_listings keeps expired rows out of them
+            models.Index(fields=['expires_at'], condition=models.Q(is_active=True), name='jobs_listing_open_idx'),
+            models.Index(fields=['-posted_at'], condition=models.Q(is_active=True), name='jobs_listing_recent_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.title} at {self.company.name}"
 
@@ -112,6 +130,39 @@ class JobApplication(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.job_listing.title}"
 
+class ResumeUpload(models.Model):
+    """Resume uploaded in chunks ahead of a job application"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='resume_uploads')
+    
+    # Declared by the client when the upload starts
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveIntegerField()
+    
+    # Upload state
+    received_bytes = models.PositiveIntegerField(default=0)
+    parts = models.JSONField(default=list, blank=True)  # Accepted chunk names in scratch storage, in order
+    status = models.CharField(max_length=20, choices=[
+        ('pending', 'Pending'),
+        ('complete', 'Complete'),
+        ('failed', 'Failed'),
+        ('attached', 'Attached'),
+    ], default='pending')
+    error = models.CharField(max_length=255, blank=True)
+    file = models.FileField(upload_to='resumes/', blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'updated_at'], name='jobs_resume_status_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.filename} ({self.status})"
+
 class SavedJob(models.Model):
     """Jobs saved by users"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_jobs')
@@ -124,3 +175,23 @@ class SavedJob(models.Model):
     
     def __str__(self):
         return f"{self.user.username} - {self.job_listing.title}"
+
+class JobMatchScore(models.Model):
+    """Precomputed skill match between a user and an active job listing"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='job_match_scores')
+    job_listing = models.ForeignKey(JobListing, on_delete=models.CASCADE, related_name='match_scores')
+    
+    # Match details
+    score = models.PositiveSmallIntegerField(default=0)  # 0-100, weighted by proficiency
+    matched_skills = models.PositiveSmallIntegerField(default=0)
+    
+    computed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ('user', 'job_listing')
+        indexes = [
+            models.Index(fields=['user', '-score'], name='jobs_match_user_score_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.job_listing.title} ({self.score})"
@@ -1,9 +1,13 @@
+from django.urls import reverse
 from rest_framework import serializers
-from .models import Company, JobListing, JobApplication, SavedJob
+from .models import Company, JobListing, JobApplication, SavedJob, ResumeUpload
 from users.serializers import UserProfileSerializer
 from learning_paths.serializers import SkillSerializer
+from imaging.fields import ImageVariantsField
 
 class CompanySerializer(serializers.ModelSerializer):
+    logo_variants = ImageVariantsField('logo')
+    
     class Meta:
         model = Company
         fields = '__all__'
@@ -13,6 +17,7 @@ class JobListingSerializer(serializers.ModelSerializer):
     skills = SkillSerializer(many=True, read_only=True)
     is_saved = serializers.SerializerMethodField()
     has_applied = serializers.SerializerMethodField()
+    match_score = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = JobListing
@@ -39,6 +44,21 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         model = JobApplication
         fields = '__all__'
         read_only_fields = ('user', 'applied_at', 'updated_at')
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Point at the authorized download instead of the storage URL
+        if instance.resume:
+            path = reverse('job-application-resume', args=[instance.pk])
+            request = self.context.get('request')
+            data['resume'] = request.build_absolute_uri(path) if request else path
+        return data
+
+class ResumeUploadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ResumeUpload
+        fields = ('id', 'filename', 'content_type', 'size', 'received_bytes', 'status', 'error', 'created_at', 'updated_at')
+        read_only_fields = ('received_bytes', 'status', 'error', 'created_at', 'updated_at')
 
 class SavedJobSerializer(serializers.ModelSerializer):
     job_listing = JobListingSerializer(read_only=True)
@@ -0,0 +1,36 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from progress.models import UserSkill
+from .models import JobListing
+from .tasks import refresh_user_match_scores, refresh_listing_match_scores
+
+@receiver([post_save, post_delete], sender=UserSkill)
+def user_skill_changed(sender, instance, **kwargs):
+    """Refresh the user's job match scores when their skills change"""
+    refresh_user_match_scores.delay(instance.user_id)
+
+@receiver(post_save, sender=JobListing)
+def job_listing_saved(sender, instance, **kwargs):
+    """Refresh match scores when a listing is edited, activated or deactivated"""
+    refresh_listing_match_scores.delay(instance.id)
+
+@receiver(m2m_changed, sender=JobListing.skills.through)
+def job_listing_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh match scores when a listing's required skills change"""
+    if action == 'pre_clear' and reverse:
+        # Remember which listings lose this skill, pk_set is empty on clear
+        instance._cleared_listing_ids = list(instance.job_listings.values_list('id', flat=True))
+        return
+    
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    
+    if not reverse:
+        listing_ids = [instance.id]
+    elif action == 'post_clear':
+        listing_ids = getattr(instance, '_cleared_listing_ids', [])
+    else:
+        listing_ids = list(pk_set)
+    
+    for listing_id in listing_ids:
+        refresh_listing_match_scores.delay(listing_id)
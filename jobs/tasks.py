@@ -0,0 +1,21 @@
+from datetime import timedelta
+from tasks.queue import task, periodic_task
+from .matching import expire_listings, refresh_user_scores, refresh_listing_scores
+from .uploads import purge_stale_uploads
+
+@task
+def refresh_user_match_scores(user_id):
+    refresh_user_scores(user_id)
+
+@task
+def refresh_listing_match_scores(listing_id):
+    refresh_listing_scores(listing_id)
+
+@periodic_task(every=timedelta(hours=1))
+def purge_resume_uploads():
+    purge_stale_uploads()
+
+@periodic_task(every=timedelta(hours=1))
+def expire_job_listings():
+    """Flip listings past expires_at to inactive, keeping them out of the open-listing indexes"""
+    expire_listings()
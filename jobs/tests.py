@@ -0,0 +1,85 @@
+import shutil
+import tempfile
+from unittest import mock
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from jobs.models import ResumeUpload
+from nyure_education.storage import scratch_storage
+from users.models import User
+
+PDF = b'%PDF-1.4\n' + b'x' * 1000
+
+class ResumeUploadTests(TestCase):
+    """Chunked resume uploads, driven through the API"""
+    
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media_root, RESUME_UPLOAD_CHUNK_MAX=512)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        
+        self.user = User.objects.create_user(username='applicant', email='applicant@example.com', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+    
+    def start(self, data=PDF):
+        response = self.client.post(
+            '/api/jobs/resume-uploads/', {'filename': 'cv.pdf', 'size': len(data)}, format='json', secure=True
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+    
+    def put_chunk(self, upload_id, data, start, total=len(PDF)):
+        return self.client.put(
+            f'/api/jobs/resume-uploads/{upload_id}/chunk/',
+            data,
+            content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{start + len(data) - 1}/{total}',
+            secure=True,
+        )
+    
+    def test_chunks_in_order_complete_the_upload(self):
+        upload_id = self.start()
+        response = self.put_chunk(upload_id, PDF[:512], 0)
+        self.assertEqual((response.status_code, response.data['received_bytes']), (200, 512))
+        response = self.put_chunk(upload_id, PDF[512:], 512)
+        self.assertEqual(response.data['status'], 'complete')
+        
+        upload = ResumeUpload.objects.get(pk=upload_id)
+        self.assertEqual(upload.parts, [])
+        with upload.file.open('rb') as assembled:
+            self.assertEqual(assembled.read(), PDF)
+    
+    def test_out_of_order_chunk_is_refused_with_the_resume_point(self):
+        upload_id = self.start()
+        self.put_chunk(upload_id, PDF[:512], 0)
+        response = self.put_chunk(upload_id, PDF[600:], 600)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['received_bytes'], 512)
+    
+    def test_oversized_chunk_is_refused(self):
+        upload_id = self.start()
+        response = self.put_chunk(upload_id, PDF[:600], 0)
+        self.assertEqual(response.status_code, 413)
+    
+    def test_wrong_contents_fail_the_upload(self):
+        data = b'not a pdf'
+        upload_id = self.start(data)
+        response = self.put_chunk(upload_id, data, 0, total=len(data))
+        self.assertEqual(response.status_code, 400)
+        upload = ResumeUpload.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, 'failed')
+        self.assertIn("look like a '.pdf'", upload.error)
+    
+    def test_failed_assembly_marks_the_upload_failed_and_drops_its_parts(self):
+        upload_id = self.start()
+        self.put_chunk(upload_id, PDF[:512], 0)
+        with mock.patch('jobs.uploads.validate_resume_file', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.put_chunk(upload_id, PDF[512:], 512)
+        
+        upload = ResumeUpload.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, 'failed')
+        self.assertEqual(upload.parts, [])
+        self.assertEqual(scratch_storage().listdir(f'uploads/partial/{upload_id}')[1], [])
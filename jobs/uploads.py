@@ -0,0 +1,209 @@
+import os
+import posixpath
+import re
+import uuid
+import zipfile
+from datetime import timedelta
+from tempfile import SpooledTemporaryFile
+from django.conf import settings
+from django.core.files import File
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from nyure_education.storage import scratch_storage
+from .models import ResumeUpload
+
+# Bytes copied from the request stream at a time
+COPY_BUFFER_SIZE = 64 * 1024
+
+# Chunks and assembled files up to this size stay in memory, larger ones spill to a temp file
+SPOOL_MAX_SIZE = 1024 * 1024
+
+# Extension -> (accepted content types, leading magic bytes)
+RESUME_TYPES = {
+    '.pdf': ({'application/pdf'}, b'%PDF-'),
+    '.doc': ({'application/msword'}, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),
+    '.docx': ({'application/vnd.openxmlformats-officedocument.wordprocessingml.document'}, b'PK\x03\x04'),
+}
+
+CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+class UploadError(Exception):
+    def __init__(self, message, status_code=400, **extra):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.extra = extra
+
+def max_resume_size():
+    return getattr(settings, 'RESUME_MAX_SIZE', 5 * 1024 * 1024)
+
+def max_chunk_size():
+    return getattr(settings, 'RESUME_UPLOAD_CHUNK_MAX', 2 * 1024 * 1024)
+
+def parts_prefix(upload):
+    """Chunks go to shared scratch storage, so any web instance can take the next one"""
+    return posixpath.join(getattr(settings, 'RESUME_UPLOAD_PARTS_PREFIX', 'uploads/partial'), str(upload.id))
+
+def part_name(upload, start):
+    # Unique per attempt, so a rejected or retried chunk never overwrites an accepted one
+    return posixpath.join(parts_prefix(upload), f'{start:012d}-{uuid.uuid4().hex}.part')
+
+def delete_parts(names):
+    storage = scratch_storage()
+    for name in names:
+        storage.delete(name)
+
+def file_extension(filename):
+    return os.path.splitext(filename)[1].lower()
+
+def validate_declaration(filename, size, content_type=''):
+    """Check what the client says it will send before accepting any bytes"""
+    extension = file_extension(filename)
+    if extension not in RESUME_TYPES:
+        raise UploadError(f"Unsupported file type. Allowed: {', '.join(RESUME_TYPES)}")
+    if content_type and content_type not in RESUME_TYPES[extension][0]:
+        raise UploadError(f"Content type '{content_type}' does not match '{extension}'.")
+    if size <= 0:
+        raise UploadError('File is empty.')
+    if size > max_resume_size():
+        raise UploadError(f'File is larger than {max_resume_size()} bytes.', status_code=413)
+
+def validate_resume_file(file, filename):
+    """Check the file's actual contents match its extension"""
+    extension = file_extension(filename)
+    if extension not in RESUME_TYPES:
+        raise UploadError(f"Unsupported file type. Allowed: {', '.join(RESUME_TYPES)}")
+    
+    magic = RESUME_TYPES[extension][1]
+    file.seek(0)
+    if file.read(len(magic)) != magic:
+        raise UploadError(f"File contents do not look like a '{extension}' document.")
+    
+    # Any zip starts with PK, so make sure this one is a Word document
+    if extension == '.docx':
+        file.seek(0)
+        try:
+            with zipfile.ZipFile(file) as archive:
+                if 'word/document.xml' not in archive.namelist():
+                    raise UploadError("File contents do not look like a '.docx' document.")
+        except zipfile.BadZipFile:
+            raise UploadError('File is not a valid .docx archive.')
+    file.seek(0)
+
+def parse_content_range(header):
+    """Parse 'bytes start-end/total' into a (start, end, total) tuple"""
+    match = CONTENT_RANGE_RE.match(header or '')
+    if not match:
+        raise UploadError("A 'Content-Range: bytes start-end/total' header is required.")
+    start, end, total = (int(value) for value in match.groups())
+    if end < start or end >= total:
+        raise UploadError('Invalid Content-Range.', status_code=416)
+    return start, end, total
+
+def copy_stream(stream, target, length):
+    """Copy up to `length` bytes from the request stream in small reads; returns the count copied"""
+    remaining = length
+    while remaining:
+        data = stream.read(min(COPY_BUFFER_SIZE, remaining))
+        if not data:
+            break
+        target.write(data)
+        remaining -= len(data)
+    return length - remaining
+
+def check_chunk(upload, start, total):
+    if upload.status != 'pending':
+        raise UploadError(f'Upload is {upload.status}.', status_code=409)
+    if total != upload.size:
+        raise UploadError('Content-Range total does not match the declared size.')
+    if start != upload.received_bytes:
+        raise UploadError(
+            'Chunk does not start at the next expected byte.',
+            status_code=409,
+            received_bytes=upload.received_bytes
+        )
+
+def finalize(upload):
+    """Join the chunks, validate the result and move it into media storage"""
+    storage = scratch_storage()
+    try:
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as assembled:
+            for name in upload.parts:
+                with storage.open(name, 'rb') as part:
+                    for data in part.chunks(COPY_BUFFER_SIZE):
+                        assembled.write(data)
+            if assembled.tell() != upload.size:
+                raise UploadError('Assembled file does not match the declared size.')
+            
+            validate_resume_file(assembled, upload.filename)
+            extension = file_extension(upload.filename)
+            upload.file.save(f'{upload.id}{extension}', File(assembled), save=False)
+    except Exception as exc:
+        # Storage and parser errors fail the upload too, so its parts never linger
+        delete_parts(upload.parts)
+        upload.status = 'failed'
+        upload.error = exc.message if isinstance(exc, UploadError) else 'Could not assemble the upload.'
+        upload.parts = []
+        upload.save(update_fields=['status', 'error', 'parts', 'updated_at'])
+        raise
+    
+    delete_parts(upload.parts)
+    upload.status = 'complete'
+    upload.parts = []
+    upload.save(update_fields=['file', 'status', 'parts', 'updated_at'])
+
+def append_chunk(upload_id, user, content_range, content_length, stream):
+    """
+    Store one chunk of an upload at its declared offset.
+    Chunks must arrive in order; a client resumes by asking for `received_bytes`.
+    """
+    start, end, total = parse_content_range(content_range)
+    length = end - start + 1
+    if content_length is not None and content_length != length:
+        raise UploadError('Content-Length does not match Content-Range.')
+    if length > max_chunk_size():
+        raise UploadError(f'Chunks may be at most {max_chunk_size()} bytes.', status_code=413)
+    
+    # Cheap unlocked check, so an out-of-order chunk is refused before its body is read
+    upload = ResumeUpload.objects.get(pk=upload_id, user=user)
+    check_chunk(upload, start, total)
+    
+    # Read the whole body before taking any lock; a slow client holds nothing but its own buffer
+    with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+        if copy_stream(stream, buffer, length) != length:
+            raise UploadError('Chunk was truncated; resend it.', received_bytes=upload.received_bytes)
+        buffer.seek(0)
+        name = scratch_storage().save(part_name(upload, start), File(buffer))
+    
+    try:
+        with transaction.atomic():
+            # One writer per upload; a concurrent chunk for the same upload is refused
+            try:
+                upload = ResumeUpload.objects.select_for_update(nowait=True).get(pk=upload_id, user=user)
+            except DatabaseError:
+                raise UploadError('Another chunk for this upload is in progress.', status_code=409)
+            check_chunk(upload, start, total)
+            
+            upload.parts = upload.parts + [name]
+            upload.received_bytes = end + 1
+            upload.save(update_fields=['parts', 'received_bytes', 'updated_at'])
+    except UploadError:
+        delete_parts([name])
+        raise
+    
+    # Outside the lock so a failed validation is recorded rather than rolled back
+    if upload.received_bytes == upload.size:
+        finalize(upload)
+    return upload
+
+def purge_stale_uploads(max_age_hours=24):
+    """Delete unfinished uploads and their partial files after `max_age_hours`"""
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    stale = ResumeUpload.objects.filter(status__in=['pending', 'failed'], updated_at__lt=cutoff)
+    
+    count = 0
+    for upload in stale.iterator():
+        delete_parts(upload.parts)
+        upload.delete()
+        count += 1
+    return count
@@ -1,12 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import CompanyViewSet, JobListingViewSet, JobApplicationViewSet, SavedJobViewSet
+from .views import CompanyViewSet, JobListingViewSet, JobApplicationViewSet, SavedJobViewSet, ResumeUploadViewSet
 
 router = DefaultRouter()
 router.register(r'companies', CompanyViewSet)
 router.register(r'listings', JobListingViewSet, basename='job-listing')
 router.register(r'applications', JobApplicationViewSet, basename='job-application')
 router.register(r'saved', SavedJobViewSet, basename='saved-job')
+router.register(r'resume-uploads', ResumeUploadViewSet, basename='resume-upload')
 
 urlpatterns = [
     path('', include(router.urls)),
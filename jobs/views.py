@@ -1,29 +1,62 @@
-from rest_framework import viewsets, permissions, status, filters
+from rest_framework import viewsets, mixins, permissions, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils import timezone
-from .models import Company, JobListing, JobApplication, SavedJob
-from .serializers import CompanySerializer, JobListingSerializer, JobApplicationSerializer, SavedJobSerializer
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from .models import Company, JobListing, JobApplication, SavedJob, JobMatchScore, ResumeUpload
+from .serializers import (
+    CompanySerializer, JobListingSerializer, JobApplicationSerializer, SavedJobSerializer, ResumeUploadSerializer
+)
+from .uploads import UploadError, append_chunk, max_resume_size, validate_declaration, validate_resume_file
 from users.permissions import IsOwnerOrReadOnly
+from nyure_education.db_router import ReplicaReadMixin
+from nyure_education.views import private_file_response
+from nyure_education.typeahead import top_matches, typeahead_params
 
-class CompanyViewSet(viewsets.ReadOnlyModelViewSet):
+class CompanyViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    replica_actions = ('list', 'retrieve', 'typeahead')
     search_fields = ['name', 'description', 'industry', 'location']
     ordering_fields = ['name', 'size', 'created_at']
+    
+    @action(detail=False, methods=['get'])
+    def typeahead(self, request):
+        """Top company names matching ?q= (3+ characters)"""
+        query, limit = typeahead_params(request)
+        return Response(top_matches(Company.objects.values('id', 'name'), 'name', query, limit))
 
-class JobListingViewSet(viewsets.ReadOnlyModelViewSet):
+class JobListingViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = JobListingSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description', 'company__name', 'location']
-    ordering_fields = ['posted_at', 'expires_at', 'salary_min', 'salary_max']
+    ordering_fields = ['posted_at', 'expires_at', 'salary_min', 'salary_max', 'match_score']
+    throttle_scopes = {'apply': 'apply'}
     
     def get_queryset(self):
         queryset = JobListing.objects.filter(is_active=True, expires_at__gte=timezone.now().date())
         
+        # Attach the user's precomputed match score (sort with ?ordering=-match_score)
+        match_score = JobMatchScore.objects.filter(
+            user=self.request.user,
+            job_listing=OuterRef('pk')
+        ).values('score')[:1]
+        queryset = queryset.annotate(match_score=Coalesce(Subquery(match_score), Value(0)))
+        
+        # Filter by minimum match score, starting from the user's scores ((user, -score) index)
+        # rather than checking the annotation on every open listing
+        min_match = self.request.query_params.get('min_match')
+        if min_match and min_match.isdigit() and int(min_match) > 0:
+            matching = JobMatchScore.objects.filter(user=self.request.user, score__gte=int(min_match))
+            queryset = queryset.filter(id__in=matching.values('job_listing_id'))
+        
         # Filter by job type
         job_type = self.request.query_params.get('job_type')
         if job_type:
@@ -53,9 +86,9 @@ class JobListingViewSet(viewsets.ReadOnlyModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         
-        # Increment view count
+        # Increment view count in SQL rather than rewriting the whole row
+        JobListing.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
         instance.view_count += 1
-        instance.save()
         
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -99,25 +132,46 @@ class JobListingViewSet(viewsets.ReadOnlyModelViewSet):
         
         # Validate data
         cover_letter = request.data.get('cover_letter')
+        upload_id = request.data.get('resume_upload')
         resume = request.data.get('resume')
         
         if not cover_letter:
             return Response({'detail': 'Cover letter is required.'}, status=status.HTTP_400_BAD_REQUEST)
         
-        if not resume:
+        if not upload_id and resume:
+            # Small resumes may still be sent inline with the application
+            try:
+                if resume.size > max_resume_size():
+                    raise UploadError(f'File is larger than {max_resume_size()} bytes.', status_code=413)
+                validate_resume_file(resume, resume.name)
+            except AttributeError:
+                return Response({'detail': 'Resume must be a file.'}, status=status.HTTP_400_BAD_REQUEST)
+            except UploadError as exc:
+                return Response({'detail': exc.message}, status=exc.status_code)
+        elif not upload_id:
             return Response({'detail': 'Resume is required.'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Create application
-        application = JobApplication.objects.create(
-            user=user,
-            job_listing=job_listing,
-            cover_letter=cover_letter,
-            resume=resume
-        )
-        
-        # Increment application count
-        job_listing.application_count += 1
-        job_listing.save()
+        with transaction.atomic():
+            if upload_id:
+                # Preferred: reference a finished chunked upload, locked so it is attached only once
+                try:
+                    upload = ResumeUpload.objects.select_for_update().get(pk=upload_id, user=user, status='complete')
+                except (ResumeUpload.DoesNotExist, ValueError, DjangoValidationError):
+                    return Response({'detail': 'Completed resume upload not found.'}, status=status.HTTP_400_BAD_REQUEST)
+                resume = upload.file.name
+                upload.status = 'attached'
+                upload.save(update_fields=['status', 'updated_at'])
+            
+            # Create application
+            application = JobApplication.objects.create(
+                user=user,
+                job_listing=job_listing,
+                cover_letter=cover_letter,
+                resume=resume
+            )
+            
+            # Increment application count in SQL; save() would also queue a match score refresh
+            JobListing.objects.filter(pk=job_listing.pk).update(application_count=F('application_count') + 1)
         
         serializer = JobApplicationSerializer(application)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -147,6 +201,62 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         
         serializer = JobApplicationSerializer(application)
         return Response(serializer.data)
+    
+    @action(detail=True, methods=['get'])
+    def resume(self, request, pk=None):
+        """Download the application's resume; resumes are never served from a public media URL"""
+        application = self.get_object()
+        if not application.resume:
+            return Response({'detail': 'No resume attached.'}, status=status.HTTP_404_NOT_FOUND)
+        return private_file_response(application.resume)
+
+class ResumeUploadViewSet(mixins.CreateModelMixin,
+                          mixins.RetrieveModelMixin,
+                          mixins.DestroyModelMixin,
+                          viewsets.GenericViewSet):
+    """
+    Resumable resume uploads: POST the file's name and size, PUT the bytes in order
+    with Content-Range headers, then pass the upload id to `apply` as `resume_upload`.
+    """
+    serializer_class = ResumeUploadSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        return ResumeUpload.objects.filter(user=self.request.user)
+    
+    def perform_create(self, serializer):
+        data = serializer.validated_data
+        try:
+            validate_declaration(data['filename'], data['size'], data.get('content_type', ''))
+        except UploadError as exc:
+            raise DRFValidationError({'detail': exc.message})
+        serializer.save(user=self.request.user)
+    
+    def perform_destroy(self, instance):
+        if instance.status == 'attached':
+            raise DRFValidationError({'detail': 'Upload is attached to an application.'})
+        # The stored file may be shared with other rows; the orphan sweep removes it once none is left
+        instance.delete()
+    
+    @action(detail=True, methods=['put'])
+    def chunk(self, request, pk=None):
+        # Read the raw body stream; touching request.data would buffer the chunk
+        content_length = request.META.get('CONTENT_LENGTH')
+        try:
+            upload = append_chunk(
+                pk,
+                request.user,
+                request.META.get('HTTP_CONTENT_RANGE'),
+                int(content_length) if content_length else None,
+                request.stream
+            )
+        except (ResumeUpload.DoesNotExist, DjangoValidationError):
+            return Response({'detail': 'Upload not found.'}, status=status.HTTP_404_NOT_FOUND)
+        except UploadError as exc:
+            return Response({'detail': exc.message, **exc.extra}, status=exc.status_code)
+        
+        serializer = self.get_serializer(upload)
+        return Response(serializer.data)
 
 class SavedJobViewSet(viewsets.ModelViewSet):
     serializer_class = SavedJobSerializer
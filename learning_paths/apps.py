@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+class LearningPathsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'learning_paths'
+    
+    def ready(self):
+        from . import signals
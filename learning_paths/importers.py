@@ -0,0 +1,385 @@
+import csv
+import json
+from itertools import islice
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import BooleanField
+from django.utils.text import slugify
+from .models import Skill, Category, LearningPath, Step
+from users.models import User
+
+SUPPORTED_FORMATS = ('csv', 'jsonl')
+TRUE_VALUES = {'true', 't', 'yes', 'y', '1'}
+FALSE_VALUES = {'false', 'f', 'no', 'n', '0'}
+
+def read_rows(lines, file_format):
+    """
+    Yield (row_number, row) pairs from an iterable of text lines.
+    Rows that cannot be parsed are yielded as (row_number, ValidationError).
+    """
+    if file_format == 'csv':
+        for number, row in enumerate(csv.DictReader(lines), start=1):
+            yield number, row
+    elif file_format == 'jsonl':
+        number = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            number += 1
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield number, ValidationError(f'Invalid JSON: {exc}')
+                continue
+            if not isinstance(row, dict):
+                yield number, ValidationError('Each line must be a JSON object.')
+                continue
+            yield number, row
+    else:
+        raise ValueError(f'Unsupported format: {file_format}')
+
+def chunked(iterable, size):
+    """Split an iterable into lists of at most `size` items"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def split_list(value):
+    """Split a 'a;b;c' cell (or a JSON list) into clean names"""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in str(value).split(';') if item.strip()]
+
+def error_message(exc):
+    if isinstance(exc, ValidationError):
+        return '; '.join(exc.messages)
+    return str(exc)
+
+class ImportReport:
+    """Counts and per-row errors for an import run"""
+    
+    def __init__(self, max_errors=1000):
+        self.max_errors = max_errors
+        self.processed = 0
+        self.created = 0
+        self.updated = 0
+        self.error_count = 0
+        self.errors = []
+    
+    def add_error(self, row_number, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': row_number, 'error': message})
+    
+    def as_dict(self):
+        return {
+            'processed': self.processed,
+            'created': self.created,
+            'updated': self.updated,
+            'error_count': self.error_count,
+            'errors': self.errors,
+        }
+
+class NameLookup:
+    """
+    In-memory name -> id map for small lookup tables, creating missing names in bulk.
+    Names created inside a chunk stay pending until the chunk commits, so a rolled-back
+    chunk never leaves ids behind that point at rows which no longer exist.
+    """
+    
+    def __init__(self, model, field='name', build=None):
+        self.model = model
+        self.field = field
+        self.build = build or (lambda name: model(**{field: name}))
+        self.ids = {
+            name.lower(): pk
+            for pk, name in model.objects.values_list('pk', field).iterator(chunk_size=5000)
+        }
+        self.pending = {}
+    
+    def get(self, name):
+        key = name.lower()
+        if key in self.ids:
+            return self.ids[key]
+        return self.pending.get(key)
+    
+    def ensure(self, names):
+        """Create any names that are not in the map yet"""
+        missing = {name.lower(): name for name in names if self.get(name) is None}
+        if not missing:
+            return
+        
+        self.model.objects.bulk_create(
+            [self.build(name) for name in missing.values()],
+            ignore_conflicts=True
+        )
+        lookup = {f'{self.field}__in': list(missing.values())}
+        for pk, name in self.model.objects.filter(**lookup).values_list('pk', self.field):
+            self.pending[name.lower()] = pk
+    
+    def commit(self):
+        self.ids.update(self.pending)
+        self.pending = {}
+    
+    def rollback(self):
+        self.pending = {}
+
+class BaseImporter:
+    """
+    Streams rows through validation and batched writes.
+    Subclasses declare the model columns they accept and implement `write`.
+    """
+    model = None
+    fields = ()
+    required_fields = ()
+    key_field = None
+    
+    def __init__(self, batch_size=1000, max_errors=1000, user=None):
+        self.batch_size = batch_size
+        self.user = user
+        self.report = ImportReport(max_errors=max_errors)
+        # Rows written or rejected by the current chunk, added to the report once it commits
+        self.created = 0
+        self.updated = 0
+        self.errors = []
+    
+    def lookups(self):
+        return [value for value in vars(self).values() if isinstance(value, NameLookup)]
+    
+    def reject(self, number, message):
+        """Skip a row from inside `write`; reported only if the chunk commits"""
+        self.errors.append((number, message))
+    
+    def run(self, rows):
+        for chunk in chunked(rows, self.batch_size):
+            self.process_chunk(chunk)
+        return self.report
+    
+    def process_chunk(self, chunk):
+        cleaned = {}
+        for number, row in chunk:
+            self.report.processed += 1
+            if isinstance(row, Exception):
+                self.report.add_error(number, error_message(row))
+                continue
+            try:
+                values = self.clean_row(row)
+            except ValidationError as exc:
+                self.report.add_error(number, error_message(exc))
+                continue
+            
+            # Later rows win over earlier rows with the same key in one batch
+            cleaned[values[self.key_field]] = (number, values)
+        
+        if not cleaned:
+            return
+        
+        self.created = self.updated = 0
+        self.errors = []
+        try:
+            with transaction.atomic():
+                self.write(list(cleaned.values()))
+        except (DatabaseError, ValidationError) as exc:
+            for lookup in self.lookups():
+                lookup.rollback()
+            for number, _ in cleaned.values():
+                self.report.add_error(number, error_message(exc))
+            return
+        
+        for lookup in self.lookups():
+            lookup.commit()
+        self.report.created += self.created
+        self.report.updated += self.updated
+        for number, message in self.errors:
+            self.report.add_error(number, message)
+    
+    def clean_value(self, name, value):
+        field = self.model._meta.get_field(name)
+        if isinstance(field, BooleanField) and isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in TRUE_VALUES:
+                return True
+            if lowered in FALSE_VALUES:
+                return False
+        return field.clean(value, None)
+    
+    def clean_row(self, row):
+        """Validate declared columns with the model's own field validators"""
+        values = {}
+        errors = {}
+        for name in self.fields:
+            value = row.get(name)
+            if value is None or value == '':
+                if name in self.required_fields:
+                    errors[name] = 'This field is required.'
+                continue
+            try:
+                values[name] = self.clean_value(name, value)
+            except ValidationError as exc:
+                errors[name] = error_message(exc)
+        
+        if errors:
+            raise ValidationError('; '.join(f'{name}: {message}' for name, message in errors.items()))
+        return values
+    
+    def write(self, rows):
+        raise NotImplementedError
+    
+    def replace_skills(self, through, owner_field, skill_ids_by_owner):
+        """Replace the skill set of each owner with one delete and one bulk insert"""
+        if not skill_ids_by_owner:
+            return
+        
+        through.objects.filter(**{f'{owner_field}__in': list(skill_ids_by_owner)}).delete()
+        through.objects.bulk_create([
+            through(**{owner_field: owner_id, 'skill_id': skill_id})
+            for owner_id, skill_ids in skill_ids_by_owner.items()
+            for skill_id in skill_ids
+        ], ignore_conflicts=True)
+
+class SkillImporter(BaseImporter):
+    model = Skill
+    fields = ('name', 'description')
+    required_fields = ('name',)
+    key_field = 'name'
+    
+    def write(self, rows):
+        names = [values['name'] for _, values in rows]
+        existing = set(Skill.objects.filter(name__in=names).values_list('name', flat=True))
+        
+        Skill.objects.bulk_create(
+            [Skill(**values) for _, values in rows],
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=['description']
+        )
+        self.updated += len(existing)
+        self.created += len(rows) - len(existing)
+
+class LearningPathImporter(BaseImporter):
+    model = LearningPath
+    fields = (
+        'title', 'slug', 'description', 'level', 'estimated_duration',
+        'xp_reward', 'is_published', 'is_featured'
+    )
+    required_fields = ('title', 'description', 'estimated_duration')
+    key_field = 'slug'
+    update_fields = [
+        'title', 'description', 'level', 'estimated_duration', 'xp_reward',
+        'is_published', 'is_featured', 'category', 'creator', 'updated_at'
+    ]
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.categories = NameLookup(Category, build=lambda name: Category(name=name, slug=slugify(name)))
+        self.skills = NameLookup(Skill)
+    
+    def clean_row(self, row):
+        values = super().clean_row(row)
+        values.setdefault('slug', slugify(values['title']))
+        
+        category = (row.get('category') or '').strip()
+        if not category:
+            raise ValidationError('category: This field is required.')
+        values['category'] = category
+        values['skills'] = split_list(row.get('skills'))
+        values['creator'] = (row.get('creator') or '').strip().lower()
+        return values
+    
+    def write(self, rows):
+        # Resolve lookups for the whole batch at once
+        self.categories.ensure({values['category'] for _, values in rows})
+        self.skills.ensure({name for _, values in rows for name in values['skills']})
+        creator_emails = {values['creator'] for _, values in rows if values['creator']}
+        creators = dict(
+            (email.lower(), pk) for pk, email in
+            User.objects.filter(email__in=creator_emails).values_list('pk', 'email')
+        )
+        
+        paths = []
+        kept = []
+        for number, values in rows:
+            if values['creator']:
+                creator_id = creators.get(values['creator'])
+            else:
+                creator_id = getattr(self.user, 'pk', None)
+            if creator_id is None:
+                self.reject(number, f"creator: '{values['creator']}' not found.")
+                continue
+            kept.append(values)
+            paths.append(LearningPath(
+                category_id=self.categories.get(values['category']),
+                creator_id=creator_id,
+                **{name: value for name, value in values.items() if name in self.fields}
+            ))
+        
+        slugs = [values['slug'] for values in kept]
+        existing = set(LearningPath.objects.filter(slug__in=slugs).values_list('slug', flat=True))
+        
+        LearningPath.objects.bulk_create(
+            paths,
+            update_conflicts=True,
+            unique_fields=['slug'],
+            update_fields=self.update_fields
+        )
+        self.updated += len(existing)
+        self.created += len(paths) - len(existing)
+        
+        # Replace skills for rows that list them
+        path_ids = dict(LearningPath.objects.filter(slug__in=slugs).values_list('slug', 'id'))
+        self.replace_skills(LearningPath.skills.through, 'learningpath_id', {
+            path_ids[values['slug']]: {self.skills.get(name) for name in values['skills']}
+            for values in kept if values['skills']
+        })
+
+class StepImporter(BaseImporter):
+    model = Step
+    fields = ('order', 'title', 'description', 'type', 'content', 'estimated_duration', 'xp_reward')
+    required_fields = ('order', 'title', 'description', 'estimated_duration')
+    key_field = 'key'
+    
+    def clean_row(self, row):
+        values = super().clean_row(row)
+        path_slug = (row.get('learning_path') or '').strip()
+        if not path_slug:
+            raise ValidationError('learning_path: This field is required.')
+        values['learning_path'] = path_slug
+        values['key'] = (path_slug, values['order'])
+        return values
+    
+    def write(self, rows):
+        slugs = {values['learning_path'] for _, values in rows}
+        path_ids = dict(LearningPath.objects.filter(slug__in=slugs).values_list('slug', 'id'))
+        
+        steps = []
+        keys = []
+        for number, values in rows:
+            path_id = path_ids.get(values['learning_path'])
+            if path_id is None:
+                self.reject(number, f"learning_path: '{values['learning_path']}' not found.")
+                continue
+            keys.append((path_id, values['order']))
+            steps.append(Step(
+                learning_path_id=path_id,
+                **{name: value for name, value in values.items() if name in self.fields}
+            ))
+        
+        existing = set(
+            Step.objects.filter(learning_path_id__in=path_ids.values())
+            .values_list('learning_path_id', 'order')
+        ) & set(keys)
+        
+        Step.objects.bulk_create(
+            steps,
+            update_conflicts=True,
+            unique_fields=['learning_path', 'order'],
+            update_fields=['title', 'description', 'type', 'content', 'estimated_duration', 'xp_reward']
+        )
+        self.updated += len(existing)
+        self.created += len(steps) - len(existing)
@@ -0,0 +1,82 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('slug', models.SlugField(unique=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Categories',
+            },
+        ),
+        migrations.CreateModel(
+            name='LearningPath',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('slug', models.SlugField(unique=True)),
+                ('description', models.TextField()),
+                ('level', models.CharField(choices=[('beginner', 'Beginner'), ('intermediate', 'Intermediate'), ('advanced', 'Advanced')], default='beginner', max_length=20)),
+                ('estimated_duration', models.PositiveIntegerField(help_text='Duration in hours')),
+                ('xp_reward', models.PositiveIntegerField(default=100)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='learning_paths/')),
+                ('image_variants', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_published', models.BooleanField(default=False)),
+                ('is_featured', models.BooleanField(default=False)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Step',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('order', models.PositiveIntegerField()),
+                ('type', models.CharField(choices=[('lesson', 'Lesson'), ('quiz', 'Quiz'), ('project', 'Project'), ('assignment', 'Assignment')], default='lesson', max_length=20)),
+                ('content', models.TextField(blank=True)),
+                ('estimated_duration', models.PositiveIntegerField(help_text='Duration in minutes')),
+                ('xp_reward', models.PositiveIntegerField(default=10)),
+            ],
+            options={
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserLearningPath',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('progress', models.PositiveIntegerField(default=0)),
+                ('is_completed', models.BooleanField(default=False)),
+                ('enrolled_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_activity', models.DateTimeField(auto_now=True)),
+                ('current_step', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='current_users', to='learning_paths.step')),
+                ('learning_path', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_paths', to='learning_paths.learningpath')),
+            ],
+        ),
+    ]
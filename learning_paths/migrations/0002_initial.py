@@ -0,0 +1,61 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.conf import settings
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('learning_paths', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userlearningpath',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='learning_paths', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='step',
+            name='learning_path',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='steps', to='learning_paths.learningpath'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='lp_skill_name_trgm_idx'),
+        ),
+        migrations.AddField(
+            model_name='learningpath',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='learning_paths', to='learning_paths.category'),
+        ),
+        migrations.AddField(
+            model_name='learningpath',
+            name='creator',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='created_paths', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='learningpath',
+            name='skills',
+            field=models.ManyToManyField(related_name='learning_paths', to='learning_paths.skill'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='userlearningpath',
+            unique_together={('user', 'learning_path')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='step',
+            unique_together={('learning_path', 'order')},
+        ),
+        migrations.AddIndex(
+            model_name='learningpath',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at'], name='lp_path_published_idx'),
+        ),
+    ]
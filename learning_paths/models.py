@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth import get_user_model
 from django.utils.text import slugify
 
@@ -9,6 +11,12 @@ class Skill(models.Model):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(blank=True)
     
+    class Meta:
+        indexes = [
+            # Trigram index on UPPER(name), so icontains name searches don't scan the table
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='lp_skill_name_trgm_idx'),
+        ]
+    
     def __str__(self):
         return self.name
 
@@ -44,6 +52,7 @@ class LearningPath(models.Model):
     estimated_duration = models.PositiveIntegerField(help_text="Duration in hours")
     xp_reward = models.PositiveIntegerField(default=100)
     image = models.ImageField(upload_to='learning_paths/', null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)
     
     # Relationships
     creator = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_paths')
@@ -58,6 +67,12 @@ class LearningPath(models.Model):
     is_published = models.BooleanField(default=False)
     is_featured = models.BooleanField(default=False)
     
+    class Meta:
+        indexes = [
+            # Browse, newest first: published paths (this index) or the user's own drafts (the creator index)
+            models.Index(fields=['-created_at'], condition=models.Q(is_published=True), name='lp_path_published_idx'),
+        ]
+    
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
@@ -117,25 +132,3 @@ class UserLearningPath(models.Model):
     
     def __str__(self):
         return f"{self.user.username} - {self.learning_path.title}"
-
-class UserStepProgress(models.Model):
-    """Model for tracking user progress in individual steps"""
-    STATUS_CHOICES = [
-        ('not_started', 'Not Started'),
-        ('in_progress', 'In Progress'),
-        ('completed', 'Completed'),
-    ]
-    
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='step_progress')
-    step = models.ForeignKey(Step, on_delete=models.CASCADE, related_name='user_progress')
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='not_started')
-    
-    # Timestamps
-    started_at = models.DateTimeField(null=True, blank=True)
-    completed_at = models.DateTimeField(null=True, blank=True)
-    
-    class Meta:
-        unique_together = ['user', 'step']
-    
-    def __str__(self):
-        return f"{self.user.username} - {self.step.title} - {self.status}"
@@ -1,12 +1,24 @@
 from rest_framework import serializers
 from .models import Skill, LearningPath, Step, UserLearningPath
 from users.serializers import UserProfileSerializer
+from imaging.fields import ImageVariantsField
+from stats.models import SkillStats
+from stats.serializers import SkillStatsSerializer
 
 class SkillSerializer(serializers.ModelSerializer):
     class Meta:
         model = Skill
         fields = '__all__'
 
+class SkillBrowseSerializer(SkillSerializer):
+    """Skill with its precomputed counts; select_related('stats') to avoid a query per skill"""
+    stats = serializers.SerializerMethodField()
+    
+    def get_stats(self, obj):
+        # Skills created by bulk imports have no row until the next reconcile
+        stats = getattr(obj, 'stats', None) or SkillStats()
+        return SkillStatsSerializer(stats).data
+
 class StepSerializer(serializers.ModelSerializer):
     skills = SkillSerializer(many=True, read_only=True)
     
@@ -17,6 +29,7 @@ class StepSerializer(serializers.ModelSerializer):
 class LearningPathSerializer(serializers.ModelSerializer):
     steps = StepSerializer(many=True, read_only=True)
     creator = UserProfileSerializer(read_only=True)
+    image_variants = ImageVariantsField('image')
     
     class Meta:
         model = LearningPath
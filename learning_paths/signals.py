@@ -0,0 +1,10 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Skill
+from .typeahead import skill_index
+
+@receiver([post_save, post_delete], sender=Skill)
+def skill_changed(sender, instance, **kwargs):
+    """Every process reloads its typeahead index on its next lookup, once the change is committed"""
+    transaction.on_commit(skill_index.invalidate)
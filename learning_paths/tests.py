@@ -0,0 +1,25 @@
+from unittest import mock
+from django.db import DatabaseError
+from django.test import TestCase
+from learning_paths.importers import StepImporter
+from learning_paths.models import Step
+
+class ImportErrorReportTests(TestCase):
+    """Rows skipped inside a chunk are reported once, and only if the chunk commits"""
+    
+    def rows(self):
+        return [
+            (1, {'learning_path': 'missing', 'order': '1', 'title': 'Intro', 'description': 'x', 'estimated_duration': '5'}),
+            (2, {'learning_path': 'missing', 'order': '2', 'title': 'Next', 'description': 'x', 'estimated_duration': '5'}),
+        ]
+    
+    def test_rejected_rows_are_reported_after_commit(self):
+        report = StepImporter().run(self.rows())
+        self.assertEqual(report.error_count, 2)
+        self.assertEqual([error['row'] for error in report.errors], [1, 2])
+    
+    def test_rolled_back_chunk_reports_each_row_once(self):
+        with mock.patch.object(Step.objects, 'bulk_create', side_effect=DatabaseError('boom')):
+            report = StepImporter().run(self.rows())
+        self.assertEqual(report.error_count, 2)
+        self.assertEqual([error['error'] for error in report.errors], ['boom', 'boom'])
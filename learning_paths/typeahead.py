@@ -0,0 +1,86 @@
+import bisect
+import heapq
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+from .models import Skill
+
+# Bumped in the shared cache whenever a skill changes, so every process reloads
+VERSION_KEY = 'skill-index-version'
+
+class SkillIndex:
+    """
+    In-memory prefix index over skill names for typeahead. Every word start
+    of a name is a sorted key, so "lea" finds "Machine Learning" with one
+    bisect. Each process loads it on first use (or at worker start) and
+    reloads after a skill changes anywhere, or after SKILL_INDEX_TTL seconds
+    in case a bulk write skipped the signals.
+    """
+    
+    def __init__(self):
+        self.keys = []
+        self.entries = []
+        self.names = {}
+        self.version = None
+        self.loaded_at = None
+        self.lock = threading.Lock()
+    
+    def is_fresh(self, version):
+        ttl = getattr(settings, 'SKILL_INDEX_TTL', 300)
+        return (
+            self.loaded_at is not None
+            and time.monotonic() - self.loaded_at < ttl
+            and version == self.version
+        )
+    
+    def refresh(self):
+        """Reload if stale; cheap (one cache read) when it isn't"""
+        version = cache.get(VERSION_KEY)
+        if self.is_fresh(version):
+            return
+        with self.lock:
+            if not self.is_fresh(version):
+                self.load(version)
+    
+    def load(self, version):
+        if version is None:
+            cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(VERSION_KEY)
+        
+        # (key, starts mid-name, name length, id): a whole-name prefix beats a later word, shorter names first
+        entries = []
+        names = {}
+        for pk, name in Skill.objects.values_list('pk', 'name').iterator():
+            names[pk] = name
+            lowered = name.lower()
+            for position, char in enumerate(lowered):
+                if char.isalnum() and (position == 0 or not lowered[position - 1].isalnum()):
+                    entries.append((lowered[position:], position > 0, len(name), pk))
+        entries.sort()
+        
+        # Swap everything at once; searches in other threads keep their snapshot
+        self.keys, self.entries, self.names = [entry[0] for entry in entries], entries, names
+        self.version = version
+        self.loaded_at = time.monotonic()
+    
+    def search(self, query, limit):
+        self.refresh()
+        keys, entries, names = self.keys, self.entries, self.names
+        query = query.lower()
+        
+        best = {}
+        # Walk forward from the first key >= query; slicing would copy the rest of the index
+        for index in range(bisect.bisect_left(keys, query), len(entries)):
+            key, mid_name, length, pk = entries[index]
+            if not key.startswith(query):
+                break
+            rank = (mid_name, length, key)
+            if pk not in best or rank < best[pk]:
+                best[pk] = rank
+        return [{'id': pk, 'name': names[pk]} for pk in heapq.nsmallest(limit, best, key=best.get)]
+    
+    def invalidate(self):
+        cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+skill_index = SkillIndex()
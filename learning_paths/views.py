@@ -3,24 +3,36 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
 from .models import Skill, LearningPath, Step, UserLearningPath
-from .serializers import SkillSerializer, LearningPathSerializer, StepSerializer, UserLearningPathSerializer
+from .serializers import SkillBrowseSerializer, LearningPathSerializer, StepSerializer, UserLearningPathSerializer
 from users.permissions import IsOwnerOrReadOnly
+from users.tasks import award_xp
+from nyure_education.db_router import ReplicaReadMixin
+from nyure_education.typeahead import typeahead_params
+from .typeahead import skill_index
 from django.db.models import Q
 
-class SkillViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Skill.objects.all()
-    serializer_class = SkillSerializer
+class SkillViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Skill.objects.select_related('stats')
+    serializer_class = SkillBrowseSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['name', 'description', 'category']
-    ordering_fields = ['name', 'category', 'level']
+    replica_actions = ('list', 'retrieve', 'typeahead')
+    search_fields = ['name', 'description']
+    ordering_fields = ['name', 'stats__path_count', 'stats__resource_count', 'stats__job_count', 'stats__mentor_count']
+    
+    @action(detail=False, methods=['get'])
+    def typeahead(self, request):
+        """Top skill names matching ?q=, served from the in-memory index"""
+        query, limit = typeahead_params(request)
+        return Response(skill_index.search(query, limit) if query else [])
 
-class LearningPathViewSet(viewsets.ModelViewSet):
+class LearningPathViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     serializer_class = LearningPathSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description', 'category']
     ordering_fields = ['title', 'created_at', 'enrolled_count', 'average_rating']
+    ordering = ['-created_at']
     
     def get_queryset(self):
         user = self.request.user
@@ -140,16 +152,8 @@ class UserLearningPathViewSet(viewsets.ModelViewSet):
                 learning_path.completion_count += 1
                 learning_path.save()
                 
-                # Award XP to user
-                user = enrollment.user
-                user.xp_points += learning_path.xp_reward
-                
-                # Level up if needed (simple level calculation)
-                new_level = max(1, int(user.xp_points / 1000) + 1)
-                if new_level > user.level:
-                    user.level = new_level
-                
-                user.save()
+                # Award XP to user (levels up in the background task)
+                award_xp.delay(enrollment.user_id, learning_path.xp_reward, f'path:{enrollment.id}')
             else:
                 enrollment.status = 'in_progress'
         
@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from mentorship.matching import sync_active_mentee_count
+
+class Command(BaseCommand):
+    help = 'Recount active mentees for every mentor profile'
+    
+    def handle(self, *args, **options):
+        updated = sync_active_mentee_count()
+        self.stdout.write(self.style.SUCCESS(f'Synced active mentee counts for {updated} mentors.'))
@@ -0,0 +1,86 @@
+import heapq
+from collections import defaultdict
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from progress.models import UserSkill
+from .models import MentorProfile, Mentorship
+
+# How much a mentee still needs a skill, by their current proficiency
+NEED_WEIGHTS = {
+    'beginner': 1.0,
+    'intermediate': 0.7,
+    'advanced': 0.4,
+    'expert': 0.1,
+}
+
+# Relative weight of each ranking signal
+SKILL_WEIGHT = 0.6
+RATING_WEIGHT = 0.25
+CAPACITY_WEIGHT = 0.15
+
+def sync_active_mentee_count(mentor_id=None):
+    """Recount active mentorships in a single UPDATE, for one mentor or all of them"""
+    active = Mentorship.objects.filter(mentor_id=OuterRef('pk'), status='active')\
+        .values('mentor_id').annotate(total=Count('id')).values('total')
+    
+    mentors = MentorProfile.objects.all()
+    if mentor_id is not None:
+        mentors = mentors.filter(id=mentor_id)
+    return mentors.update(active_mentee_count=Coalesce(Subquery(active), Value(0)))
+
+def mentee_skill_needs(mentee, skill_ids=None):
+    """Map skill id -> need weight, from explicit skills or the mentee's own skill profile"""
+    if skill_ids:
+        return {int(skill_id): 1.0 for skill_id in skill_ids}
+    
+    rows = UserSkill.objects.filter(user=mentee).values_list('skill_id', 'proficiency')
+    return {skill_id: NEED_WEIGHTS.get(proficiency, 1.0) for skill_id, proficiency in rows}
+
+def available_mentors(exclude_user=None):
+    """Mentors that are available and still below their mentee limit"""
+    queryset = MentorProfile.objects.filter(is_available=True, active_mentee_count__lt=F('max_mentees'))
+    if exclude_user is not None:
+        queryset = queryset.exclude(user=exclude_user)
+    return queryset
+
+def rank_mentors(mentee, skill_ids=None, limit=10):
+    """
+    Rank available mentors for a mentee by weighted skill overlap, rating and remaining capacity.
+    Reads candidate stats and skill overlap in two queries and scores them in memory.
+    """
+    needs = mentee_skill_needs(mentee, skill_ids)
+    total_need = sum(needs.values())
+    candidates = available_mentors(exclude_user=mentee)
+    
+    # Overlap between each candidate's skills and the mentee's needs
+    overlap = defaultdict(float)
+    if needs:
+        pairs = MentorProfile.skills.through.objects.filter(
+            mentorprofile__in=candidates,
+            skill_id__in=needs.keys()
+        ).values_list('mentorprofile_id', 'skill_id')
+        for mentor_id, skill_id in pairs:
+            overlap[mentor_id] += needs[skill_id]
+    
+    scored = []
+    stats = candidates.values_list('id', 'rating', 'max_mentees', 'active_mentee_count')
+    for mentor_id, rating, max_mentees, active_count in stats:
+        if needs and not overlap[mentor_id]:
+            continue
+        
+        skill_score = overlap[mentor_id] / total_need if total_need else 0
+        rating_score = float(rating) / 5
+        capacity_score = (max_mentees - active_count) / max_mentees if max_mentees else 0
+        score = SKILL_WEIGHT * skill_score + RATING_WEIGHT * rating_score + CAPACITY_WEIGHT * capacity_score
+        scored.append((score, mentor_id))
+    
+    top = heapq.nlargest(limit, scored)
+    profiles = MentorProfile.objects.select_related('user').prefetch_related('skills')\
+        .in_bulk([mentor_id for _, mentor_id in top])
+    
+    ranked = []
+    for score, mentor_id in top:
+        profile = profiles[mentor_id]
+        profile.match_score = round(score * 100, 1)
+        ranked.append(profile)
+    return ranked
@@ -0,0 +1,94 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('mentorship', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('learning_paths', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mentorshiprequest',
+            name='mentee',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mentorship_requests', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='mentorshiprequest',
+            name='mentor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mentorship_requests', to='mentorship.mentorprofile'),
+        ),
+        migrations.AddField(
+            model_name='mentorshiprequest',
+            name='skills_seeking',
+            field=models.ManyToManyField(related_name='mentorship_requests', to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='mentorshipmessage',
+            name='mentorship',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='mentorship.mentorship'),
+        ),
+        migrations.AddField(
+            model_name='mentorshipmessage',
+            name='sender',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sent_mentorship_messages', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='mentorship',
+            name='mentee',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mentorships', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='mentorship',
+            name='mentor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mentorships', to='mentorship.mentorprofile'),
+        ),
+        migrations.AddField(
+            model_name='mentorship',
+            name='skills',
+            field=models.ManyToManyField(related_name='mentorships', to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='mentorreview',
+            name='mentorship',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='mentorship.mentorship'),
+        ),
+        migrations.AddField(
+            model_name='mentorprofile',
+            name='skills',
+            field=models.ManyToManyField(related_name='mentors', to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='mentorprofile',
+            name='user',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='mentor_profile', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='mentorshipmessage',
+            index=models.Index(fields=['mentorship', 'id'], name='mentorship_message_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentorshipmessage',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['mentorship', 'sender'], name='mentorship_message_unread_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='mentorship',
+            unique_together={('mentee', 'mentor')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='mentorreview',
+            unique_together={('mentorship',)},
+        ),
+        migrations.AddIndex(
+            model_name='mentorprofile',
+            index=models.Index(condition=models.Q(('is_available', True)), fields=['-rating'], name='mentorship_profile_avail_idx'),
+        ),
+    ]
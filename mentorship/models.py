@@ -21,10 +21,17 @@ class MentorProfile(models.Model):
     # Mentor statistics
     rating = models.DecimalField(max_digits=3, decimal_places=2, default=0)
     review_count = models.PositiveIntegerField(default=0)
+    active_mentee_count = models.PositiveIntegerField(default=0)  # Kept in sync by signals
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            # Only available mentors are listed or matched
+            models.Index(fields=['-rating'], condition=models.Q(is_available=True), name='mentorship_profile_avail_idx'),
+        ]
+    
     def __str__(self):
         return f"Mentor: {self.user.username}"
 
@@ -111,5 +118,13 @@ class MentorshipMessage(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            # History and long-poll both page a mentorship's messages by id
+            models.Index(fields=['mentorship', 'id'], name='mentorship_message_feed_idx'),
+            # Unread messages from the other participant (mark_read); read ones drop out
+            models.Index(fields=['mentorship', 'sender'], condition=models.Q(is_read=False), name='mentorship_message_unread_idx'),
+        ]
+    
     def __str__(self):
         return f"Message from {self.sender.username} in {self.mentorship}"
@@ -6,11 +6,12 @@ from learning_paths.serializers import SkillSerializer
 class MentorProfileSerializer(serializers.ModelSerializer):
     user = UserProfileSerializer(read_only=True)
     skills = SkillSerializer(many=True, read_only=True)
+    match_score = serializers.FloatField(read_only=True)
     
     class Meta:
         model = MentorProfile
         fields = '__all__'
-        read_only_fields = ('user', 'rating', 'review_count', 'created_at', 'updated_at')
+        read_only_fields = ('user', 'rating', 'review_count', 'active_mentee_count', 'created_at', 'updated_at')
 
 class MentorshipRequestSerializer(serializers.ModelSerializer):
     mentee = UserProfileSerializer(read_only=True)
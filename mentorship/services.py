@@ -0,0 +1,99 @@
+from django.db import transaction
+from django.utils import timezone
+from notifications.tasks import notify
+from .models import MentorProfile, MentorshipRequest, Mentorship
+
+class MentorshipError(Exception):
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+def transition_request(request_id, from_status, to_status, **ownership):
+    """
+    Move a request out of `from_status` with one conditional UPDATE.
+    Of several concurrent accept/reject/cancel calls exactly one matches the row.
+    """
+    updated = MentorshipRequest.objects.filter(pk=request_id, status=from_status, **ownership)\
+        .update(status=to_status, updated_at=timezone.now())
+    if updated:
+        return
+    
+    if not MentorshipRequest.objects.filter(pk=request_id, **ownership).exists():
+        raise MentorshipError('You are not part of this request.', status_code=403)
+    raise MentorshipError('This request has already been processed.', status_code=409)
+
+def lock_mentor(user):
+    """Lock the mentor's profile row; capacity checks and changes for one mentor run one at a time"""
+    try:
+        return MentorProfile.objects.select_for_update().get(user=user)
+    except MentorProfile.DoesNotExist:
+        raise MentorshipError('You do not have a mentor profile.', status_code=403)
+
+def ensure_capacity(mentor):
+    if mentor.active_mentee_count >= mentor.max_mentees:
+        raise MentorshipError('Mentor has no capacity for another mentee.', status_code=409)
+
+def accept_request(request_id, mentor_user):
+    """Accept a pending request and start (or restart) the mentorship, atomically"""
+    with transaction.atomic():
+        mentor = lock_mentor(mentor_user)
+        transition_request(request_id, 'pending', 'accepted', mentor=mentor)
+        ensure_capacity(mentor)
+        
+        mentorship_request = MentorshipRequest.objects.get(pk=request_id)
+        mentorship, created = Mentorship.objects.get_or_create(
+            mentee_id=mentorship_request.mentee_id,
+            mentor=mentor,
+            defaults={'goals': mentorship_request.message, 'start_date': timezone.now().date()}
+        )
+        if not created:
+            # Mentee and mentor were paired before; one row per pair, so restart it
+            if mentorship.status == 'active':
+                raise MentorshipError('This mentorship is already active.', status_code=409)
+            mentorship.status = 'active'
+            mentorship.goals = mentorship_request.message
+            mentorship.start_date = timezone.now().date()
+            mentorship.end_date = None
+            mentorship.save()
+        
+        # Saving the mentorship recounts active_mentee_count (see signals)
+        mentorship.skills.set(mentorship_request.skills_seeking.all())
+        
+        notify(
+            [mentorship_request.mentee_id], 'mentorship_accepted',
+            f'{mentor_user.username} accepted your mentorship request',
+            mentor_user.id, 'mentorship', mentorship.id
+        )
+    return mentorship
+
+def reject_request(request_id, mentor_user):
+    with transaction.atomic():
+        transition_request(request_id, 'pending', 'rejected', mentor__user=mentor_user)
+        mentorship_request = MentorshipRequest.objects.get(pk=request_id)
+        notify(
+            [mentorship_request.mentee_id], 'mentorship_rejected',
+            f'{mentor_user.username} rejected your mentorship request',
+            mentor_user.id, 'mentorship_request', mentorship_request.id
+        )
+    return mentorship_request
+
+def cancel_request(request_id, mentee):
+    transition_request(request_id, 'pending', 'cancelled', mentee=mentee)
+    return MentorshipRequest.objects.get(pk=request_id)
+
+def change_mentorship_status(mentorship_id, status_value):
+    """Change a mentorship's status, re-checking capacity when it becomes active again"""
+    with transaction.atomic():
+        mentorship = Mentorship.objects.select_related('mentor__user').get(pk=mentorship_id)
+        if status_value == 'active' and mentorship.status != 'active':
+            ensure_capacity(lock_mentor(mentorship.mentor.user))
+        
+        mentorship.status = status_value
+        
+        # If completed or terminated, set end date
+        if status_value in ['completed', 'terminated']:
+            mentorship.end_date = timezone.now().date()
+        
+        mentorship.save()
+    return mentorship
@@ -0,0 +1,9 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Mentorship
+from .matching import sync_active_mentee_count
+
+@receiver([post_save, post_delete], sender=Mentorship)
+def mentorship_changed(sender, instance, **kwargs):
+    """Keep the mentor's active mentee count in step with their mentorships"""
+    sync_active_mentee_count(instance.mentor_id)
@@ -0,0 +1,13 @@
+from django.db.models import Avg, Count
+from tasks.queue import task
+from .models import MentorProfile, MentorReview
+
+@task
+def update_mentor_rating(mentor_id):
+    """Recompute a mentor's rating and review count with one aggregate query"""
+    stats = MentorReview.objects.filter(mentorship__mentor_id=mentor_id)\
+        .aggregate(average=Avg('rating'), count=Count('id'))
+    MentorProfile.objects.filter(pk=mentor_id).update(
+        rating=round(stats['average'] or 0, 2),
+        review_count=stats['count']
+    )
@@ -3,7 +3,8 @@ from rest_framework.routers import DefaultRouter
 from rest_framework_nested import routers
 from .views import (
     MentorProfileViewSet, MentorshipRequestViewSet,
-    MentorshipViewSet, MentorReviewViewSet, MentorshipMessageViewSet
+    MentorshipViewSet, MentorReviewViewSet, MentorshipMessageViewSet,
+    poll_mentorship_messages
 )
 
 router = DefaultRouter()
@@ -17,6 +18,8 @@ mentorships_router = routers.NestedSimpleRouter(router, r'mentorships', lookup='
 mentorships_router.register(r'messages', MentorshipMessageViewSet, basename='mentorship-message')
 
 urlpatterns = [
+    # Async long-poll; listed first so the nested router doesn't read 'poll' as a message id
+    path('mentorships/<int:mentorship_pk>/messages/poll/', poll_mentorship_messages, name='mentorship-message-poll'),
     path('', include(router.urls)),
     path('', include(mentorships_router.urls)),
 ]
@@ -1,17 +1,27 @@
-from rest_framework import viewsets, permissions, status, filters
+from rest_framework import viewsets, permissions, serializers, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.utils import timezone
+from django.db.models import F, Q
+from django.http import JsonResponse
 from .models import MentorProfile, MentorshipRequest, Mentorship, MentorReview, MentorshipMessage
 from .serializers import (
     MentorProfileSerializer, MentorshipRequestSerializer,
     MentorshipSerializer, MentorReviewSerializer, MentorshipMessageSerializer
 )
+from .matching import rank_mentors
+from .tasks import update_mentor_rating
+from .services import (
+    MentorshipError, accept_request, reject_request, cancel_request, change_mentorship_status
+)
 from users.permissions import IsOwnerOrReadOnly
+from nyure_education.db_router import ReplicaReadMixin
+from nyure_education.typeahead import top_matches, typeahead_params
+from nyure_education.async_api import POLL_LIMIT, async_get_view, poll_params, long_poll, serialize
 
-class MentorProfileViewSet(viewsets.ModelViewSet):
+class MentorProfileViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     serializer_class = MentorProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    replica_actions = ('list', 'retrieve', 'match', 'typeahead')
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['user__username', 'user__email', 'expertise']
     ordering_fields = ['rating', 'review_count', 'years_of_experience']
@@ -19,6 +29,10 @@ class MentorProfileViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = MentorProfile.objects.filter(is_available=True)
         
+        # Only list mentors who can still take on mentees
+        if self.action == 'list':
+            queryset = queryset.filter(active_mentee_count__lt=F('max_mentees'))
+        
         # Filter by skills
         skills = self.request.query_params.getlist('skill')
         if skills:
@@ -37,6 +51,24 @@ class MentorProfileViewSet(viewsets.ModelViewSet):
             return Response(serializer.data)
         except MentorProfile.DoesNotExist:
             return Response({'detail': 'Mentor profile not found.'}, status=status.HTTP_404_NOT_FOUND)
+    
+    @action(detail=False, methods=['get'])
+    def match(self, request):
+        """Rank available mentors for the current user by skill overlap, rating and capacity"""
+        skills = [skill for skill in request.query_params.getlist('skill') if skill.isdigit()]
+        limit = request.query_params.get('limit', '10')
+        limit = min(50, int(limit)) if limit.isdigit() else 10
+        
+        mentors = rank_mentors(request.user, skill_ids=skills, limit=limit)
+        serializer = MentorProfileSerializer(mentors, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def typeahead(self, request):
+        """Available mentors whose username matches ?q= (3+ characters)"""
+        query, limit = typeahead_params(request)
+        mentors = MentorProfile.objects.filter(is_available=True).values('id', username=F('user__username'))
+        return Response(top_matches(mentors, 'user__username', query, limit))
 
 class MentorshipRequestViewSet(viewsets.ModelViewSet):
     serializer_class = MentorshipRequestSerializer
@@ -60,40 +92,24 @@ class MentorshipRequestViewSet(viewsets.ModelViewSet):
         mentor_id = self.request.data.get('mentor_id')
         try:
             mentor = MentorProfile.objects.get(id=mentor_id)
-            serializer.save(mentee=self.request.user, mentor=mentor)
         except MentorProfile.DoesNotExist:
             raise serializers.ValidationError({'mentor_id': 'Mentor profile not found.'})
+        
+        # One open request per mentee and mentor
+        if MentorshipRequest.objects.filter(mentee=self.request.user, mentor=mentor, status='pending').exists():
+            raise serializers.ValidationError({'mentor_id': 'You already have a pending request with this mentor.'})
+        
+        serializer.save(mentee=self.request.user, mentor=mentor)
     
     @action(detail=True, methods=['post'])
     def accept(self, request, pk=None):
         mentorship_request = self.get_object()
         
-        # Check if the user is the mentor
+        # Lock the mentor, move the request out of pending and start the mentorship in one transaction
         try:
-            mentor_profile = MentorProfile.objects.get(user=request.user)
-            if mentorship_request.mentor != mentor_profile:
-                return Response({'detail': 'You are not the mentor for this request.'}, status=status.HTTP_403_FORBIDDEN)
-        except MentorProfile.DoesNotExist:
-            return Response({'detail': 'You do not have a mentor profile.'}, status=status.HTTP_403_FORBIDDEN)
-        
-        # Check if the request is pending
-        if mentorship_request.status != 'pending':
-            return Response({'detail': 'This request has already been processed.'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Update request status
-        mentorship_request.status = 'accepted'
-        mentorship_request.save()
-        
-        # Create mentorship
-        mentorship = Mentorship.objects.create(
-            mentee=mentorship_request.mentee,
-            mentor=mentorship_request.mentor,
-            goals=mentorship_request.message,
-            start_date=timezone.now().date()
-        )
-        
-        # Add skills to mentorship
-        mentorship.skills.set(mentorship_request.skills_seeking.all())
+            mentorship = accept_request(mentorship_request.pk, request.user)
+        except MentorshipError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
         
         serializer = MentorshipSerializer(mentorship)
         return Response(serializer.data)
@@ -102,21 +118,10 @@ class MentorshipRequestViewSet(viewsets.ModelViewSet):
     def reject(self, request, pk=None):
         mentorship_request = self.get_object()
         
-        # Check if the user is the mentor
         try:
-            mentor_profile = MentorProfile.objects.get(user=request.user)
-            if mentorship_request.mentor != mentor_profile:
-                return Response({'detail': 'You are not the mentor for this request.'}, status=status.HTTP_403_FORBIDDEN)
-        except MentorProfile.DoesNotExist:
-            return Response({'detail': 'You do not have a mentor profile.'}, status=status.HTTP_403_FORBIDDEN)
-        
-        # Check if the request is pending
-        if mentorship_request.status != 'pending':
-            return Response({'detail': 'This request has already been processed.'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Update request status
-        mentorship_request.status = 'rejected'
-        mentorship_request.save()
+            mentorship_request = reject_request(mentorship_request.pk, request.user)
+        except MentorshipError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
         
         serializer = MentorshipRequestSerializer(mentorship_request)
         return Response(serializer.data)
@@ -125,17 +130,10 @@ class MentorshipRequestViewSet(viewsets.ModelViewSet):
     def cancel(self, request, pk=None):
         mentorship_request = self.get_object()
         
-        # Check if the user is the mentee
-        if mentorship_request.mentee != request.user:
-            return Response({'detail': 'You are not the mentee for this request.'}, status=status.HTTP_403_FORBIDDEN)
-        
-        # Check if the request is pending
-        if mentorship_request.status != 'pending':
-            return Response({'detail': 'This request has already been processed.'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Update request status
-        mentorship_request.status = 'cancelled'
-        mentorship_request.save()
+        try:
+            mentorship_request = cancel_request(mentorship_request.pk, request.user)
+        except MentorshipError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
         
         serializer = MentorshipRequestSerializer(mentorship_request)
         return Response(serializer.data)
@@ -171,14 +169,11 @@ class MentorshipViewSet(viewsets.ModelViewSet):
         if status_value not in dict(Mentorship.status.field.choices).keys():
             return Response({'detail': 'Invalid status value.'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Update status
-        mentorship.status = status_value
-        
-        # If completed or terminated, set end date
-        if status_value in ['completed', 'terminated']:
-            mentorship.end_date = timezone.now().date()
-        
-        mentorship.save()
+        # Update status (reactivating checks the mentor's capacity)
+        try:
+            mentorship = change_mentorship_status(mentorship.pk, status_value)
+        except MentorshipError as exc:
+            return Response({'detail': exc.message}, status=exc.status_code)
         
         serializer = MentorshipSerializer(mentorship)
         return Response(serializer.data)
@@ -210,18 +205,14 @@ class MentorReviewViewSet(viewsets.ModelViewSet):
         review = serializer.save(mentorship=mentorship)
         
         # Update mentor rating
-        mentor = mentorship.mentor
-        reviews = MentorReview.objects.filter(mentorship__mentor=mentor)
-        total_rating = sum(r.rating for r in reviews)
-        mentor.rating = total_rating / reviews.count()
-        mentor.review_count = reviews.count()
-        mentor.save()
+        update_mentor_rating.delay(mentorship.mentor_id)
         
         return review
 
 class MentorshipMessageViewSet(viewsets.ModelViewSet):
     serializer_class = MentorshipMessageSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scopes = {'create': 'message'}
     
     def get_queryset(self):
         user = self.request.user
@@ -234,7 +225,7 @@ class MentorshipMessageViewSet(viewsets.ModelViewSet):
             if mentorship.mentee != user and mentorship.mentor.user != user:
                 return MentorshipMessage.objects.none()
             
-            return MentorshipMessage.objects.filter(mentorship=mentorship).order_by('created_at')
+            return MentorshipMessage.objects.filter(mentorship=mentorship).order_by('id')
         except Mentorship.DoesNotExist:
             return MentorshipMessage.objects.none()
     
@@ -276,3 +267,22 @@ class MentorshipMessageViewSet(viewsets.ModelViewSet):
             return Response({'detail': f'Marked {messages.count()} messages as read.'})
         except Mentorship.DoesNotExist:
             return Response({'detail': 'Mentorship not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+@async_get_view
+async def poll_mentorship_messages(request, mentorship_pk):
+    """
+    Async message feed: messages after ?after=<id>, oldest first. With ?wait=<seconds>
+    the request is held open until one arrives, without tying up a worker under ASGI.
+    """
+    user_id = request.user.pk
+    is_participant = await Mentorship.objects.filter(
+        Q(mentee_id=user_id) | Q(mentor__user_id=user_id), pk=mentorship_pk
+    ).aexists()
+    if not is_participant:
+        return JsonResponse({'detail': 'Mentorship not found.'}, status=404)
+    
+    after, wait = poll_params(request)
+    messages = MentorshipMessage.objects.filter(mentorship_id=mentorship_pk, id__gt=after)\
+        .select_related('sender').order_by('id')[:POLL_LIMIT]
+    rows = await long_poll(messages, wait)
+    return JsonResponse({'results': await serialize(MentorshipMessageSerializer, rows)})
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb', models.CharField(choices=[('forum_reply', 'Forum Reply'), ('mentorship_request', 'Mentorship Request'), ('mentorship_accepted', 'Mentorship Accepted'), ('mentorship_rejected', 'Mentorship Rejected'), ('message', 'New Message'), ('application_status', 'Application Status'), ('achievement', 'Achievement Unlocked')], max_length=50)),
+                ('message', models.CharField(max_length=255)),
+                ('target_type', models.CharField(blank=True, max_length=50)),
+                ('target_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('is_read', models.BooleanField(default=False)),
+                ('emailed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
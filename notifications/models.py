@@ -0,0 +1,48 @@
+from django.db import models
+from users.models import User
+
+class Notification(models.Model):
+    """In-app notification, also collected into periodic email digests"""
+    VERB_CHOICES = [
+        ('forum_reply', 'Forum Reply'),
+        ('mentorship_request', 'Mentorship Request'),
+        ('mentorship_accepted', 'Mentorship Accepted'),
+        ('mentorship_rejected', 'Mentorship Rejected'),
+        ('message', 'New Message'),
+        ('application_status', 'Application Status'),
+        ('achievement', 'Achievement Unlocked'),
+    ]
+    
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    verb = models.CharField(max_length=50, choices=VERB_CHOICES)
+    message = models.CharField(max_length=255)
+    
+    # What the notification points at, e.g. ('forum_topic', 12)
+    target_type = models.CharField(max_length=50, blank=True)
+    target_id = models.PositiveIntegerField(null=True, blank=True)
+    
+    is_read = models.BooleanField(default=False)
+    emailed_at = models.DateTimeField(null=True, blank=True)  # Set once included in a digest
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['recipient', '-created_at'], name='notif_feed_idx'),
+            # Unread badge and unread feed only touch unread rows
+            models.Index(
+                fields=['recipient', '-created_at'],
+                name='notif_unread_idx',
+                condition=models.Q(is_read=False)
+            ),
+            # Digest scan only touches rows not yet emailed
+            models.Index(
+                fields=['recipient', 'created_at'],
+                name='notif_digest_idx',
+                condition=models.Q(is_read=False, emailed_at__isnull=True)
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.recipient.username}: {self.message}"
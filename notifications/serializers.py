@@ -0,0 +1,11 @@
+from rest_framework import serializers
+from .models import Notification
+from users.serializers import UserProfileSerializer
+
+class NotificationSerializer(serializers.ModelSerializer):
+    actor = UserProfileSerializer(read_only=True)
+    
+    class Meta:
+        model = Notification
+        fields = ('id', 'actor', 'verb', 'message', 'target_type', 'target_id', 'is_read', 'created_at')
+        read_only_fields = fields
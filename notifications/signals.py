@@ -0,0 +1,62 @@
+from django.db.models.signals import pre_save, post_save
+from django.dispatch import receiver
+from forums.models import ForumPost, StudyGroupMessage
+from jobs.models import JobApplication
+from mentorship.models import MentorshipRequest, MentorshipMessage
+from progress.models import UserAchievement
+from .tasks import (
+    notify_topic_reply, notify_study_group_message, notify_mentorship_message,
+    notify_mentorship_request, notify_application_status, notify_achievement
+)
+
+# Receivers only queue work with ids; recipients are resolved, texts built and rows written by the worker
+
+def remember_status(sender, instance, update_fields=None, **kwargs):
+    """
+    Stash the stored status so post_save can tell whether it changed. Saves whose
+    update_fields leave out `status` cannot change it and skip the lookup.
+    """
+    if instance.pk and (update_fields is None or 'status' in update_fields):
+        instance._previous_status = sender.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+    else:
+        instance._previous_status = instance.status
+
+pre_save.connect(remember_status, sender=MentorshipRequest, dispatch_uid='notifications:mentorship_request_status')
+pre_save.connect(remember_status, sender=JobApplication, dispatch_uid='notifications:job_application_status')
+
+def status_changed(instance):
+    return getattr(instance, '_previous_status', instance.status) != instance.status
+
+@receiver(post_save, sender=ForumPost)
+def forum_post_created(sender, instance, created, **kwargs):
+    if created:
+        notify_topic_reply.delay(instance.id)
+
+@receiver(post_save, sender=StudyGroupMessage)
+def study_group_message_created(sender, instance, created, **kwargs):
+    if created:
+        notify_study_group_message.delay(instance.id)
+
+@receiver(post_save, sender=MentorshipMessage)
+def mentorship_message_created(sender, instance, created, **kwargs):
+    if created:
+        notify_mentorship_message.delay(instance.id)
+
+@receiver(post_save, sender=MentorshipRequest)
+def mentorship_request_saved(sender, instance, created, **kwargs):
+    if created:
+        notify_mentorship_request.delay(instance.id, 'pending')
+    elif status_changed(instance) and instance.status in ('accepted', 'rejected'):
+        notify_mentorship_request.delay(instance.id, instance.status)
+
+@receiver(post_save, sender=JobApplication)
+def job_application_saved(sender, instance, created, **kwargs):
+    # Applicants already know about the statuses they set themselves
+    if created or not status_changed(instance) or instance.status == 'withdrawn':
+        return
+    notify_application_status.delay(instance.id, instance.status)
+
+@receiver(post_save, sender=UserAchievement)
+def achievement_unlocked(sender, instance, created, **kwargs):
+    if created:
+        notify_achievement.delay(instance.id)
@@ -0,0 +1,215 @@
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+from tasks.queue import task, periodic_task
+from users.models import User
+from forums.models import ForumPost, StudyGroupMember, StudyGroupMessage
+from jobs.models import JobApplication
+from mentorship.models import MentorshipRequest, MentorshipMessage
+from progress.models import UserAchievement
+from .models import Notification
+
+logger = logging.getLogger(__name__)
+
+# Rows written per INSERT when fanning out
+BATCH_SIZE = 500
+
+# Recipients emailed per SMTP connection; each batch is marked as emailed once it is sent
+DIGEST_BATCH_SIZE = 100
+
+# Items listed in one digest email before "and N more"
+DIGEST_ITEMS = 10
+
+def recipients(recipient_ids, actor_id=None):
+    return [pk for pk in set(recipient_ids) if pk != actor_id]
+
+def notify(recipient_ids, verb, message, actor_id=None, target_type='', target_id=None):
+    """Queue notifications for the given users; the writes happen in the worker"""
+    recipient_ids = recipients(recipient_ids, actor_id)
+    if recipient_ids:
+        fan_out.delay(recipient_ids, verb, message, actor_id, target_type, target_id)
+
+@task
+def fan_out(recipient_ids, verb, message, actor_id=None, target_type='', target_id=None):
+    """Write one notification per recipient in batched INSERTs"""
+    for start in range(0, len(recipient_ids), BATCH_SIZE):
+        Notification.objects.bulk_create([
+            Notification(
+                recipient_id=recipient_id,
+                actor_id=actor_id,
+                verb=verb,
+                message=message[:255],
+                target_type=target_type,
+                target_id=target_id
+            )
+            for recipient_id in recipient_ids[start:start + BATCH_SIZE]
+        ])
+
+@task
+def notify_topic_reply(post_id):
+    """Notify the topic author and everyone who has posted in the topic"""
+    post = ForumPost.objects.select_related('topic', 'author').filter(pk=post_id).first()
+    if post is None:
+        return
+    
+    topic = post.topic
+    participant_ids = set(
+        ForumPost.objects.filter(topic_id=topic.id).values_list('author_id', flat=True).distinct()
+    )
+    participant_ids.add(topic.author_id)
+    participant_ids.discard(post.author_id)
+    fan_out(
+        list(participant_ids), 'forum_reply',
+        f'{post.author.username} replied to "{topic.title}"',
+        post.author_id, 'forum_topic', topic.id
+    )
+
+@task
+def notify_study_group_message(message_id):
+    """Notify every other member of the study group"""
+    message = StudyGroupMessage.objects.select_related('study_group', 'sender').filter(pk=message_id).first()
+    if message is None:
+        return
+    
+    member_ids = list(
+        StudyGroupMember.objects.filter(study_group_id=message.study_group_id)
+        .exclude(user_id=message.sender_id)
+        .values_list('user_id', flat=True)
+    )
+    fan_out(
+        member_ids, 'message',
+        f'{message.sender.username} posted in {message.study_group.name}',
+        message.sender_id, 'study_group', message.study_group_id
+    )
+
+@task
+def notify_mentorship_message(message_id):
+    """Notify the other side of the mentorship"""
+    message = MentorshipMessage.objects.select_related('mentorship__mentor', 'sender')\
+        .filter(pk=message_id).first()
+    if message is None:
+        return
+    
+    mentorship = message.mentorship
+    fan_out(
+        recipients([mentorship.mentee_id, mentorship.mentor.user_id], message.sender_id), 'message',
+        f'New message from {message.sender.username}',
+        message.sender_id, 'mentorship', mentorship.id
+    )
+
+@task
+def notify_mentorship_request(request_id, status):
+    """Tell the mentor about a new request, or the mentee that it was accepted or rejected"""
+    mentorship_request = MentorshipRequest.objects.select_related('mentor__user', 'mentee')\
+        .filter(pk=request_id).first()
+    if mentorship_request is None:
+        return
+    
+    mentor = mentorship_request.mentor.user
+    if status == 'pending':
+        fan_out(
+            [mentor.id], 'mentorship_request',
+            f'{mentorship_request.mentee.username} requested you as a mentor',
+            mentorship_request.mentee_id, 'mentorship_request', mentorship_request.id
+        )
+    else:
+        fan_out(
+            [mentorship_request.mentee_id], f'mentorship_{status}',
+            f'{mentor.username} {status} your mentorship request',
+            mentor.id, 'mentorship_request', mentorship_request.id
+        )
+
+@task
+def notify_application_status(application_id, status):
+    application = JobApplication.objects.select_related('job_listing').filter(pk=application_id).first()
+    if application is None:
+        return
+    
+    status_display = dict(JobApplication._meta.get_field('status').choices).get(status, status)
+    fan_out(
+        [application.user_id], 'application_status',
+        f'Your application for {application.job_listing.title} is now {status_display}',
+        None, 'job_application', application.id
+    )
+
+@task
+def notify_achievement(user_achievement_id):
+    unlocked = UserAchievement.objects.select_related('achievement').filter(pk=user_achievement_id).first()
+    if unlocked is None:
+        return
+    
+    fan_out(
+        [unlocked.user_id], 'achievement',
+        f'Achievement unlocked: {unlocked.achievement.title}',
+        None, 'achievement', unlocked.achievement_id
+    )
+
+def digest_body(user, items, total):
+    lines = [f'Hi {user.first_name or user.username},', '', 'Here is what you missed:', '']
+    lines += [f'- {item.message}' for item in items]
+    if total > len(items):
+        lines.append(f'...and {total - len(items)} more.')
+    lines += ['', 'You can turn these emails off in your profile settings.']
+    return '\n'.join(lines)
+
+def pending_digest_items():
+    return Notification.objects.filter(
+        is_read=False,
+        emailed_at__isnull=True,
+        recipient__receive_notifications=True
+    )
+
+def digest_email(user, notifications):
+    count = len(notifications)
+    return EmailMessage(
+        f'You have {count} new notification{"s" if count != 1 else ""}',
+        digest_body(user, notifications[:DIGEST_ITEMS], count),
+        settings.DEFAULT_FROM_EMAIL,
+        [user.email]
+    )
+
+def send_digest_batch(recipient_ids):
+    """Email one batch of recipients over one connection; returns the ids of the notifications sent"""
+    by_recipient = defaultdict(list)
+    pending = pending_digest_items().filter(recipient_id__in=recipient_ids)\
+        .order_by('recipient_id', '-created_at').only('id', 'recipient_id', 'message')
+    for notification in pending:
+        by_recipient[notification.recipient_id].append(notification)
+    users = User.objects.in_bulk(list(by_recipient))
+    
+    sent = []
+    connection = get_connection()
+    try:
+        connection.open()
+        for user_id, notifications in by_recipient.items():
+            user = users.get(user_id)
+            if user is not None and user.email:
+                connection.send_messages([digest_email(user, notifications)])
+            # Users without an address are marked too, so they are not rescanned every hour
+            sent.extend(notification.id for notification in notifications)
+    except Exception:
+        # Whatever was not sent stays pending for the next run
+        logger.exception('Digest batch failed after %s notifications', len(sent))
+    finally:
+        connection.close()
+    return sent
+
+@periodic_task(every=timedelta(hours=1))
+def send_digests():
+    """Email each opted-in user one summary of their unread, un-emailed notifications"""
+    last_recipient = 0
+    while True:
+        recipient_ids = list(
+            pending_digest_items().filter(recipient_id__gt=last_recipient)
+            .order_by('recipient_id').values_list('recipient_id', flat=True).distinct()[:DIGEST_BATCH_SIZE]
+        )
+        if not recipient_ids:
+            return
+        last_recipient = recipient_ids[-1]
+        
+        sent = send_digest_batch(recipient_ids)
+        for start in range(0, len(sent), BATCH_SIZE):
+            Notification.objects.filter(id__in=sent[start:start + BATCH_SIZE]).update(emailed_at=timezone.now())
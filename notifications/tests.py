@@ -0,0 +1,39 @@
+import datetime
+from unittest import mock
+from django.test import TestCase
+from jobs.models import Company, JobApplication, JobListing
+from users.models import User
+
+class ApplicationStatusNotificationTests(TestCase):
+    """Employers' status changes notify the applicant however the application is saved"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username='applicant', email='applicant@example.com', password='x')
+        company = Company.objects.create(name='Acme', description='', industry='', location='')
+        listing = JobListing.objects.create(
+            title='Engineer', description='', company=company, job_type='full_time', location='',
+            experience_level='entry', education_level='none', expires_at=datetime.date(2100, 1, 1)
+        )
+        cls.application = JobApplication.objects.create(
+            user=user, job_listing=listing, cover_letter='Hello', resume='resumes/cv.pdf'
+        )
+    
+    def save(self, status, **kwargs):
+        application = JobApplication.objects.get(pk=self.application.pk)
+        application.status = status
+        with mock.patch('notifications.signals.notify_application_status') as notify:
+            application.save(**kwargs)
+        return notify.delay
+    
+    def test_full_save_notifies(self):
+        self.save('interview').assert_called_once_with(self.application.pk, 'interview')
+    
+    def test_save_listing_status_notifies(self):
+        self.save('offer', update_fields=['status']).assert_called_once_with(self.application.pk, 'offer')
+    
+    def test_unchanged_status_does_not_notify(self):
+        self.save('applied').assert_not_called()
+    
+    def test_withdrawal_does_not_notify(self):
+        self.save('withdrawn').assert_not_called()
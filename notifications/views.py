@@ -0,0 +1,34 @@
+from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .models import Notification
+from .serializers import NotificationSerializer
+
+class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = NotificationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        queryset = Notification.objects.filter(recipient=self.request.user).select_related('actor')
+        
+        # Unread feed (served by the partial unread index)
+        unread = self.request.query_params.get('unread')
+        if unread is not None:
+            queryset = queryset.filter(is_read=unread.lower() != 'true')
+        
+        return queryset
+    
+    @action(detail=False, methods=['get'])
+    def unread_count(self, request):
+        count = Notification.objects.filter(recipient=request.user, is_read=False).count()
+        return Response({'unread_count': count})
+    
+    @action(detail=True, methods=['post'])
+    def mark_read(self, request, pk=None):
+        Notification.objects.filter(pk=pk, recipient=request.user).update(is_read=True)
+        return Response({'detail': 'Notification marked as read.'})
+    
+    @action(detail=False, methods=['post'])
+    def mark_all_read(self, request):
+        updated = Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
+        return Response({'detail': f'{updated} notifications marked as read.'})
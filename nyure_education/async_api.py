@@ -0,0 +1,66 @@
+import asyncio
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponseNotAllowed, JsonResponse
+from rest_framework.exceptions import APIException
+from users.authentication import StatelessJWTAuthentication
+
+# Longest a client may hold a long-poll open, in seconds
+MAX_WAIT = 25
+
+# Rows returned per poll
+POLL_LIMIT = 100
+
+def async_get_view(view):
+    """
+    Wrap an async GET endpoint: refuse other methods, then authenticate with
+    the API's bearer token and set request.user. (Django's own view
+    decorators only learned to wrap async views in 5.0.)
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != 'GET':
+            return HttpResponseNotAllowed(['GET'])
+        
+        try:
+            result = await sync_to_async(StatelessJWTAuthentication().authenticate)(request)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, dict) else {'detail': exc.detail}
+            return JsonResponse(detail, status=exc.status_code)
+        if result is None:
+            return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+        
+        request.user = result[0]
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+def poll_params(request):
+    """?after=<last id seen> and ?wait=<seconds to hold the request open if nothing is new>"""
+    after = request.GET.get('after', '')
+    wait = request.GET.get('wait', '')
+    return (
+        int(after) if after.isdigit() else 0,
+        min(int(wait), MAX_WAIT) if wait.isdigit() else 0
+    )
+
+async def long_poll(queryset, wait):
+    """
+    Evaluate the queryset until it returns rows or `wait` seconds pass. The
+    database connection is closed while sleeping, so idle waiters hold none.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    interval = getattr(settings, 'LONG_POLL_INTERVAL', 2)
+    while True:
+        rows = [row async for row in queryset.all()]
+        remaining = deadline - loop.time()
+        if rows or remaining <= 0:
+            return rows
+        
+        await sync_to_async(connections.close_all)()
+        await asyncio.sleep(min(interval, remaining))
+
+async def serialize(serializer_class, rows):
+    return await sync_to_async(lambda: serializer_class(rows, many=True).data)()
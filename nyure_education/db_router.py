@@ -0,0 +1,152 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.utils.decorators import sync_and_async_middleware
+from rest_framework.permissions import SAFE_METHODS
+
+# True while the current request may read from a replica (set by ReplicaReadMixin)
+use_replica = ContextVar('use_replica', default=False)
+
+# Seconds between replication lag checks of one replica, per process
+LAG_CHECK_INTERVAL = 5
+
+# alias -> (checked at, fresh enough to read from)
+replica_health = {}
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias.startswith('replica')]
+
+def replica_is_fresh(alias):
+    """Whether the replica is within REPLICA_MAX_LAG_SECONDS of the primary (always true off PostgreSQL)"""
+    connection = connections[alias]
+    max_lag = getattr(settings, 'REPLICA_MAX_LAG_SECONDS', None)
+    if max_lag is None or connection.vendor != 'postgresql':
+        return True
+    
+    now = time.monotonic()
+    checked = replica_health.get(alias)
+    if checked and now - checked[0] < LAG_CHECK_INTERVAL:
+        return checked[1]
+    
+    try:
+        with connection.cursor() as cursor:
+            # A replica that has replayed everything it received is caught up, however old its last commit
+            cursor.execute(
+                'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+                'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END'
+            )
+            fresh = cursor.fetchone()[0] <= max_lag
+    except DatabaseError:
+        fresh = False
+    replica_health[alias] = (now, fresh)
+    return fresh
+
+@contextmanager
+def read_from_replica():
+    token = use_replica.set(True)
+    try:
+        yield
+    finally:
+        use_replica.reset(token)
+
+def pin_key(user_id):
+    return f'db-pin:{user_id}'
+
+def pin_to_primary(user_id):
+    cache.set(pin_key(user_id), 1, timeout=getattr(settings, 'REPLICA_STICKY_SECONDS', 5))
+
+async def apin_to_primary(user_id):
+    await cache.aset(pin_key(user_id), 1, timeout=getattr(settings, 'REPLICA_STICKY_SECONDS', 5))
+
+def is_pinned(user):
+    return bool(user and user.is_authenticated and cache.get(pin_key(user.pk)))
+
+class ReplicaRouter:
+    """
+    Reads go to a replica only inside read_from_replica() (read-only API
+    actions), never inside a transaction, and only to replicas that keep up.
+    Everything else, including every write, uses the primary.
+    """
+    
+    def db_for_read(self, model, **hints):
+        if not use_replica.get() or connections['default'].in_atomic_block:
+            return 'default'
+        fresh = [alias for alias in replica_aliases() if replica_is_fresh(alias)]
+        return random.choice(fresh) if fresh else 'default'
+    
+    def db_for_write(self, model, **hints):
+        return 'default'
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+    
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
+
+def written_by(request, response):
+    """Id of the authenticated user whose successful write this response reports, if any"""
+    if request.method in SAFE_METHODS or response.status_code >= 400 or not replica_aliases():
+        return None
+    # DRF copies the authenticated user onto the underlying request
+    user = getattr(request, 'user', None)
+    return user.pk if user is not None and user.is_authenticated else None
+
+@sync_and_async_middleware
+class ReplicaStickinessMiddleware:
+    """
+    After a successful write, keep the user's reads on the primary for
+    REPLICA_STICKY_SECONDS, so they never read a replica that hasn't caught
+    up with their own change. Runs on the event loop under ASGI.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+    
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        user_id = written_by(request, response)
+        if user_id is not None:
+            pin_to_primary(user_id)
+        return response
+    
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if request.method in SAFE_METHODS:
+            return response
+        # request.user may still be the lazy session user, which queries
+        user_id = await sync_to_async(written_by)(request, response)
+        if user_id is not None:
+            await apin_to_primary(user_id)
+        return response
+
+class ReplicaReadMixin:
+    """
+    Viewset mixin running the actions in `replica_actions` against a replica,
+    unless the user wrote something in the last few seconds
+    """
+    replica_actions = ('list', 'retrieve')
+    
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not replica_aliases() or request.method not in SAFE_METHODS or self.action not in self.replica_actions:
+            return
+        if not is_pinned(request.user):
+            self._replica_token = use_replica.set(True)
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_replica_token', None)
+        if token is not None:
+            use_replica.reset(token)
+            self._replica_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
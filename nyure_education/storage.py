@@ -0,0 +1,176 @@
+import hashlib
+import os
+import posixpath
+import re
+from datetime import timedelta
+from functools import lru_cache
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import connection, models
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+try:
+    from storages.backends.s3boto3 import S3Boto3Storage
+except ImportError:  # django-storages is only needed when MEDIA_STORAGE=s3
+    S3Boto3Storage = None
+
+# Names written by the content-addressed storages end in the file's SHA-256
+HASHED_NAME_RE = re.compile(r'(?:^|/)[0-9a-f]{64}(?:\.[A-Za-z0-9]+)?$')
+
+# Content-addressed files never change, so caches may keep them forever
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def content_digest(content):
+    """SHA-256 of an uploaded file, read in chunks so large files are never held in memory"""
+    digest = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return digest.hexdigest()
+
+def is_content_addressed(name):
+    return bool(HASHED_NAME_RE.search(name or ''))
+
+def file_fields():
+    """(model, field name, variants JSON field or None) for every file field in the project"""
+    fields = []
+    for model in apps.get_models():
+        names = {field.name for field in model._meta.get_fields()}
+        for field in model._meta.get_fields():
+            if isinstance(field, models.FileField):
+                variants = f'{field.name}_variants'
+                fields.append((model, field, variants if variants in names else None))
+    return fields
+
+def is_referenced(name):
+    """Whether any row still points at a stored name, as a file or as one of its image variants"""
+    for model, field, variants in file_fields():
+        if not name.startswith(field.upload_to):
+            continue
+        if model._default_manager.filter(**{field.name: name}).exists():
+            return True
+        if not variants:
+            continue
+        if connection.features.supports_json_field_contains:
+            lookup = {f'{variants}__variants__contains': [{'name': name}]}
+        else:
+            # SQLite has no JSON containment; hashed names cannot collide as substrings
+            lookup = {f'{variants}__icontains': name}
+        if model._default_manager.filter(**lookup).exists():
+            return True
+    return False
+
+class ContentAddressedMixin:
+    """
+    Stores each distinct file once under `<upload_to>/<aa>/<sha256><ext>`.
+    Saving content that is already stored costs one existence check and no write.
+    
+    Deleting is left to the orphan sweep: a save() may have just found the file
+    and be about to commit a row pointing at it, which a delete here could not see.
+    """
+    
+    def content_addressed_name(self, name, content):
+        if is_content_addressed(name):
+            return name
+        directory, filename = posixpath.split(name.replace('\\', '/'))
+        extension = os.path.splitext(filename)[1].lower()
+        digest = content_digest(content)
+        return posixpath.join(directory, digest[:2], f'{digest}{extension}')
+    
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        
+        name = self.content_addressed_name(name, content)
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length=max_length)
+    
+    def delete(self, name):
+        if not is_content_addressed(name):
+            super().delete(name)
+    
+    def purge(self, name):
+        """Delete a content-addressed file unless a row refers to it; see orphaned_media"""
+        if not is_referenced(name):
+            super().delete(name)
+
+class LocalMediaStorage(ContentAddressedMixin, FileSystemStorage):
+    """Content-addressed media on the local filesystem (MEDIA_ROOT)"""
+
+class LocalScratchStorage(FileSystemStorage):
+    """Temporary objects (e.g. upload chunks) kept under their own names in MEDIA_ROOT"""
+
+if S3Boto3Storage is not None:
+    class S3MediaStorage(ContentAddressedMixin, S3Boto3Storage):
+        """Content-addressed media in an S3-compatible bucket (AWS, MinIO, R2...)"""
+        
+        def get_object_parameters(self, name):
+            params = super().get_object_parameters(name)
+            if is_content_addressed(name):
+                params.setdefault('CacheControl', IMMUTABLE_CACHE_CONTROL)
+            return params
+        
+        def url(self, name, parameters=None, expire=None, http_method=None):
+            url = super().url(name, parameters, expire, http_method)
+            if self.querystring_auth and name.startswith(settings.PUBLIC_MEDIA_PREFIXES):
+                # Public media gets one stable URL that browsers and CDNs can cache
+                return self._strip_signing_parameters(url)
+            return url
+    
+    class S3ScratchStorage(S3Boto3Storage):
+        """Temporary objects (e.g. upload chunks) kept under their own names in the media bucket"""
+
+@lru_cache(maxsize=None)
+def scratch_storage():
+    """
+    Storage for temporary objects that must be visible to every web instance and worker.
+    Names are kept as given, unlike default_storage, so callers can find objects again.
+    """
+    return import_string(settings.SCRATCH_FILE_STORAGE)()
+
+def walk(storage, directory):
+    """Yield every file name below a storage directory"""
+    try:
+        directories, files = storage.listdir(directory)
+    except FileNotFoundError:
+        return
+    for filename in files:
+        yield posixpath.join(directory, filename)
+    for subdirectory in directories:
+        yield from walk(storage, posixpath.join(directory, subdirectory))
+
+def orphaned_media(grace_hours=24):
+    """
+    Yield content-addressed media names that no row points at any more, e.g. replaced
+    avatars or deleted resumes; remove them with default_storage.purge(). Files younger
+    than `grace_hours` are skipped, since an upload is stored before the row that refers
+    to it commits.
+    """
+    cutoff = timezone.now() - timedelta(hours=grace_hours)
+    by_directory = {}
+    for model, field, variants in file_fields():
+        by_directory.setdefault(field.upload_to.rstrip('/'), []).append((model, field, variants))
+    
+    for directory, fields in by_directory.items():
+        referenced = set()
+        for model, field, variants in fields:
+            rows = model._default_manager.exclude(**{field.name: ''}).exclude(**{f'{field.name}__isnull': True})
+            referenced.update(rows.values_list(field.name, flat=True).iterator(chunk_size=5000))
+            if variants:
+                for stored in rows.values_list(variants, flat=True).iterator(chunk_size=5000):
+                    referenced.update(variant['name'] for variant in (stored or {}).get('variants', []))
+        
+        for name in walk(default_storage, directory):
+            if not is_content_addressed(name) or name in referenced:
+                continue
+            if default_storage.get_modified_time(name) < cutoff:
+                yield name
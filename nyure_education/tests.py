@@ -0,0 +1,124 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from jobs.models import Company
+from nyure_education import storage
+from nyure_education.storage import is_referenced
+from nyure_education.throttling import SlidingWindowThrottle, throttle_metrics, update_counters
+
+# Only defined when django-storages is installed
+S3MediaStorage = getattr(storage, 'S3MediaStorage', None)
+
+class ContentAddressedStorageTests(TestCase):
+    """Media is stored once per distinct content and only the orphan sweep removes it"""
+    
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+    
+    def test_same_content_is_stored_once(self):
+        first = default_storage.save('companies/a.png', ContentFile(b'logo'))
+        second = default_storage.save('companies/b.png', ContentFile(b'logo'))
+        self.assertEqual(first, second)
+        self.assertRegex(first, r'^companies/[0-9a-f]{2}/[0-9a-f]{64}\.png$')
+        self.assertEqual(default_storage.listdir(f'companies/{first.split("/")[1]}')[1], [first.rsplit('/', 1)[1]])
+    
+    def test_delete_leaves_shared_files_to_the_sweep(self):
+        name = default_storage.save('companies/a.png', ContentFile(b'logo'))
+        default_storage.delete(name)
+        self.assertTrue(default_storage.exists(name))
+    
+    def test_purge_keeps_referenced_files(self):
+        name = default_storage.save('companies/a.png', ContentFile(b'logo'))
+        company = Company.objects.create(name='Acme', description='', industry='', location='', logo=name)
+        default_storage.purge(name)
+        self.assertTrue(default_storage.exists(name))
+        
+        company.delete()
+        default_storage.purge(name)
+        self.assertFalse(default_storage.exists(name))
+    
+    def test_variants_count_as_references(self):
+        logo = default_storage.save('companies/a.png', ContentFile(b'logo'))
+        variant = default_storage.save('companies/a.webp', ContentFile(b'small'))
+        Company.objects.create(
+            name='Acme', description='', industry='', location='', logo=logo,
+            logo_variants={'source': logo, 'variants': [{'name': variant, 'width': 64}]}
+        )
+        self.assertTrue(is_referenced(variant))
+        # The substring fallback used where JSON containment is unsupported (SQLite)
+        with mock.patch.object(connection.features, 'supports_json_field_contains', False):
+            self.assertTrue(is_referenced(variant))
+            self.assertFalse(is_referenced('companies/ab/' + 'ab' * 32 + '.webp'))
+
+@unittest.skipIf(S3MediaStorage is None, 'needs django-storages and boto3')
+class S3MediaUrlTests(SimpleTestCase):
+    """Public media gets plain URLs, everything else stays signed"""
+    
+    def storage(self):
+        return S3MediaStorage(
+            bucket_name='media', access_key='key', secret_key='secret',
+            region_name='us-east-1', querystring_auth=True
+        )
+    
+    def test_public_prefixes_are_unsigned(self):
+        url = self.storage().url('avatars/ab/' + 'ab' * 32 + '.png')
+        self.assertNotIn('?', url)
+    
+    def test_resumes_are_signed(self):
+        url = self.storage().url('resumes/ab/' + 'ab' * 32 + '.pdf')
+        self.assertIn('Signature', url)
+
+class MinuteThrottle(SlidingWindowThrottle):
+    scope = 'user'
+    rate = '3/min'
+    
+    def get_cache_key(self, request, view):
+        return 'throttle_test_client'
+
+class SlidingWindowThrottleTests(SimpleTestCase):
+    """Limits count the current window plus the overlapping part of the previous one"""
+    
+    def setUp(self):
+        cache.clear()
+        self.now = 600.0  # Start of a one-minute window
+    
+    def allow(self):
+        throttle = MinuteThrottle()
+        throttle.timer = lambda: self.now
+        return throttle.allow_request(None, None), throttle
+    
+    def test_budget_is_enforced_within_a_window(self):
+        self.assertEqual([self.allow()[0] for _ in range(4)], [True, True, True, False])
+        allowed, throttle = self.allow()
+        self.assertFalse(allowed)
+        # Into the next window until a third of this one has slid out: 3 * 2/3 + 1 fits
+        self.assertEqual(throttle.wait(), 80)
+    
+    def test_previous_window_counts_while_it_overlaps(self):
+        for _ in range(3):
+            self.allow()
+        # A quarter into the next window, three quarters of the previous one still count
+        self.now = 675.0
+        self.assertFalse(self.allow()[0])
+        self.now = 705.0
+        self.assertEqual([self.allow()[0] for _ in range(3)], [True, True, False])
+    
+    def test_refused_requests_move_to_the_throttled_count(self):
+        for _ in range(5):
+            self.allow()
+        self.assertEqual(throttle_metrics()['user'], {'allowed': 3, 'throttled': 2})
+    
+    def test_counters_expire_and_survive_eviction(self):
+        self.assertEqual(update_counters(cache, [('counter', 2, 60)], ['missing'])[0], [2])
+        cache.delete('counter')
+        self.assertEqual(update_counters(cache, [('counter', 1, 60)], ['counter']), ([1], [1]))
@@ -0,0 +1,162 @@
+from django.conf import settings
+from django.core.cache.backends.redis import RedisCache
+from django.utils import timezone
+from rest_framework.throttling import SimpleRateThrottle
+
+# Cache keys counting allowed and throttled requests per scope and UTC day
+METRICS_KEY = 'throttle-metrics:%(scope)s:%(outcome)s:%(day)s'
+
+# Seconds a day's counts are kept; yesterday's stay readable for a day
+METRICS_TTL = 2 * 24 * 60 * 60
+
+def metrics_key(scope, outcome):
+    return METRICS_KEY % {'scope': scope, 'outcome': outcome, 'day': timezone.now().date().isoformat()}
+
+def update_counters(cache, increments, reads=()):
+    """
+    Apply (key, delta, timeout) increments and read `reads`, returning the new
+    counts and the values read. On Redis this is one pipelined round trip;
+    other backends fall back to one call per key.
+    """
+    if isinstance(cache, RedisCache):
+        client = cache._cache.get_client(write=True)
+        pipeline = client.pipeline(transaction=False)
+        for key, delta, timeout in increments:
+            key = cache.make_and_validate_key(key)
+            # Sets the expiry only when the counter is created, like cache.add
+            pipeline.set(key, 0, ex=timeout, nx=True)
+            pipeline.incrby(key, delta)
+        for key in reads:
+            pipeline.get(cache.make_and_validate_key(key))
+        results = pipeline.execute()
+        counts = results[1:2 * len(increments):2]
+        values = [int(value) if value is not None else None for value in results[2 * len(increments):]]
+        return counts, values
+    
+    counts = []
+    for key, delta, timeout in increments:
+        cache.add(key, 0, timeout=timeout)
+        try:
+            counts.append(cache.incr(key, delta))
+        except ValueError:
+            # Evicted between add and incr
+            cache.set(key, delta, timeout=timeout)
+            counts.append(delta)
+    values = [cache.get(key) for key in reads]
+    return counts, values
+
+def throttle_metrics():
+    """Allowed and throttled request counts for every configured scope, since midnight UTC"""
+    scopes = list(settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_RATES', {}))
+    keys = {
+        (scope, outcome): metrics_key(scope, outcome)
+        for scope in scopes
+        for outcome in ('allowed', 'throttled')
+    }
+    values = SimpleRateThrottle.cache.get_many(list(keys.values()))
+    return {
+        scope: {outcome: values.get(keys[(scope, outcome)], 0) for outcome in ('allowed', 'throttled')}
+        for scope in scopes
+    }
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """
+    Sliding window counter: the count in the current fixed window plus the
+    previous window's count weighted by how much of it still overlaps. Each
+    request costs one pipelined round trip to the shared cache (two when it
+    is refused), so limits hold across every worker process.
+    """
+    
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        
+        now = self.timer()
+        window = int(now // self.duration)
+        self.elapsed = now - window * self.duration
+        current_key = f'{self.key}:{window}'
+        
+        # Windows live long enough to be the "previous" one for the next window.
+        # The request is counted as allowed up front so the common path is a single round trip.
+        (self.current, _), (previous,) = update_counters(
+            self.cache,
+            [(current_key, 1, self.duration * 2), (metrics_key(self.scope, 'allowed'), 1, METRICS_TTL)],
+            [f'{self.key}:{window - 1}']
+        )
+        self.previous = previous or 0
+        
+        overlap = 1 - self.elapsed / self.duration
+        if self.previous * overlap + self.current > self.num_requests:
+            # Refused requests don't use up the budget, and count as throttled instead
+            update_counters(self.cache, [
+                (current_key, -1, self.duration * 2),
+                (metrics_key(self.scope, 'allowed'), -1, METRICS_TTL),
+                (metrics_key(self.scope, 'throttled'), 1, METRICS_TTL),
+            ])
+            self.current -= 1
+            return False
+        
+        return True
+    
+    def wait(self):
+        """Seconds until one more request fits (sent as Retry-After)"""
+        budget = self.num_requests - 1
+        if self.current <= budget and self.previous:
+            # Wait for enough of the previous window to slide out
+            fraction = 1 - (budget - self.current) / self.previous
+            return max(fraction * self.duration - self.elapsed, 1)
+        
+        # This window alone is over budget: wait into the next one
+        fraction = 1 - budget / self.current if self.current else 0
+        return (self.duration - self.elapsed) + fraction * self.duration
+
+class AnonSlidingWindowThrottle(SlidingWindowThrottle):
+    """Budget for unauthenticated requests, per client IP"""
+    scope = 'anon'
+    
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+class UserSlidingWindowThrottle(SlidingWindowThrottle):
+    """Overall budget per user (per IP for anonymous requests)"""
+    scope = 'user'
+    
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+class ScopedSlidingWindowThrottle(SlidingWindowThrottle):
+    """
+    Per-action budgets. Views name their scope with `throttle_scope`, or map
+    actions to scopes with `throttle_scopes = {'like': 'like'}`.
+    """
+    
+    def __init__(self):
+        # The rate depends on the view, so it is looked up in allow_request
+        pass
+    
+    def allow_request(self, request, view):
+        scopes = getattr(view, 'throttle_scopes', {})
+        self.scope = scopes.get(getattr(view, 'action', None)) or getattr(view, 'throttle_scope', None)
+        if not self.scope:
+            return True
+        
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+    
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
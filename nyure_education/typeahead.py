@@ -0,0 +1,38 @@
+from django.db.models.functions import Length
+
+# Matches returned per request by default, and at most
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+# pg_trgm can only use its index once the query holds a whole trigram
+TRIGRAM_MIN_LENGTH = 3
+
+# Rows taken from the trigram index before ranking. The index returns matches
+# unordered, so a query matching more rows than this ranks an arbitrary subset.
+CANDIDATE_LIMIT = 100
+
+def typeahead_params(request):
+    """?q=<text typed so far> and ?limit=<matches to return>"""
+    query = request.query_params.get('q', '').strip()
+    limit = request.query_params.get('limit', '')
+    return query, min(int(limit), MAX_LIMIT) if limit.isdigit() and int(limit) > 0 else DEFAULT_LIMIT
+
+def top_matches(queryset, field, query, limit):
+    """
+    Up to `limit` rows of a values() queryset (which must include 'id'):
+    those whose `field` starts with the query, shortest first, then those
+    merely containing it. The field's pg_trgm index serves both lookups;
+    only the first CANDIDATE_LIMIT matches of each are sorted.
+    """
+    if len(query) < TRIGRAM_MIN_LENGTH:
+        return []
+    
+    def ranked(lookup, count, exclude=()):
+        candidates = queryset.filter(**{f'{field}__{lookup}': query}).exclude(id__in=exclude)\
+            .values('id')[:CANDIDATE_LIMIT]
+        return list(queryset.filter(id__in=candidates).order_by(Length(field), field)[:count])
+    
+    matches = ranked('istartswith', limit)
+    if len(matches) < limit:
+        matches += ranked('icontains', limit - len(matches), [row['id'] for row in matches])
+    return matches
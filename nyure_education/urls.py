@@ -1,15 +1,16 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
-from django.conf.urls.static import static
 from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
     TokenRefreshView,
     TokenVerifyView,
+    TokenBlacklistView,
 )
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework import permissions
+from users.views import LoginView
+from .views import serve_media, ThrottleMetricsView
 
 # API Schema configuration
 schema_view = get_schema_view(
@@ -34,20 +35,27 @@ urlpatterns = [
     path('api/redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     
     # Authentication
-    path('api/auth/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('api/auth/token/', LoginView.as_view(), name='token_obtain_pair'),
     path('api/auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('api/auth/token/verify/', TokenVerifyView.as_view(), name='token_verify'),
+    path('api/auth/logout/', TokenBlacklistView.as_view(), name='token_blacklist'),
+    
+    # Operations
+    path('api/throttle-metrics/', ThrottleMetricsView.as_view(), name='throttle_metrics'),
     
     # API endpoints
     path('api/users/', include('users.urls')),
     path('api/learning-paths/', include('learning_paths.urls')),
     path('api/resources/', include('resources.urls')),
     path('api/progress/', include('progress.urls')),
-    # path('api/mentorship/', include('mentorship.urls')), # Temporarily commented out
-    # path('api/jobs/', include('jobs.urls')), # Temporarily commented out
-    # path('api/forums/', include('forums.urls')), # Temporarily commented out
+    path('api/notifications/', include('notifications.urls')),
+    path('api/mentorship/', include('mentorship.urls')),
+    path('api/jobs/', include('jobs.urls')),
+    path('api/forums/', include('forums.urls')),
 ]
 
-# Serve media files in development
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Serve public local media in development, or in production when SERVE_MEDIA is set
+if settings.MEDIA_STORAGE == 'local' and (settings.DEBUG or settings.SERVE_MEDIA):
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % settings.MEDIA_URL.lstrip('/'), serve_media),
+    ]
@@ -0,0 +1,50 @@
+import posixpath
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponseRedirect
+from django.utils.cache import patch_cache_control
+from django.views.static import serve
+from rest_framework import generics, permissions
+from rest_framework.response import Response
+from .storage import is_content_addressed
+from .throttling import throttle_metrics
+
+def is_public_media(path):
+    path = posixpath.normpath(path).lstrip('/')
+    return any(path.startswith(prefix) for prefix in settings.PUBLIC_MEDIA_PREFIXES)
+
+def serve_media(request, path):
+    """
+    Serve public local media (images) with cache headers. Content-addressed files are
+    immutable, so browsers and CDNs may cache them for a year; legacy names get a short TTL.
+    Anything outside PUBLIC_MEDIA_PREFIXES, such as resumes, is only reachable through
+    a view that checks who is asking.
+    """
+    if not is_public_media(path):
+        raise Http404('Not found.')
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    if is_content_addressed(path):
+        patch_cache_control(response, public=True, max_age=31536000, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=getattr(settings, 'MEDIA_CACHE_MAX_AGE', 3600))
+    return response
+
+def private_file_response(file):
+    """
+    Hand an access-checked file to its owner: a short-lived signed URL on S3,
+    otherwise streamed from local storage as an attachment
+    """
+    if settings.MEDIA_STORAGE == 's3':
+        response = HttpResponseRedirect(file.url)
+    else:
+        response = FileResponse(file.open('rb'), as_attachment=True, filename=posixpath.basename(file.name))
+    patch_cache_control(response, private=True, no_store=True)
+    return response
+
+class ThrottleMetricsView(generics.GenericAPIView):
+    """
+    API endpoint with allowed and throttled request counts per throttle scope since midnight UTC
+    """
+    permission_classes = [permissions.IsAdminUser]
+    
+    def get(self, request):
+        return Response(throttle_metrics())
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('progress', '0001_initial'),
+        ('learning_paths', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userstepprogress',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='step_progress', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='userskill',
+            name='skill',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='userskill',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skills', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='userachievement',
+            name='achievement',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='progress.achievement'),
+        ),
+        migrations.AddField(
+            model_name='userachievement',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='achievements', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='achievement',
+            name='required_skills',
+            field=models.ManyToManyField(blank=True, to='learning_paths.skill'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='userstepprogress',
+            unique_together={('user', 'step')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='userskill',
+            unique_together={('user', 'skill')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='userachievement',
+            unique_together={('user', 'achievement')},
+        ),
+    ]
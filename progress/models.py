@@ -63,6 +63,7 @@ class Achievement(models.Model):
     title = models.CharField(max_length=100)
     description = models.TextField()
     icon = models.ImageField(upload_to='achievements/')
+    icon_variants = models.JSONField(default=dict, blank=True)
     
     # Achievement categorization
     category = models.CharField(max_length=100)
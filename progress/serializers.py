@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from .models import UserSkill, UserStepProgress, Achievement, UserAchievement
 from learning_paths.serializers import SkillSerializer, StepSerializer
+from imaging.fields import ImageVariantsField
 
 class UserSkillSerializer(serializers.ModelSerializer):
     skill = SkillSerializer(read_only=True)
@@ -20,6 +21,7 @@ class UserStepProgressSerializer(serializers.ModelSerializer):
 
 class AchievementSerializer(serializers.ModelSerializer):
     required_skills = SkillSerializer(many=True, read_only=True)
+    icon_variants = ImageVariantsField('icon')
     
     class Meta:
         model = Achievement
@@ -8,7 +8,9 @@ from .serializers import (
     AchievementSerializer, UserAchievementSerializer
 )
 from users.permissions import IsOwnerOrReadOnly
+from users.tasks import award_xp
 from learning_paths.models import Step
+from nyure_education.db_router import ReplicaReadMixin
 
 class UserSkillViewSet(viewsets.ModelViewSet):
     serializer_class = UserSkillSerializer
@@ -47,16 +49,8 @@ class UserStepProgressViewSet(viewsets.ModelViewSet):
             elif status_value == 'completed' and not progress.completed_at:
                 progress.completed_at = timezone.now()
                 
-                # Award XP to user
-                user = progress.user
-                user.xp_points += progress.step.xp_reward
-                
-                # Level up if needed (simple level calculation)
-                new_level = max(1, int(user.xp_points / 1000) + 1)
-                if new_level > user.level:
-                    user.level = new_level
-                
-                user.save()
+                # Award XP to user (levels up in the background task)
+                award_xp.delay(progress.user_id, progress.step.xp_reward, f'step:{progress.id}')
         
         # Update progress percentage
         if progress_percentage is not None:
@@ -70,7 +64,7 @@ class UserStepProgressViewSet(viewsets.ModelViewSet):
         serializer = UserStepProgressSerializer(progress)
         return Response(serializer.data)
 
-class AchievementViewSet(viewsets.ReadOnlyModelViewSet):
+class AchievementViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Achievement.objects.all()
     serializer_class = AchievementSerializer
     permission_classes = [permissions.IsAuthenticated]
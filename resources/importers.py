@@ -0,0 +1,137 @@
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from learning_paths.importers import (
+    BaseImporter, NameLookup, SkillImporter, LearningPathImporter, StepImporter,
+    SUPPORTED_FORMATS, read_rows, split_list
+)
+from learning_paths.models import Skill
+from learning_paths.typeahead import skill_index
+from stats.counters import sync_skill_stats
+from .models import ResourceType, ResourceProvider, Resource
+
+class ResourceProviderImporter(BaseImporter):
+    model = ResourceProvider
+    fields = ('name', 'website')
+    required_fields = ('name', 'website')
+    key_field = 'name'
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.providers = NameLookup(ResourceProvider)
+    
+    def write(self, rows):
+        created = []
+        updated = []
+        for _, values in rows:
+            provider_id = self.providers.get(values['name'])
+            if provider_id is None:
+                created.append(ResourceProvider(**values))
+            else:
+                updated.append(ResourceProvider(id=provider_id, **values))
+        
+        ResourceProvider.objects.bulk_create(created)
+        ResourceProvider.objects.bulk_update(updated, ['name', 'website'])
+        self.providers.ensure([provider.name for provider in created])
+        self.created += len(created)
+        self.updated += len(updated)
+
+class ResourceImporter(BaseImporter):
+    model = Resource
+    fields = ('title', 'description', 'url', 'duration_minutes', 'difficulty', 'is_free')
+    required_fields = ('title', 'description', 'url', 'difficulty')
+    key_field = 'url'
+    update_fields = [
+        'title', 'description', 'duration_minutes', 'difficulty', 'is_free',
+        'resource_type', 'provider', 'updated_at'
+    ]
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.types = NameLookup(ResourceType, build=lambda name: ResourceType(name=name, description=''))
+        self.providers = NameLookup(ResourceProvider)
+        self.skills = NameLookup(Skill)
+    
+    def clean_row(self, row):
+        values = super().clean_row(row)
+        
+        resource_type = (row.get('resource_type') or '').strip()
+        provider = (row.get('provider') or '').strip()
+        if not resource_type or not provider:
+            raise ValidationError('resource_type and provider are required.')
+        
+        # Unknown providers can only be created when their website is given
+        provider_website = (row.get('provider_website') or '').strip()
+        if self.providers.get(provider) is None and not provider_website:
+            raise ValidationError(f"provider: '{provider}' not found and no provider_website given.")
+        
+        values['resource_type'] = resource_type
+        values['provider'] = provider
+        values['provider_website'] = provider_website
+        values['skills'] = split_list(row.get('skills'))
+        return values
+    
+    def write(self, rows):
+        # Resolve lookups for the whole batch at once
+        self.types.ensure({values['resource_type'] for _, values in rows})
+        websites = {values['provider']: values['provider_website'] for _, values in rows}
+        self.providers.build = lambda name: ResourceProvider(name=name, website=websites[name])
+        self.providers.ensure(websites.keys())
+        self.skills.ensure({name for _, values in rows for name in values['skills']})
+        
+        urls = [values['url'] for _, values in rows]
+        existing = dict(Resource.objects.filter(url__in=urls).values_list('url', 'id'))
+        
+        now = timezone.now()
+        created = []
+        updated = []
+        for _, values in rows:
+            # bulk_update() skips auto_now, so stamp updated_at ourselves
+            resource = Resource(
+                id=existing.get(values['url']),
+                resource_type_id=self.types.get(values['resource_type']),
+                provider_id=self.providers.get(values['provider']),
+                added_by=self.user,
+                updated_at=now,
+                **{name: value for name, value in values.items() if name in self.fields}
+            )
+            if resource.id is None:
+                created.append(resource)
+            else:
+                updated.append(resource)
+        
+        Resource.objects.bulk_create(created)
+        Resource.objects.bulk_update(updated, self.update_fields)
+        self.created += len(created)
+        self.updated += len(updated)
+        
+        # Replace skills for rows that list them
+        resource_ids = dict(Resource.objects.filter(url__in=urls).values_list('url', 'id'))
+        self.replace_skills(Resource.skills.through, 'resource_id', {
+            resource_ids[values['url']]: {self.skills.get(name) for name in values['skills']}
+            for _, values in rows if values['skills']
+        })
+
+IMPORTERS = {
+    'skills': SkillImporter,
+    'paths': LearningPathImporter,
+    'steps': StepImporter,
+    'providers': ResourceProviderImporter,
+    'resources': ResourceImporter,
+}
+
+def check_options(kind, file_format):
+    if kind not in IMPORTERS:
+        raise ValueError(f"Unknown import kind '{kind}'. Choose from: {', '.join(IMPORTERS)}")
+    if file_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unknown format '{file_format}'. Choose from: {', '.join(SUPPORTED_FORMATS)}")
+
+def run_import(kind, lines, file_format, batch_size=1000, user=None):
+    """Import catalog rows of the given kind from an iterable of text lines"""
+    check_options(kind, file_format)
+    importer = IMPORTERS[kind](batch_size=batch_size, user=user)
+    return importer.run(read_rows(lines, file_format))
+
+def after_import():
+    """Bulk writes skip the stats and typeahead signals, so catch both up once per import"""
+    sync_skill_stats()
+    skill_index.invalidate()
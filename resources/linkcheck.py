@@ -0,0 +1,156 @@
+import asyncio
+import random
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import httpx
+
+USER_AGENT = 'NyureEducationLinkChecker/1.0 (+https://www.nyureeducation.com)'
+
+# Worth another attempt after backing off
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Servers that reject HEAD answer with these, so fall back to a body-less GET
+HEAD_UNSUPPORTED = {405, 501}
+
+@dataclass
+class LinkTarget:
+    """A URL to probe, with the validators from the previous check"""
+    pk: int
+    url: str
+    status: int = None
+    etag: str = ''
+    last_modified: str = ''
+
+@dataclass
+class LinkResult:
+    target: LinkTarget
+    status: int = None
+    etag: str = ''
+    last_modified: str = ''
+    error: str = ''
+    
+    @property
+    def is_broken(self):
+        # 401/403/429 usually mean bot protection rather than a dead link
+        return self.status is None or self.status in (404, 410) or self.status >= 500
+
+def retry_after_seconds(response):
+    """Parse a Retry-After header given either as seconds or an HTTP date"""
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    if value.isdigit():
+        return int(value)
+    try:
+        delta = parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+    return max(0, delta)
+
+class HostLimiter:
+    """Caps concurrent requests per host and spaces them by a minimum interval"""
+    
+    def __init__(self, per_host=2, min_interval=0.2):
+        self.min_interval = min_interval
+        self.semaphores = defaultdict(lambda: asyncio.Semaphore(per_host))
+        self.next_slot = defaultdict(float)
+    
+    @asynccontextmanager
+    async def slot(self, host):
+        async with self.semaphores[host]:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start = max(now, self.next_slot[host])
+            self.next_slot[host] = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+class LinkChecker:
+    """
+    Probes URLs concurrently with a global concurrency bound, per-host rate limits,
+    conditional requests (ETag / Last-Modified) and exponential backoff with jitter.
+    """
+    
+    def __init__(self, concurrency=50, per_host=2, min_interval=0.2, timeout=10.0,
+                 retries=2, backoff=1.0, transport=None):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.transport = transport
+    
+    def check(self, targets):
+        """Probe a batch of targets and return their results (blocking)"""
+        return asyncio.run(self.check_async(targets))
+    
+    async def check_async(self, targets):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = HostLimiter(self.per_host, self.min_interval)
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            follow_redirects=True,
+            headers={'User-Agent': USER_AGENT},
+            transport=self.transport,
+        ) as client:
+            return await asyncio.gather(*(self.probe(client, limiter, semaphore, target) for target in targets))
+    
+    async def request(self, client, target):
+        headers = {}
+        if target.etag:
+            headers['If-None-Match'] = target.etag
+        if target.last_modified:
+            headers['If-Modified-Since'] = target.last_modified
+        
+        response = await client.head(target.url, headers=headers)
+        if response.status_code in HEAD_UNSUPPORTED:
+            # Only the status line and headers are needed, never the body
+            async with client.stream('GET', target.url, headers=headers) as response:
+                pass
+        return response
+    
+    async def probe(self, client, limiter, semaphore, target):
+        host = urlsplit(target.url).hostname or ''
+        result = LinkResult(target=target)
+        
+        for attempt in range(self.retries + 1):
+            delay = None
+            try:
+                # The global bound covers only the request itself, so targets
+                # waiting on a busy host or backing off do not hold it
+                async with limiter.slot(host), semaphore:
+                    response = await self.request(client, target)
+            except (httpx.InvalidURL, httpx.UnsupportedProtocol) as exc:
+                # Malformed URLs are not worth retrying
+                result.status, result.error = None, str(exc)
+                break
+            except httpx.HTTPError as exc:
+                result.status, result.error = None, f'{type(exc).__name__}: {exc}'
+            else:
+                result.status, result.error = response.status_code, ''
+                result.etag = response.headers.get('etag', '')
+                result.last_modified = response.headers.get('last-modified', '')
+                if response.status_code not in RETRY_STATUSES:
+                    break
+                delay = retry_after_seconds(response)
+            
+            if attempt < self.retries:
+                if delay is None:
+                    delay = self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+                await asyncio.sleep(min(delay, 60))
+        
+        # Not modified: the link is as healthy as it was last time
+        if result.status == 304:
+            result.status = target.status or 200
+            result.etag = result.etag or target.etag
+            result.last_modified = result.last_modified or target.last_modified
+        return result
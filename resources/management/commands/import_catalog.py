@@ -0,0 +1,39 @@
+import json
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from resources.importers import IMPORTERS, after_import, run_import
+
+User = get_user_model()
+
+class Command(BaseCommand):
+    help = 'Stream skills, learning paths, steps, providers or resources from a CSV/JSONL file'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(IMPORTERS))
+        parser.add_argument('path', help='Path to the CSV or JSONL file')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--user', help='Email of the user recorded as creator/adder')
+    
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(email=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"User '{options['user']}' not found.")
+        
+        with open(path, encoding='utf-8', newline='') as lines:
+            report = run_import(options['kind'], lines, file_format, batch_size=options['batch_size'], user=user)
+        
+        after_import()
+        
+        for error in report.errors:
+            self.stderr.write(f"Row {error['row']}: {error['error']}")
+        
+        summary = report.as_dict()
+        summary.pop('errors')
+        self.stdout.write(self.style.SUCCESS(json.dumps(summary)))
@@ -0,0 +1,101 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogImport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20)),
+                ('file_format', models.CharField(max_length=10)),
+                ('file', models.FileField(upload_to='imports/')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('complete', 'Complete'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('report', models.JSONField(blank=True, default=dict)),
+                ('error', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Resource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('url', models.URLField()),
+                ('thumbnail', models.ImageField(blank=True, null=True, upload_to='resources/')),
+                ('thumbnail_variants', models.JSONField(blank=True, default=dict)),
+                ('duration_minutes', models.PositiveIntegerField(default=0)),
+                ('difficulty', models.CharField(choices=[('beginner', 'Beginner'), ('intermediate', 'Intermediate'), ('advanced', 'Advanced')], max_length=50)),
+                ('is_free', models.BooleanField(default=True)),
+                ('view_count', models.PositiveIntegerField(default=0)),
+                ('bookmark_count', models.PositiveIntegerField(default=0)),
+                ('average_rating', models.DecimalField(decimal_places=2, default=0, max_digits=3)),
+                ('link_status', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('link_checked_at', models.DateTimeField(blank=True, null=True)),
+                ('link_etag', models.CharField(blank=True, max_length=255)),
+                ('link_last_modified', models.CharField(blank=True, max_length=64)),
+                ('is_broken', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ResourceProvider',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('website', models.URLField()),
+                ('logo', models.ImageField(blank=True, null=True, upload_to='resource_providers/')),
+                ('link_status', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('link_checked_at', models.DateTimeField(blank=True, null=True)),
+                ('link_etag', models.CharField(blank=True, max_length=255)),
+                ('link_last_modified', models.CharField(blank=True, max_length=64)),
+                ('is_broken', models.BooleanField(default=False)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ResourceRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_required', models.BooleanField(default=False)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResourceType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField()),
+                ('icon', models.ImageField(blank=True, null=True, upload_to='resource_types/')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserResource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_bookmarked', models.BooleanField(default=False)),
+                ('is_completed', models.BooleanField(default=False)),
+                ('rating', models.PositiveIntegerField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('viewed_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_interactions', to='resources.resource')),
+            ],
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('resources', '0001_initial'),
+        ('learning_paths', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userresource',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resources', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='resourcerecommendation',
+            name='learning_path',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='recommended_resources', to='learning_paths.learningpath'),
+        ),
+        migrations.AddField(
+            model_name='resourcerecommendation',
+            name='path_step',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='recommended_resources', to='learning_paths.step'),
+        ),
+        migrations.AddField(
+            model_name='resourcerecommendation',
+            name='resource',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='resources.resource'),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='added_by',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='added_resources', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='provider',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='resources.resourceprovider'),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='resource_type',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='resources.resourcetype'),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='skills',
+            field=models.ManyToManyField(related_name='resources', to='learning_paths.skill'),
+        ),
+        migrations.AddField(
+            model_name='catalogimport',
+            name='user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='catalog_imports', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='userresource',
+            index=models.Index(fields=['user', 'is_bookmarked'], name='resources_ures_bookmark_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userresource',
+            index=models.Index(fields=['user', 'is_completed'], name='resources_ures_completed_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='userresource',
+            unique_together={('user', 'resource')},
+        ),
+    ]
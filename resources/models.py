@@ -17,6 +17,13 @@ class ResourceProvider(models.Model):
     website = models.URLField()
     logo = models.ImageField(upload_to='resource_providers/', blank=True, null=True)
     
+    # Link health (maintained by the check_resource_links command)
+    link_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    link_checked_at = models.DateTimeField(null=True, blank=True)
+    link_etag = models.CharField(max_length=255, blank=True)
+    link_last_modified = models.CharField(max_length=64, blank=True)
+    is_broken = models.BooleanField(default=False)
+    
     def __str__(self):
         return self.name
 
@@ -26,6 +33,7 @@ class Resource(models.Model):
     description = models.TextField()
     url = models.URLField()
     thumbnail = models.ImageField(upload_to='resources/', blank=True, null=True)
+    thumbnail_variants = models.JSONField(default=dict, blank=True)
     
     # Resource categorization
     resource_type = models.ForeignKey(ResourceType, on_delete=models.CASCADE)
@@ -49,6 +57,13 @@ class Resource(models.Model):
     bookmark_count = models.PositiveIntegerField(default=0)
     average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0)
     
+    # Link health (maintained by the check_resource_links command)
+    link_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    link_checked_at = models.DateTimeField(null=True, blank=True)
+    link_etag = models.CharField(max_length=255, blank=True)
+    link_last_modified = models.CharField(max_length=64, blank=True)
+    is_broken = models.BooleanField(default=False)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -72,6 +87,10 @@ class UserResource(models.Model):
     
     class Meta:
         unique_together = ('user', 'resource')
+        indexes = [
+            models.Index(fields=['user', 'is_bookmarked'], name='resources_ures_bookmark_idx'),
+            models.Index(fields=['user', 'is_completed'], name='resources_ures_completed_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.resource.title}"
@@ -96,3 +115,25 @@ class ResourceRecommendation(models.Model):
     def __str__(self):
         target = self.learning_path.title if self.learning_path else self.path_step.title
         return f"{self.resource.title} - {target}"
+
+class CatalogImport(models.Model):
+    """Catalog file uploaded through the API, imported by a background worker"""
+    kind = models.CharField(max_length=20)
+    file_format = models.CharField(max_length=10)
+    file = models.FileField(upload_to='imports/')
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='catalog_imports')
+    
+    status = models.CharField(max_length=20, choices=[
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('complete', 'Complete'),
+        ('failed', 'Failed'),
+    ], default='queued')
+    report = models.JSONField(default=dict, blank=True)
+    error = models.CharField(max_length=255, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    def __str__(self):
+        return f"{self.kind} import ({self.status})"
@@ -1,24 +1,29 @@
 from rest_framework import serializers
-from .models import ResourceType, ResourceProvider, Resource, UserResource, ResourceRecommendation
+from .models import ResourceType, ResourceProvider, Resource, UserResource, ResourceRecommendation, CatalogImport
+from imaging.fields import ImageVariantsField
 
 class ResourceTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = ResourceType
         fields = '__all__'
 
+LINK_CHECK_FIELDS = ('link_status', 'link_checked_at', 'link_etag', 'link_last_modified', 'is_broken')
+
 class ResourceProviderSerializer(serializers.ModelSerializer):
     class Meta:
         model = ResourceProvider
         fields = '__all__'
+        read_only_fields = LINK_CHECK_FIELDS
 
 class ResourceSerializer(serializers.ModelSerializer):
     resource_type = ResourceTypeSerializer(read_only=True)
     provider = ResourceProviderSerializer(read_only=True)
+    thumbnail_variants = ImageVariantsField('thumbnail')
     
     class Meta:
         model = Resource
         fields = '__all__'
-        read_only_fields = ('added_by', 'view_count', 'bookmark_count', 'average_rating')
+        read_only_fields = ('added_by', 'view_count', 'bookmark_count', 'average_rating') + LINK_CHECK_FIELDS
 
 class UserResourceSerializer(serializers.ModelSerializer):
     resource = ResourceSerializer(read_only=True)
@@ -34,3 +39,9 @@ class ResourceRecommendationSerializer(serializers.ModelSerializer):
     class Meta:
         model = ResourceRecommendation
         fields = '__all__'
+
+class CatalogImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CatalogImport
+        fields = ('id', 'kind', 'file_format', 'status', 'report', 'error', 'created_at', 'finished_at')
+        read_only_fields = fields
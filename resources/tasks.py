@@ -0,0 +1,47 @@
+import codecs
+import csv
+from django.db.models import Avg
+from django.utils import timezone
+from tasks.queue import task
+from .importers import after_import, run_import
+from .models import Resource, UserResource, CatalogImport
+
+@task
+def update_resource_rating(resource_id):
+    """Recompute a resource's average rating with one aggregate query"""
+    average = UserResource.objects.filter(resource_id=resource_id, rating__isnull=False)\
+        .aggregate(average=Avg('rating'))['average']
+    Resource.objects.filter(pk=resource_id).update(average_rating=round(average or 0, 2))
+
+@task(max_attempts=1)
+def run_catalog_import(import_id):
+    """Stream an uploaded catalog file through the importer; chunks commit as they go, so never retry"""
+    catalog_import = CatalogImport.objects.select_related('user').filter(pk=import_id, status='queued').first()
+    if catalog_import is None:
+        return
+    catalog_import.status = 'running'
+    catalog_import.save(update_fields=['status'])
+    
+    try:
+        with catalog_import.file.open('rb') as upload:
+            # Decode line by line so large files are never held in memory
+            lines = codecs.iterdecode(upload, 'utf-8')
+            report = run_import(
+                catalog_import.kind, lines, catalog_import.file_format, user=catalog_import.user
+            )
+        catalog_import.report = report.as_dict()
+        catalog_import.status = 'complete'
+    except (UnicodeDecodeError, csv.Error, ValueError) as exc:
+        catalog_import.error = f'File could not be read: {exc}'[:255]
+        catalog_import.status = 'failed'
+    except Exception:
+        catalog_import.error = 'Import failed unexpectedly.'
+        catalog_import.status = 'failed'
+        raise
+    finally:
+        # Earlier chunks may have committed even if the file broke off part way
+        after_import()
+        catalog_import.file.delete(save=False)
+        catalog_import.file = ''
+        catalog_import.finished_at = timezone.now()
+        catalog_import.save(update_fields=['status', 'report', 'error', 'file', 'finished_at'])
@@ -0,0 +1,128 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from resources.linkcheck import LinkChecker, LinkTarget
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers the link checker with a fixed response per path"""
+    
+    def do_HEAD(self):
+        self.respond(head=True)
+    
+    def do_GET(self):
+        self.respond(head=False)
+    
+    def respond(self, head):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.first_hit.setdefault(self.path, time.monotonic())
+        try:
+            if self.path == '/ok':
+                if self.headers.get('If-None-Match') == '"v1"':
+                    self.send_response(304)
+                else:
+                    self.send_response(200)
+                self.send_header('ETag', '"v1"')
+            elif self.path == '/redirect':
+                self.send_response(301)
+                self.send_header('Location', '/ok')
+            elif self.path == '/missing':
+                self.send_response(404)
+            elif self.path == '/no-head':
+                self.send_response(405 if head else 200)
+            elif self.path == '/slow':
+                time.sleep(1)
+                self.send_response(200)
+            elif self.path.startswith('/busy/'):
+                time.sleep(0.2)
+                self.send_response(200)
+            else:
+                self.send_response(500)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+    
+    def log_message(self, format, *args):
+        pass
+
+class LinkCheckerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server.in_flight = 0
+        cls.server.max_in_flight = 0
+        cls.server.first_hit = {}
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def check(self, paths, **options):
+        options = {'min_interval': 0, 'retries': 0, 'timeout': 2.0, **options}
+        targets = [LinkTarget(pk=pk, url=f'{self.base_url}{path}') for pk, path in enumerate(paths)]
+        return LinkChecker(**options).check(targets)
+    
+    def test_ok(self):
+        [result] = self.check(['/ok'])
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.etag, '"v1"')
+        self.assertFalse(result.is_broken)
+    
+    def test_not_modified_keeps_previous_status(self):
+        target = LinkTarget(pk=1, url=f'{self.base_url}/ok', status=200, etag='"v1"')
+        [result] = LinkChecker(min_interval=0, retries=0).check([target])
+        self.assertEqual(result.status, 200)
+        self.assertEqual(result.etag, '"v1"')
+    
+    def test_redirect_is_followed(self):
+        [result] = self.check(['/redirect'])
+        self.assertEqual(result.status, 200)
+        self.assertFalse(result.is_broken)
+    
+    def test_not_found_is_broken(self):
+        [result] = self.check(['/missing'])
+        self.assertEqual(result.status, 404)
+        self.assertTrue(result.is_broken)
+    
+    def test_head_unsupported_falls_back_to_get(self):
+        [result] = self.check(['/no-head'])
+        self.assertEqual(result.status, 200)
+    
+    def test_timeout_is_broken(self):
+        [result] = self.check(['/slow'], timeout=0.2)
+        self.assertIsNone(result.status)
+        self.assertIn('Timeout', result.error)
+        self.assertTrue(result.is_broken)
+    
+    def test_server_errors_are_retried(self):
+        started = time.monotonic()
+        [result] = self.check(['/error'], retries=2, backoff=0.05)
+        self.assertEqual(result.status, 500)
+        self.assertTrue(result.is_broken)
+        # Two backoff sleeps of at least 0.05s and 0.1s
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+    
+    def test_per_host_concurrency_is_capped(self):
+        self.server.max_in_flight = 0
+        results = self.check([f'/busy/{n}' for n in range(6)], per_host=2)
+        self.assertEqual([result.status for result in results], [200] * 6)
+        self.assertEqual(self.server.max_in_flight, 2)
+    
+    def test_backoff_does_not_hold_the_global_bound(self):
+        self.server.first_hit.clear()
+        started = time.monotonic()
+        results = self.check(['/error', '/ok'], concurrency=1, retries=2, backoff=0.5)
+        self.assertEqual([result.status for result in results], [500, 200])
+        # /ok goes out while /error sleeps off its first backoff (at least 0.5s)
+        self.assertLess(self.server.first_hit['/ok'] - started, 0.4)
@@ -2,7 +2,7 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     ResourceTypeViewSet, ResourceProviderViewSet, ResourceViewSet,
-    UserResourceViewSet, ResourceRecommendationViewSet
+    UserResourceViewSet, ResourceRecommendationViewSet, CatalogImportView, CatalogImportStatusView
 )
 
 router = DefaultRouter()
@@ -14,4 +14,6 @@ router.register(r'recommendations', ResourceRecommendationViewSet, basename='rec
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('import/', CatalogImportView.as_view(), name='catalog-import'),
+    path('import/<int:pk>/', CatalogImportStatusView.as_view(), name='catalog-import-status'),
 ]
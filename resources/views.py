@@ -1,29 +1,35 @@
-from rest_framework import viewsets, permissions, status, filters
+from rest_framework import viewsets, generics, permissions, status, filters
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from django.utils import timezone
-from .models import ResourceType, ResourceProvider, Resource, UserResource, ResourceRecommendation
+from django.db.models import F
+from .models import ResourceType, ResourceProvider, Resource, UserResource, ResourceRecommendation, CatalogImport
 from .serializers import (
     ResourceTypeSerializer, ResourceProviderSerializer, ResourceSerializer,
-    UserResourceSerializer, ResourceRecommendationSerializer
+    UserResourceSerializer, ResourceRecommendationSerializer, CatalogImportSerializer
 )
+from .importers import check_options
+from .tasks import update_resource_rating, run_catalog_import
+from users.tasks import award_xp
 from users.permissions import IsOwnerOrReadOnly
+from nyure_education.db_router import ReplicaReadMixin
 
-class ResourceTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class ResourceTypeViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only endpoint for Resource Types."""
     queryset = ResourceType.objects.all()
     serializer_class = ResourceTypeSerializer
     # Allow any authenticated user to read
     permission_classes = [permissions.IsAuthenticated]
 
-class ResourceProviderViewSet(viewsets.ReadOnlyModelViewSet):
+class ResourceProviderViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only endpoint for Resource Providers."""
     queryset = ResourceProvider.objects.all()
     serializer_class = ResourceProviderSerializer
     # Allow any authenticated user to read
     permission_classes = [permissions.IsAuthenticated]
 
-class ResourceViewSet(viewsets.ModelViewSet):
+class ResourceViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     queryset = Resource.objects.select_related('resource_type', 'provider').all()
     serializer_class = ResourceSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -31,6 +37,16 @@ class ResourceViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'description', 'provider__name', 'resource_type__name']
     ordering_fields = ['title', 'created_at', 'view_count', 'bookmark_count', 'average_rating']
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        
+        # Filter by link health
+        broken = self.request.query_params.get('broken')
+        if broken in ('true', 'false'):
+            queryset = queryset.filter(is_broken=(broken == 'true'))
+        
+        return queryset
+    
     def perform_create(self, serializer):
         serializer.save(added_by=self.request.user)
     
@@ -39,9 +55,8 @@ class ResourceViewSet(viewsets.ModelViewSet):
         resource = self.get_object()
         user = request.user
         
-        # Increment view count
-        resource.view_count += 1
-        resource.save()
+        # Increment view count in SQL rather than rewriting the whole row
+        Resource.objects.filter(pk=resource.pk).update(view_count=F('view_count') + 1)
         
         # Create or update user resource interaction
         user_resource, created = UserResource.objects.get_or_create(
@@ -102,11 +117,7 @@ class ResourceViewSet(viewsets.ModelViewSet):
         user_resource.save()
         
         # Update average rating
-        rated_interactions = UserResource.objects.filter(resource=resource, rating__isnull=False)
-        if rated_interactions.exists():
-            total_rating = sum(i.rating for i in rated_interactions)
-            resource.average_rating = total_rating / rated_interactions.count()
-            resource.save()
+        update_resource_rating.delay(resource.id)
         
         return Response({'detail': 'Rating submitted successfully.'})
     
@@ -129,15 +140,7 @@ class ResourceViewSet(viewsets.ModelViewSet):
             user_resource.save()
             
             # Award XP to user (simple XP calculation)
-            xp_points = min(50, resource.duration_minutes // 5)
-            user.xp_points += xp_points
-            
-            # Level up if needed (simple level calculation)
-            new_level = max(1, int(user.xp_points / 1000) + 1)
-            if new_level > user.level:
-                user.level = new_level
-            
-            user.save()
+            award_xp.delay(user.id, min(50, resource.duration_minutes // 5), f'resource:{user_resource.id}')
         elif not completed and user_resource.is_completed:
             user_resource.is_completed = False
             user_resource.completed_at = None
@@ -190,3 +193,44 @@ class ResourceRecommendationViewSet(viewsets.ModelViewSet):
             return ResourceRecommendation.objects.filter(path_step_id=path_step_id)
         
         return ResourceRecommendation.objects.none()
+
+class CatalogImportView(generics.GenericAPIView):
+    """
+    Admin endpoint for bulk catalog imports.
+    Upload a CSV or JSONL `file` with a `kind` (skills, paths, steps, providers, resources);
+    a worker imports it and the report appears on the returned import's status URL.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    parser_classes = [MultiPartParser]
+    serializer_class = CatalogImportSerializer
+    
+    def post(self, request):
+        upload = request.FILES.get('file')
+        kind = request.data.get('kind')
+        
+        if not upload:
+            return Response({'detail': 'A file is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        file_format = request.data.get('file_format')
+        if not file_format:
+            file_format = 'jsonl' if upload.name.endswith(('.jsonl', '.ndjson')) else 'csv'
+        
+        try:
+            check_options(kind, file_format)
+        except ValueError as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Large files outlast the request timeout, so the worker runs the import
+        catalog_import = CatalogImport.objects.create(
+            kind=kind, file_format=file_format, file=upload, user=request.user
+        )
+        run_catalog_import.delay(catalog_import.id)
+        
+        serializer = self.get_serializer(catalog_import)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+class CatalogImportStatusView(generics.RetrieveAPIView):
+    """Status and report of a queued catalog import"""
+    permission_classes = [permissions.IsAdminUser]
+    queryset = CatalogImport.objects.all()
+    serializer_class = CatalogImportSerializer
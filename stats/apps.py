@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+class StatsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'stats'
+    
+    def ready(self):
+        from . import signals
@@ -0,0 +1,83 @@
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from forums.models import ForumCategory, ForumPost, ForumTopic
+from jobs.models import JobListing
+from learning_paths.models import LearningPath, Skill
+from mentorship.models import MentorProfile
+from resources.models import Resource
+from .models import SkillStats
+
+def adjust_category(category_id, topics=0, posts=0):
+    """Shift a category's counters in one UPDATE, never below zero"""
+    changes = {}
+    if topics:
+        changes['topic_count'] = F('topic_count') + topics
+    if posts:
+        changes['post_count'] = F('post_count') + posts
+    
+    categories = ForumCategory.objects.filter(pk=category_id)
+    if topics < 0:
+        categories = categories.filter(topic_count__gte=-topics)
+    if posts < 0:
+        categories = categories.filter(post_count__gte=-posts)
+    categories.update(**changes)
+
+def count_by(queryset, field):
+    """Count the queryset's rows grouped by `field`, as a correlated subquery defaulting to 0"""
+    rows = queryset.order_by().values(field).annotate(total=Count('*')).values('total')
+    return Coalesce(Subquery(rows), Value(0))
+
+def category_counts():
+    """Actual counters per category; a topic's opening post counts as a post"""
+    topics = count_by(ForumTopic.objects.filter(category_id=OuterRef('pk')), 'category_id')
+    replies = count_by(ForumPost.objects.filter(topic__category_id=OuterRef('pk')), 'topic__category_id')
+    return {'topic_count': topics, 'post_count': topics + replies}
+
+def skill_counts():
+    """Actual counts per skill, read from the M2M tables by skill_id"""
+    skill = OuterRef('skill_id')
+    return {
+        'path_count': count_by(
+            LearningPath.skills.through.objects.filter(skill_id=skill, learningpath__is_published=True), 'skill_id'
+        ),
+        'resource_count': count_by(Resource.skills.through.objects.filter(skill_id=skill), 'skill_id'),
+        'job_count': count_by(
+            JobListing.skills.through.objects.filter(skill_id=skill, joblisting__is_active=True), 'skill_id'
+        ),
+        'mentor_count': count_by(
+            MentorProfile.skills.through.objects.filter(skill_id=skill, mentorprofile__is_available=True), 'skill_id'
+        ),
+    }
+
+def drifted(queryset, counts):
+    """Primary keys of rows whose stored counters differ from the actual counts"""
+    actual = {f'actual_{name}': expression for name, expression in counts.items()}
+    in_step = {name: F(f'actual_{name}') for name in counts}
+    return list(queryset.annotate(**actual).exclude(**in_step).values_list('pk', flat=True))
+
+def refresh_skill_stats(skill_ids):
+    """Recount the stats of the given skills, creating any missing rows"""
+    skill_ids = list(Skill.objects.filter(pk__in=set(skill_ids)).values_list('pk', flat=True))
+    if not skill_ids:
+        return 0
+    
+    SkillStats.objects.bulk_create([SkillStats(skill_id=pk) for pk in skill_ids], ignore_conflicts=True)
+    return SkillStats.objects.filter(skill_id__in=skill_ids).update(updated_at=timezone.now(), **skill_counts())
+
+def sync_category_counts():
+    """Recount the categories whose counters drifted; returns how many were off"""
+    category_ids = drifted(ForumCategory.objects.all(), category_counts())
+    if category_ids:
+        ForumCategory.objects.filter(pk__in=category_ids).update(**category_counts())
+    return len(category_ids)
+
+def sync_skill_stats():
+    """Create missing stats rows and recount drifted ones; returns how many were missing or off"""
+    missing = list(Skill.objects.filter(stats__isnull=True).values_list('pk', flat=True))
+    SkillStats.objects.bulk_create([SkillStats(skill_id=pk) for pk in missing], ignore_conflicts=True)
+    
+    skill_ids = set(missing) | set(drifted(SkillStats.objects.all(), skill_counts()))
+    if skill_ids:
+        refresh_skill_stats(skill_ids)
+    return len(skill_ids)
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from stats.counters import sync_category_counts, sync_skill_stats
+
+class Command(BaseCommand):
+    help = 'Recount forum category counters and per-skill stats, fixing any that drifted'
+    
+    def handle(self, *args, **options):
+        categories = sync_category_counts()
+        skills = sync_skill_stats()
+        self.stdout.write(self.style.SUCCESS(f'Fixed {categories} forum categories and {skills} skill stats.'))
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-19 11:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('learning_paths', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillStats',
+            fields=[
+                ('skill', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='learning_paths.skill')),
+                ('path_count', models.PositiveIntegerField(default=0)),
+                ('resource_count', models.PositiveIntegerField(default=0)),
+                ('job_count', models.PositiveIntegerField(default=0)),
+                ('mentor_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Skill stats',
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import models
+from learning_paths.models import Skill
+
+class SkillStats(models.Model):
+    """Per-skill counts for browse pages, kept in step by stats.signals and reconciled hourly"""
+    skill = models.OneToOneField(Skill, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    
+    path_count = models.PositiveIntegerField(default=0)  # Published learning paths
+    resource_count = models.PositiveIntegerField(default=0)
+    job_count = models.PositiveIntegerField(default=0)  # Active job listings
+    mentor_count = models.PositiveIntegerField(default=0)  # Available mentors
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name_plural = "Skill stats"
+    
+    def __str__(self):
+        return f"Stats for {self.skill.name}"
@@ -0,0 +1,7 @@
+from rest_framework import serializers
+from .models import SkillStats
+
+class SkillStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SkillStats
+        fields = ('path_count', 'resource_count', 'job_count', 'mentor_count')
@@ -0,0 +1,94 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from forums.models import ForumPost, ForumTopic
+from jobs.models import JobListing
+from learning_paths.models import LearningPath, Skill
+from mentorship.models import MentorProfile
+from resources.models import Resource
+from .counters import adjust_category
+from .models import SkillStats
+from .tasks import refresh_skills
+
+# Forum category counters move in the same transaction as the topic or post
+
+@receiver(post_save, sender=ForumTopic)
+def forum_topic_saved(sender, instance, created, **kwargs):
+    if created:
+        adjust_category(instance.category_id, topics=1, posts=1)
+
+@receiver(post_delete, sender=ForumTopic)
+def forum_topic_deleted(sender, instance, **kwargs):
+    adjust_category(instance.category_id, topics=-1, posts=-1)
+
+@receiver(post_save, sender=ForumPost)
+def forum_post_saved(sender, instance, created, **kwargs):
+    if created:
+        category_id = ForumTopic.objects.filter(pk=instance.topic_id).values_list('category_id', flat=True).first()
+        adjust_category(category_id, posts=1)
+
+@receiver(post_delete, sender=ForumPost)
+def forum_post_deleted(sender, instance, **kwargs):
+    # Posts go before their topic when a topic is deleted, so it can still be looked up
+    category_id = ForumTopic.objects.filter(pk=instance.topic_id).values_list('category_id', flat=True).first()
+    if category_id is not None:
+        adjust_category(category_id, posts=-1)
+
+# Skill stats are recounted by the worker for the skills a change touches
+
+# Owner models and the flag deciding whether they count towards their skills
+COUNTED = {
+    LearningPath: 'is_published',
+    Resource: None,
+    JobListing: 'is_active',
+    MentorProfile: 'is_available',
+}
+
+@receiver(post_save, sender=Skill)
+def skill_created(sender, instance, created, **kwargs):
+    if created:
+        SkillStats.objects.get_or_create(skill=instance)
+
+def remember_flag(sender, instance, update_fields=None, **kwargs):
+    """Stash the stored flag so post_save can tell whether it changed"""
+    flag = COUNTED[sender]
+    if not instance.pk:
+        instance._previous_flag = None
+    elif update_fields is not None and flag not in update_fields:
+        # The save can't touch the flag, so skip the lookup
+        instance._previous_flag = getattr(instance, flag)
+    else:
+        instance._previous_flag = sender.objects.filter(pk=instance.pk).values_list(flag, flat=True).first()
+
+def owner_saved(sender, instance, created, **kwargs):
+    # New rows have no skills yet; m2m_changed covers them
+    if not created and getattr(instance, '_previous_flag', None) != getattr(instance, COUNTED[sender]):
+        refresh_skills.delay(list(instance.skills.values_list('pk', flat=True)))
+
+def owner_deleting(sender, instance, **kwargs):
+    # The M2M rows are gone by post_delete; the refresh runs after the delete commits
+    skill_ids = list(instance.skills.values_list('pk', flat=True))
+    if skill_ids:
+        refresh_skills.delay(skill_ids)
+
+def skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # Skill side, e.g. skill.job_listings.add(...): only this skill's counts move
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            refresh_skills.delay([instance.pk])
+        return
+    
+    if action == 'pre_clear':
+        # pk_set is empty on clear, remember which skills are dropped
+        instance._cleared_skill_ids = list(instance.skills.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove') and pk_set:
+        refresh_skills.delay(list(pk_set))
+    elif action == 'post_clear' and getattr(instance, '_cleared_skill_ids', None):
+        refresh_skills.delay(instance._cleared_skill_ids)
+
+for model, flag in COUNTED.items():
+    label = model._meta.label_lower
+    if flag:
+        pre_save.connect(remember_flag, sender=model, dispatch_uid=f'stats:{label}:flag')
+        post_save.connect(owner_saved, sender=model, dispatch_uid=f'stats:{label}:saved')
+    pre_delete.connect(owner_deleting, sender=model, dispatch_uid=f'stats:{label}:deleting')
+    m2m_changed.connect(skills_changed, sender=model.skills.through, dispatch_uid=f'stats:{label}:skills')
@@ -0,0 +1,13 @@
+from datetime import timedelta
+from tasks.queue import task, periodic_task
+from .counters import refresh_skill_stats, sync_category_counts, sync_skill_stats
+
+@task
+def refresh_skills(skill_ids):
+    refresh_skill_stats(skill_ids)
+
+@periodic_task(every=timedelta(hours=1))
+def reconcile_stats():
+    """Repair counters changed behind the signals' back (bulk imports, queryset updates, admin edits)"""
+    sync_category_counts()
+    sync_skill_stats()
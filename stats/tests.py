@@ -0,0 +1,81 @@
+import datetime
+from unittest import mock
+from django.test import TestCase, override_settings
+from forums.models import ForumCategory, ForumPost, ForumTopic
+from jobs.models import Company, JobListing
+from learning_paths.models import Skill
+from stats.counters import sync_category_counts, sync_skill_stats
+from stats.models import SkillStats
+from users.models import User
+
+class CategoryCounterTests(TestCase):
+    """Forum category counters move with topics and posts, and the reconcile repairs drift"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='poster', email='poster@example.com', password='x')
+        cls.category = ForumCategory.objects.create(name='General', description='')
+    
+    def counts(self):
+        self.category.refresh_from_db()
+        return self.category.topic_count, self.category.post_count
+    
+    def test_topics_and_posts_are_counted(self):
+        topic = ForumTopic.objects.create(title='Hello', content='', category=self.category, author=self.user)
+        ForumPost.objects.create(topic=topic, author=self.user, content='Reply', position=1)
+        self.assertEqual(self.counts(), (1, 2))
+        
+        topic.delete()
+        self.assertEqual(self.counts(), (0, 0))
+    
+    def test_reconcile_repairs_drifted_counters(self):
+        ForumTopic.objects.create(title='Hello', content='', category=self.category, author=self.user)
+        ForumCategory.objects.update(topic_count=9, post_count=9)
+        self.assertEqual(sync_category_counts(), 1)
+        self.assertEqual(self.counts(), (1, 1))
+        self.assertEqual(sync_category_counts(), 0)
+
+@override_settings(TASKS_ALWAYS_EAGER=True)
+class SkillStatsTests(TestCase):
+    """Skill counts follow the owners' skills and flags through the (eager) task queue"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.skill = Skill.objects.create(name='Python')
+        cls.company = Company.objects.create(name='Acme', description='', industry='', location='')
+    
+    def create_listing(self):
+        listing = JobListing.objects.create(
+            title='Engineer', description='', company=self.company, job_type='full_time', location='',
+            experience_level='entry', education_level='none', expires_at=datetime.date(2100, 1, 1)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            listing.skills.add(self.skill)
+        return listing
+    
+    def job_count(self):
+        return SkillStats.objects.get(skill=self.skill).job_count
+    
+    def test_adding_a_skill_counts_the_listing(self):
+        self.create_listing()
+        self.assertEqual(self.job_count(), 1)
+    
+    def test_deactivating_a_listing_uncounts_it(self):
+        listing = self.create_listing()
+        listing.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            listing.save()
+        self.assertEqual(self.job_count(), 0)
+    
+    def test_saves_that_skip_the_flag_do_not_recount(self):
+        listing = self.create_listing()
+        listing.title = 'Senior Engineer'
+        with mock.patch('stats.signals.refresh_skills') as refresh:
+            listing.save(update_fields=['title'])
+        refresh.delay.assert_not_called()
+    
+    def test_reconcile_repairs_drifted_stats(self):
+        self.create_listing()
+        SkillStats.objects.update(job_count=5)
+        self.assertEqual(sync_skill_stats(), 1)
+        self.assertEqual(self.job_count(), 1)
@@ -0,0 +1,60 @@
+import os
+import signal
+import socket
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from tasks.queue import Heartbeat, register_periodic_states, run_pending
+
+class Command(BaseCommand):
+    help = 'Run a task worker that processes the database-backed task queue'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch', type=int, default=10, help='Tasks claimed per poll')
+        parser.add_argument('--sleep', type=float, default=None, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--once', action='store_true', help='Process what is due and exit')
+        parser.add_argument(
+            '--shared-disk', action='store_true',
+            help='Allow MEDIA_STORAGE=local because the worker shares MEDIA_ROOT with the web service'
+        )
+    
+    def handle(self, *args, **options):
+        # Image variants, resume chunks and imports are read and written by both sides
+        if settings.MEDIA_STORAGE == 'local' and not settings.DEBUG and not options['shared_disk']:
+            raise CommandError(
+                'The worker cannot see media on the web service\'s disk. '
+                'Set MEDIA_STORAGE=s3, or pass --shared-disk if both use the same MEDIA_ROOT.'
+            )
+        if 'REDIS_URL' not in os.environ:
+            self.stderr.write('REDIS_URL is not set: cache writes from this worker stay in its own process.')
+        
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        idle_sleep = options['sleep'] or getattr(settings, 'TASKS_POLL_INTERVAL', 1.0)
+        self.stopping = False
+        
+        # Finish the current batch on SIGTERM/SIGINT instead of dying mid-task
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        
+        register_periodic_states()
+        # Keeps locked_at fresh while a long task runs, so other workers do not requeue it
+        heartbeat = Heartbeat(worker_id)
+        heartbeat.start()
+        self.stdout.write(f'Worker {worker_id} started')
+        
+        try:
+            while not self.stopping:
+                close_old_connections()
+                processed = run_pending(worker_id, options['batch'])
+                if options['once'] and not processed:
+                    break
+                if not processed:
+                    time.sleep(idle_sleep)
+        finally:
+            heartbeat.stop()
+        
+        self.stdout.write(f'Worker {worker_id} stopped')
+    
+    def stop(self, signum, frame):
+        self.stopping = True
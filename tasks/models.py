@@ -0,0 +1,48 @@
+from django.db import models
+from django.utils import timezone
+
+class Task(models.Model):
+    """Deferred unit of work, claimed by workers with SELECT ... FOR UPDATE SKIP LOCKED"""
+    name = models.CharField(max_length=200)  # Registered task name
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    
+    # Execution state
+    status = models.CharField(max_length=20, choices=[
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ], default='queued')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        indexes = [
+            # Workers only ever scan the queued rows that are due
+            models.Index(
+                fields=['run_at'],
+                name='tasks_task_queued_idx',
+                condition=models.Q(status='queued')
+            ),
+            models.Index(fields=['status', 'finished_at'], name='tasks_task_status_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.name} ({self.status})"
+
+class PeriodicTaskState(models.Model):
+    """When each periodic task is next due, shared by all workers"""
+    name = models.CharField(max_length=200, primary_key=True)
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    next_run_at = models.DateTimeField()
+    
+    def __str__(self):
+        return self.name
@@ -0,0 +1,199 @@
+import logging
+import threading
+import traceback
+from datetime import timedelta
+from functools import update_wrapper
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import Task, PeriodicTaskState
+
+logger = logging.getLogger(__name__)
+
+# name -> TaskFunction, filled by @task as each app's tasks.py is imported
+registry = {}
+
+# name -> interval between runs, filled by @periodic_task
+periodic = {}
+
+def always_eager():
+    return getattr(settings, 'TASKS_ALWAYS_EAGER', False)
+
+def lock_timeout():
+    return timedelta(seconds=getattr(settings, 'TASKS_LOCK_TIMEOUT', 600))
+
+def heartbeat_interval():
+    # Several beats per lock timeout, so one slow beat does not get a live task requeued
+    return lock_timeout().total_seconds() / 4
+
+class TaskFunction:
+    """A registered task: call it directly, or `.delay()` it onto the queue"""
+    
+    def __init__(self, func, name, max_attempts, retry_delay):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        update_wrapper(self, func)
+    
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+    
+    def delay(self, *args, **kwargs):
+        return self.enqueue(args, kwargs)
+    
+    def enqueue(self, args=(), kwargs=None, run_at=None):
+        """
+        Queue the task. The row is written in the caller's transaction, so a
+        rolled-back request never leaves work behind.
+        """
+        kwargs = kwargs or {}
+        if always_eager():
+            transaction.on_commit(lambda: self.func(*args, **kwargs))
+            return None
+        return Task.objects.create(
+            name=self.name,
+            args=list(args),
+            kwargs=kwargs,
+            max_attempts=self.max_attempts,
+            run_at=run_at or timezone.now()
+        )
+
+def task(func=None, *, name=None, max_attempts=3, retry_delay=30):
+    """Register a function as a task. Arguments must be JSON-serializable."""
+    def decorator(func):
+        task_name = name or f'{func.__module__}.{func.__name__}'
+        wrapped = TaskFunction(func, task_name, max_attempts, retry_delay)
+        registry[task_name] = wrapped
+        return wrapped
+    
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+def periodic_task(every, **options):
+    """Register a task that workers enqueue every `every` (a timedelta)"""
+    def decorator(func):
+        wrapped = task(func, **options)
+        periodic[wrapped.name] = every
+        return wrapped
+    return decorator
+
+def register_periodic_states():
+    """Create a schedule row for each periodic task, due immediately if new"""
+    now = timezone.now()
+    PeriodicTaskState.objects.bulk_create(
+        [PeriodicTaskState(name=name, next_run_at=now) for name in periodic],
+        ignore_conflicts=True
+    )
+
+def schedule_periodic():
+    """Enqueue periodic tasks that are due. Safe to call from many workers at once."""
+    now = timezone.now()
+    with transaction.atomic():
+        due = PeriodicTaskState.objects.select_for_update(skip_locked=True)\
+            .filter(name__in=list(periodic), next_run_at__lte=now)
+        for state in due:
+            registry[state.name].enqueue()
+            state.last_run_at = now
+            state.next_run_at = now + periodic[state.name]
+            state.save(update_fields=['last_run_at', 'next_run_at'])
+
+def requeue_stale():
+    """Put back tasks whose worker died mid-run, or fail them if they have no attempts left"""
+    now = timezone.now()
+    stale = Task.objects.filter(status='running', locked_at__lt=now - lock_timeout())
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status='failed',
+        locked_by='',
+        locked_at=None,
+        finished_at=now,
+        last_error='Worker stopped sending heartbeats'
+    )
+    return stale.update(status='queued', locked_by='', locked_at=None)
+
+def heartbeat(worker_id):
+    """Refresh the locks on this worker's running tasks, so requeue_stale leaves them alone"""
+    return Task.objects.filter(status='running', locked_by=worker_id).update(locked_at=timezone.now())
+
+class Heartbeat(threading.Thread):
+    """Calls heartbeat() every heartbeat_interval() until stopped, on its own connection"""
+    
+    def __init__(self, worker_id):
+        super().__init__(name=f'heartbeat-{worker_id}', daemon=True)
+        self.worker_id = worker_id
+        self.stopped = threading.Event()
+    
+    def run(self):
+        try:
+            while not self.stopped.wait(heartbeat_interval()):
+                try:
+                    heartbeat(self.worker_id)
+                except DatabaseError:
+                    logger.exception('Heartbeat for worker %s failed', self.worker_id)
+                    connection.close()
+        finally:
+            connection.close()
+    
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+def claim(worker_id, batch_size=10):
+    """Lock a batch of due tasks for this worker; other workers skip past them"""
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(status='queued', run_at__lte=now)
+            .order_by('run_at')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        # The status guard also protects backends without row locks (SQLite)
+        Task.objects.filter(id__in=ids, status='queued').update(
+            status='running',
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=F('attempts') + 1
+        )
+    return list(Task.objects.filter(id__in=ids, status='running', locked_by=worker_id))
+
+def execute(task_row):
+    """Run one claimed task, then record success, schedule a retry, or mark it failed"""
+    func = registry.get(task_row.name)
+    try:
+        if func is None:
+            raise LookupError(f"Unknown task '{task_row.name}'")
+        func(*task_row.args, **task_row.kwargs)
+    except Exception:
+        logger.exception('Task %s (%s) failed', task_row.id, task_row.name)
+        task_row.last_error = traceback.format_exc()[-4000:]
+        task_row.locked_by = ''
+        task_row.locked_at = None
+        if func is not None and task_row.attempts < task_row.max_attempts:
+            # Exponential backoff: retry_delay, 2x, 4x...
+            delay = func.retry_delay * (2 ** (task_row.attempts - 1))
+            task_row.status = 'queued'
+            task_row.run_at = timezone.now() + timedelta(seconds=delay)
+        else:
+            task_row.status = 'failed'
+            task_row.finished_at = timezone.now()
+        task_row.save(update_fields=['status', 'run_at', 'last_error', 'locked_by', 'locked_at', 'finished_at'])
+        return False
+    
+    task_row.status = 'succeeded'
+    task_row.finished_at = timezone.now()
+    task_row.save(update_fields=['status', 'finished_at'])
+    return True
+
+def run_pending(worker_id, batch_size=10):
+    """One worker iteration. Returns the number of tasks run."""
+    schedule_periodic()
+    requeue_stale()
+    claimed = claim(worker_id, batch_size)
+    for task_row in claimed:
+        execute(task_row)
+    return len(claimed)
@@ -0,0 +1,18 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils import timezone
+from .models import Task
+from .queue import task, periodic_task
+
+@task(max_attempts=5, retry_delay=60)
+def send_email(subject, message, recipient_list):
+    """Send a plain-text email outside the request"""
+    send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, recipient_list)
+
+@periodic_task(every=timedelta(hours=6))
+def purge_finished_tasks():
+    """Drop finished task rows once they are past the retention window"""
+    days = getattr(settings, 'TASKS_RETENTION_DAYS', 7)
+    cutoff = timezone.now() - timedelta(days=days)
+    Task.objects.filter(status__in=['succeeded', 'failed'], finished_at__lt=cutoff).delete()
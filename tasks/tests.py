@@ -0,0 +1,111 @@
+from datetime import timedelta
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from tasks.models import PeriodicTaskState, Task
+from tasks.queue import (
+    claim, execute, heartbeat, periodic, register_periodic_states, requeue_stale, run_pending,
+    schedule_periodic, task
+)
+
+# Calls made by the tasks below, checked by the tests
+calls = []
+
+@task(name='tasks.tests.record', max_attempts=2, retry_delay=10)
+def record(value):
+    calls.append(value)
+
+@task(name='tasks.tests.explode', max_attempts=2, retry_delay=10)
+def explode():
+    raise RuntimeError('boom')
+
+class QueueTests(TestCase):
+    """Tasks are queued in the caller's transaction, claimed once, retried with backoff, then failed"""
+    
+    def setUp(self):
+        calls.clear()
+    
+    def test_delay_queues_a_row_and_a_worker_runs_it(self):
+        record.delay(7)
+        self.assertEqual(Task.objects.get().status, 'queued')
+        
+        self.assertEqual(run_pending('host:1'), 1)
+        self.assertEqual(calls, [7])
+        self.assertEqual(Task.objects.get().status, 'succeeded')
+    
+    def test_claimed_tasks_are_not_claimed_again(self):
+        record.delay(1)
+        self.assertEqual(len(claim('host:1')), 1)
+        self.assertEqual(claim('host:2'), [])
+    
+    def test_future_tasks_wait(self):
+        record.enqueue([1], run_at=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(claim('host:1'), [])
+    
+    def test_failure_is_retried_with_backoff_then_failed(self):
+        explode.delay()
+        [row] = claim('host:1')
+        before = timezone.now()
+        with self.assertLogs('tasks.queue', 'ERROR'):
+            self.assertFalse(execute(row))
+        row.refresh_from_db()
+        self.assertEqual(row.status, 'queued')
+        self.assertGreaterEqual(row.run_at, before + timedelta(seconds=10))
+        self.assertIn('RuntimeError: boom', row.last_error)
+        
+        Task.objects.filter(pk=row.pk).update(run_at=timezone.now())
+        [row] = claim('host:1')
+        with self.assertLogs('tasks.queue', 'ERROR'):
+            self.assertFalse(execute(row))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), ('failed', 2))
+    
+    @override_settings(TASKS_ALWAYS_EAGER=True)
+    def test_eager_tasks_run_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            record.delay(3)
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, [3])
+        self.assertFalse(Task.objects.exists())
+    
+    def test_periodic_tasks_are_queued_once_per_interval(self):
+        periodic['tasks.tests.record'] = timedelta(hours=1)
+        self.addCleanup(periodic.pop, 'tasks.tests.record')
+        register_periodic_states()
+        
+        schedule_periodic()
+        schedule_periodic()
+        self.assertEqual(Task.objects.filter(name='tasks.tests.record').count(), 1)
+        state = PeriodicTaskState.objects.get(name='tasks.tests.record')
+        self.assertGreater(state.next_run_at, timezone.now() + timedelta(minutes=59))
+
+class StaleTaskTests(TestCase):
+    """Running tasks are requeued only once their worker stops sending heartbeats"""
+    
+    def running(self, attempts=1, locked_for=timedelta(hours=1), worker='host:1'):
+        return Task.objects.create(
+            name='tasks.tests.noop', status='running', attempts=attempts, max_attempts=3,
+            locked_by=worker, locked_at=timezone.now() - locked_for
+        )
+    
+    def test_stale_task_is_requeued(self):
+        task = self.running()
+        self.assertEqual(requeue_stale(), 1)
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.locked_by, task.locked_at), ('queued', '', None))
+    
+    def test_stale_task_without_attempts_left_fails(self):
+        task = self.running(attempts=3)
+        self.assertEqual(requeue_stale(), 0)
+        task.refresh_from_db()
+        self.assertEqual(task.status, 'failed')
+        self.assertIsNotNone(task.finished_at)
+    
+    def test_heartbeat_keeps_a_long_task_locked(self):
+        task = self.running()
+        other = self.running(worker='host:2')
+        self.assertEqual(heartbeat('host:1'), 1)
+        requeue_stale()
+        task.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(task.status, 'running')
+        self.assertEqual(other.status, 'queued')
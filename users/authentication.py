@@ -0,0 +1,55 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from .cache import user_cache
+from .models import User
+
+# Only identity goes into tokens; flags such as is_active and is_staff are read
+# from the cached row, so a change to them applies to the next request, not the next token
+CLAIM_FIELDS = ('username',)
+
+def add_user_claims(token, user):
+    for field in CLAIM_FIELDS:
+        token[field] = getattr(user, field)
+    return token
+
+def build_user(values):
+    """Instantiate a User from field values without a query; fields not given are deferred"""
+    field_names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names])
+
+def load_user_values(user_id):
+    """The user's row as a dict, from the shared cache or one query that refills it"""
+    values = user_cache.get(user_id)
+    if values is None:
+        # The password hash stays out of the cache; it loads on first use
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname != 'password']
+        values = User.objects.filter(pk=user_id).values(*field_names).first()
+        if values is not None:
+            user_cache.set(user_id, values)
+    return values
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that builds request.user from the shared user cache
+    instead of fetching the row on every request. Saving a user drops the
+    entry, so deactivation or a permission change is seen by every worker
+    on its next request.
+    """
+    
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+        
+        values = load_user_values(user_id)
+        if values is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        
+        user = build_user(values)
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
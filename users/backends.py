@@ -0,0 +1,26 @@
+from django.contrib.auth.backends import ModelBackend
+from .hashing import hash_password, verify_password
+from .models import User
+
+class PooledHashingBackend(ModelBackend):
+    """
+    ModelBackend that checks passwords on the hashing pool and upgrades
+    hashes from older hashers on successful login
+    """
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        
+        try:
+            user = User._default_manager.get_by_natural_key(username)
+        except User.DoesNotExist:
+            # Hash anyway, so unknown emails take as long as wrong passwords
+            hash_password(password)
+            return None
+        
+        if verify_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
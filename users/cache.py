@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.cache import cache
+
+class UserCache:
+    """
+    User rows (field values keyed by user id) kept in the shared cache for
+    USER_CACHE_TTL seconds. Every process reads the same entry, so dropping
+    it on save (see signals) takes effect everywhere at once; with no
+    REDIS_URL the cache, and so the invalidation, is per process.
+    """
+    
+    def key(self, user_id):
+        return f'user:{user_id}'
+    
+    def ttl(self):
+        return getattr(settings, 'USER_CACHE_TTL', 30)
+    
+    def get(self, user_id):
+        if self.ttl() <= 0:
+            return None
+        return cache.get(self.key(user_id))
+    
+    def set(self, user_id, values):
+        if self.ttl() <= 0:
+            return
+        cache.set(self.key(user_id), values, self.ttl())
+    
+    def invalidate(self, user_id):
+        cache.delete(self.key(user_id))
+
+user_cache = UserCache()
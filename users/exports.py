@@ -0,0 +1,113 @@
+import csv
+import json
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+
+CHUNK_SIZE = 2000
+EXPORT_FORMATS = ('jsonl', 'csv')
+
+# dataset -> (model, field linking rows to their owner, exported columns)
+DATASETS = {
+    'profile': ('users.User', 'id', [
+        'id', 'email', 'username', 'first_name', 'last_name', 'bio', 'date_of_birth',
+        'education_level', 'field_of_study', 'career_goals', 'xp_points', 'level',
+        'is_mentor', 'is_mentee', 'receive_notifications', 'public_profile',
+        'linkedin_profile', 'github_profile', 'personal_website', 'created_at', 'updated_at'
+    ]),
+    'learning_paths': ('learning_paths.UserLearningPath', 'user_id', [
+        'id', 'user_id', 'learning_path_id', 'learning_path__title', 'current_step_id',
+        'progress', 'is_completed', 'enrolled_at', 'completed_at', 'last_activity'
+    ]),
+    'step_progress': ('progress.UserStepProgress', 'user_id', [
+        'id', 'user_id', 'step_id', 'step__title', 'status', 'progress_percentage',
+        'time_spent_minutes', 'difficulty_rating', 'notes', 'started_at', 'completed_at', 'updated_at'
+    ]),
+    'resources': ('resources.UserResource', 'user_id', [
+        'id', 'user_id', 'resource_id', 'resource__title', 'resource__url', 'is_bookmarked',
+        'is_completed', 'rating', 'notes', 'viewed_at', 'completed_at'
+    ]),
+    'forum_topics': ('forums.ForumTopic', 'author_id', [
+        'id', 'author_id', 'category_id', 'title', 'content', 'created_at', 'updated_at'
+    ]),
+    'forum_posts': ('forums.ForumPost', 'author_id', [
+        'id', 'author_id', 'topic_id', 'topic__title', 'content', 'is_solution',
+        'like_count', 'created_at', 'updated_at'
+    ]),
+    'mentorship_messages': ('mentorship.MentorshipMessage', 'sender_id', [
+        'id', 'sender_id', 'mentorship_id', 'content', 'is_read', 'created_at'
+    ]),
+    'study_group_messages': ('forums.StudyGroupMessage', 'sender_id', [
+        'id', 'sender_id', 'study_group_id', 'content', 'created_at'
+    ]),
+}
+
+class Echo:
+    """File-like object that hands back what is written, for streaming csv.writer output"""
+    
+    def write(self, value):
+        return value
+
+def dataset_queryset(dataset, user_id=None):
+    """A dataset's rows as dicts, optionally limited to one user"""
+    model_label, owner_field, columns = DATASETS[dataset]
+    queryset = apps.get_model(model_label).objects.order_by('pk')
+    if user_id is not None:
+        queryset = queryset.filter(**{owner_field: user_id})
+    return queryset.values(*columns)
+
+def dataset_rows(dataset, user_id=None):
+    """Iterate a dataset's rows with a server-side cursor"""
+    return dataset_queryset(dataset, user_id).iterator(chunk_size=CHUNK_SIZE)
+
+def adataset_rows(dataset, user_id=None):
+    """Async version of dataset_rows; each chunk is fetched on a worker thread"""
+    return dataset_queryset(dataset, user_id).aiterator(chunk_size=CHUNK_SIZE)
+
+def jsonl_line(dataset, row):
+    return json.dumps({'dataset': dataset, **row}, cls=DjangoJSONEncoder) + '\n'
+
+def stream_jsonl(datasets, user_id=None):
+    """Yield one JSON object per line, tagged with the dataset it belongs to"""
+    for dataset in datasets:
+        for row in dataset_rows(dataset, user_id):
+            yield jsonl_line(dataset, row)
+
+async def astream_jsonl(datasets, user_id=None):
+    for dataset in datasets:
+        async for row in adataset_rows(dataset, user_id):
+            yield jsonl_line(dataset, row)
+
+def stream_csv(dataset, user_id=None):
+    """Yield CSV lines for a single dataset, header first"""
+    columns = DATASETS[dataset][2]
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for row in dataset_rows(dataset, user_id):
+        yield writer.writerow([row[column] for column in columns])
+
+async def astream_csv(dataset, user_id=None):
+    columns = DATASETS[dataset][2]
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    async for row in adataset_rows(dataset, user_id):
+        yield writer.writerow([row[column] for column in columns])
+
+def stream_export(datasets, file_format, user_id=None, asynchronous=False):
+    """
+    Return a generator of text chunks for the requested datasets and format.
+    Under ASGI pass asynchronous=True: Django collects a sync generator into
+    a list before sending it, so only an async one streams.
+    """
+    unknown = [dataset for dataset in datasets if dataset not in DATASETS]
+    if unknown:
+        raise ValueError(f"Unknown dataset(s): {', '.join(unknown)}")
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format '{file_format}'. Choose from: {', '.join(EXPORT_FORMATS)}")
+    
+    if file_format == 'csv':
+        if len(datasets) != 1:
+            raise ValueError('CSV exports take exactly one dataset.')
+        stream = astream_csv if asynchronous else stream_csv
+        return stream(datasets[0], user_id)
+    stream = astream_jsonl if asynchronous else stream_jsonl
+    return stream(datasets, user_id)
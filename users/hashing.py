@@ -0,0 +1,81 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+from django.core.cache import cache
+
+# Password hashing runs on a small pool, so a burst of logins can only take
+# so many cores per process. The hashers release the GIL while they work.
+executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'PASSWORD_HASH_THREADS', 2),
+    thread_name_prefix='password-hash'
+)
+
+# Seconds a login slot is held at most, in case its process dies mid-login
+SLOT_TIMEOUT = 30
+
+class LoginBusy(Exception):
+    def __init__(self, retry_after=1):
+        super().__init__('Too many sign-ins in progress.')
+        self.retry_after = retry_after
+
+def run_hashing(func, *args):
+    return executor.submit(func, *args).result()
+
+def hash_password(password):
+    return run_hashing(make_password, password)
+
+def needs_rehash(encoded):
+    """True if the hash was made by another hasher, or with weaker parameters than now configured"""
+    preferred = get_hasher('default')
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+def verify_password(user, password):
+    """
+    Check a password on the hashing pool. On success a hash from an older
+    hasher is replaced with one from the preferred hasher.
+    """
+    encoded = user.password
+    if not run_hashing(check_password, password, encoded):
+        return False
+    
+    if needs_rehash(encoded):
+        user.password = hash_password(password)
+        user.save(update_fields=['password'])
+    return True
+
+def acquire_slot():
+    """Take one of LOGIN_MAX_CONCURRENT slots in the shared cache; None if all are taken"""
+    slots = getattr(settings, 'LOGIN_MAX_CONCURRENT', 8)
+    start = random.randrange(slots)
+    for offset in range(slots):
+        key = f'login-slot:{(start + offset) % slots}'
+        if cache.add(key, 1, timeout=SLOT_TIMEOUT):
+            return key
+    return None
+
+@contextmanager
+def login_slot():
+    """
+    Bound how many logins and sign-ups hash passwords at once across all
+    workers, so a burst at class start leaves workers free for the rest of
+    the API. Waits up to LOGIN_QUEUE_TIMEOUT for a slot, then raises LoginBusy.
+    """
+    deadline = time.monotonic() + getattr(settings, 'LOGIN_QUEUE_TIMEOUT', 1.0)
+    key = acquire_slot()
+    while key is None:
+        if time.monotonic() >= deadline:
+            raise LoginBusy(retry_after=random.randint(1, 3))
+        time.sleep(0.05)
+        key = acquire_slot()
+    
+    try:
+        yield
+    finally:
+        cache.delete(key)
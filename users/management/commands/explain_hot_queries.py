@@ -0,0 +1,72 @@
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import F, Q
+from forums.models import ForumPost, ForumTopic, StudyGroupMessage
+from jobs.models import Company, JobListing
+from learning_paths.models import LearningPath
+from mentorship.models import MentorProfile, MentorshipMessage
+from resources.models import UserResource
+from users.models import User
+
+def hot_queries():
+    """(label, queryset, index its plan must use)"""
+    return [
+        ('Topics in a category by hot score',
+         ForumTopic.objects.filter(category_id=1).order_by('-is_pinned', '-hot_score')[:20], 'forums_topic_hot_idx'),
+        ('Topics in a category by last activity',
+         ForumTopic.objects.filter(category_id=1).order_by('-last_activity')[:20], 'forums_topic_activity_idx'),
+        ('Posts in a topic', ForumPost.objects.filter(topic_id=1).order_by('position')[:20], 'forums_post_position_idx'),
+        ('Open job listings',
+         JobListing.objects.filter(is_active=True, expires_at__gte=date.today())[:20], 'jobs_listing_open_idx'),
+        ('Study group messages',
+         StudyGroupMessage.objects.filter(study_group_id=1, id__gt=0).order_by('id')[:100], 'forums_sgmessage_feed_idx'),
+        ('Mentorship messages',
+         MentorshipMessage.objects.filter(mentorship_id=1, id__gt=0).order_by('id')[:100], 'mentorship_message_feed_idx'),
+        ('Unread mentorship messages',
+         MentorshipMessage.objects.filter(mentorship_id=1, is_read=False).exclude(sender_id=1),
+         'mentorship_message_unread_idx'),
+        ('Available mentors',
+         MentorProfile.objects.filter(is_available=True, active_mentee_count__lt=F('max_mentees'))
+         .order_by('-rating')[:20], 'mentorship_profile_avail_idx'),
+        ('Visible learning paths',
+         LearningPath.objects.filter(Q(is_published=True) | Q(creator_id=1)).order_by('-created_at')[:20],
+         'lp_path_published_idx'),
+        ('Bookmarked resources',
+         UserResource.objects.filter(user_id=1, is_bookmarked=True), 'resources_ures_bookmark_idx'),
+        ('Completed resources',
+         UserResource.objects.filter(user_id=1, is_completed=True), 'resources_ures_completed_idx'),
+        ('Company typeahead', Company.objects.filter(name__icontains='acm')[:8], 'jobs_company_name_trgm_idx'),
+        ('Username search', User.objects.filter(username__icontains='ali')[:8], 'users_user_username_trgm_idx'),
+    ]
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN every hot API query on PostgreSQL and fail unless its plan uses the '
+        'index meant for it. Run it against realistic row counts (users.tests seeds '
+        'them): on near-empty tables the planner may rightly prefer a foreign-key '
+        'index and a sort.'
+    )
+    
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('explain_hot_queries needs PostgreSQL.')
+        
+        failures = []
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                # Without a sequential scan to fall back on, a query the index doesn't fit
+                # shows up as a plan on some other index (often the primary key)
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            for label, queryset, index in hot_queries():
+                plan = queryset.explain()
+                missed = index not in plan
+                self.stdout.write(f"{'FAIL' if missed else 'ok  '} {label} ({index})")
+                if missed:
+                    failures.append(f'{label} ({index})')
+                if missed or options['verbosity'] > 1:
+                    self.stdout.write(plan)
+        
+        if failures:
+            raise CommandError(f"Plans not using their index: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS('Every hot query uses its index.'))
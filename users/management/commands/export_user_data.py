@@ -0,0 +1,36 @@
+import sys
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from users.exports import DATASETS, EXPORT_FORMATS, stream_export
+
+User = get_user_model()
+
+class Command(BaseCommand):
+    help = 'Stream user data and activity as JSONL or CSV'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Email of the user to export (defaults to all users)')
+        parser.add_argument('--dataset', action='append', choices=sorted(DATASETS), help='Repeat for several datasets')
+        parser.add_argument('--format', choices=EXPORT_FORMATS, default='jsonl')
+        parser.add_argument('--output', help='File to write to (defaults to stdout)')
+    
+    def handle(self, *args, **options):
+        user_id = None
+        if options['user']:
+            try:
+                user_id = User.objects.values_list('id', flat=True).get(email=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"User '{options['user']}' not found.")
+        
+        try:
+            chunks = stream_export(options['dataset'] or list(DATASETS), options['format'], user_id=user_id)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        
+        output = open(options['output'], 'w', encoding='utf-8', newline='') if options['output'] else sys.stdout
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+        finally:
+            if output is not sys.stdout:
+                output.close()
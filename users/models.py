@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 
@@ -9,6 +11,7 @@ class User(AbstractUser):
     email = models.EmailField(_('email address'), unique=True)
     bio = models.TextField(blank=True)
     avatar = models.ImageField(upload_to='avatars/', null=True, blank=True)
+    avatar_variants = models.JSONField(default=dict, blank=True)  # Filled by the imaging pipeline
     date_of_birth = models.DateField(null=True, blank=True)
     
     # Education and career fields
@@ -41,6 +44,12 @@ class User(AbstractUser):
     class Meta:
         verbose_name = _('user')
         verbose_name_plural = _('users')
+        indexes = [
+            # Trigram indexes for mentor search and typeahead by username or email, on
+            # UPPER(...) because that is what icontains and istartswith compare
+            GinIndex(OpClass(Upper('username'), name='gin_trgm_ops'), name='users_user_username_trgm_idx'),
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='users_user_email_trgm_idx'),
+        ]
     
     def __str__(self):
         return self.email
@@ -62,6 +71,7 @@ class Badge(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField()
     icon = models.ImageField(upload_to='badges/')
+    icon_variants = models.JSONField(default=dict, blank=True)
     xp_reward = models.PositiveIntegerField(default=0)
     
     # Badge requirements
@@ -84,3 +94,21 @@ class UserBadge(models.Model):
     
     def __str__(self):
         return f"{self.user.username} - {self.badge.name}"
+
+class XPAward(models.Model):
+    """XP granted for one event (e.g. 'step:12'), so a retried award is applied only once"""
+    key = models.CharField(max_length=100, primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='xp_awards')
+    amount = models.PositiveIntegerField()
+    awarded_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.user_id} +{self.amount} ({self.key})"
+
+class RevokedToken(models.Model):
+    """A refresh token that may no longer be used, kept only until it expires anyway"""
+    jti = models.CharField(max_length=64, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
+    
+    def __str__(self):
+        return self.jti
@@ -2,17 +2,32 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework.validators import UniqueValidator
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+    TokenBlacklistSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import UntypedToken
+from imaging.fields import ImageVariantsField
+from .authentication import add_user_claims
+from .tokens import revoke, is_revoked
+from .hashing import hash_password, verify_password
 
 User = get_user_model()
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for the User model"""
     
+    avatar_variants = ImageVariantsField('avatar')
+    
     class Meta:
         model = User
         fields = [
             'id', 'email', 'username', 'first_name', 'last_name', 
-            'bio', 'avatar', 'date_of_birth', 'education_level', 
+            'bio', 'avatar', 'avatar_variants', 'date_of_birth', 'education_level', 
             'field_of_study', 'career_goals', 'xp_points', 'level',
             'is_mentor', 'is_mentee', 'linkedin_profile', 'github_profile',
             'personal_website', 'created_at'
@@ -24,11 +39,12 @@ class UserProfileSerializer(serializers.ModelSerializer):
     
     full_name = serializers.SerializerMethodField()
     level_progress = serializers.SerializerMethodField()
+    avatar_variants = ImageVariantsField('avatar')
     
     class Meta:
         model = User
         fields = [
-            'id', 'username', 'email', 'full_name', 'avatar', 
+            'id', 'username', 'email', 'full_name', 'avatar', 'avatar_variants', 
             'bio', 'xp_points', 'level', 'level_progress',
             'is_mentor', 'is_mentee', 'linkedin_profile', 
             'github_profile', 'personal_website'
@@ -70,7 +86,12 @@ class RegisterSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         validated_data.pop('password2')
-        user = User.objects.create_user(**validated_data)
+        password = validated_data.pop('password')
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        user.email = User.objects.normalize_email(user.email)
+        user.password = hash_password(password)
+        user.save()
         return user
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -81,6 +102,56 @@ class ChangePasswordSerializer(serializers.Serializer):
     
     def validate_old_password(self, value):
         user = self.context['request'].user
-        if not user.check_password(value):
+        if not verify_password(user, value):
             raise serializers.ValidationError("Old password is not correct")
         return value
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Issue tokens carrying the user claims StatelessJWTAuthentication reads"""
+    
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+class RotatingTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh with one-time refresh tokens: the presented token is revoked as
+    it is used, and the new pair carries the user's current claims
+    """
+    
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            used = not revoke(refresh)
+        else:
+            used = is_revoked(refresh)
+        if used:
+            raise TokenError('Token is blacklisted')
+        
+        user = User.objects.filter(pk=refresh[api_settings.USER_ID_CLAIM], is_active=True).first()
+        if user is None:
+            raise TokenError('User not found or inactive')
+        add_user_claims(refresh, user)
+        
+        data = {'access': str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+        return data
+
+class RevokedTokenVerifySerializer(TokenVerifySerializer):
+    """Token verification that also rejects revoked refresh tokens"""
+    
+    def validate(self, attrs):
+        if is_revoked(UntypedToken(attrs['token'])):
+            raise serializers.ValidationError('Token is blacklisted')
+        return {}
+
+class RevokeTokenSerializer(TokenBlacklistSerializer):
+    """Revoke a refresh token (logout)"""
+    
+    def validate(self, attrs):
+        revoke(self.token_class(attrs['refresh']))
+        return {}
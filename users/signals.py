@@ -0,0 +1,9 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .cache import user_cache
+from .models import User
+
+@receiver([post_save, post_delete], sender=User)
+def user_changed(sender, instance, **kwargs):
+    """Drop the shared cached row so every worker sees the change on its next request"""
+    user_cache.invalidate(instance.pk)
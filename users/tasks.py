@@ -0,0 +1,36 @@
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from tasks.queue import task, periodic_task
+from .cache import user_cache
+from .models import User, XPAward
+from .tokens import purge_expired
+
+# XP needed per level (simple level calculation)
+XP_PER_LEVEL = 1000
+
+@task
+def award_xp(user_id, amount, key):
+    """
+    Add XP and level the user up in a single UPDATE, so concurrent awards never race.
+    `key` names the event being rewarded; a retry or a repeat of the same event awards nothing.
+    """
+    with transaction.atomic():
+        _, created = XPAward.objects.get_or_create(key=key, defaults={'user_id': user_id, 'amount': amount})
+        if not created:
+            return
+        xp_points = F('xp_points') + amount
+        User.objects.filter(pk=user_id).update(
+            xp_points=xp_points,
+            level=Greatest(F('level'), xp_points / XP_PER_LEVEL + 1),
+            updated_at=timezone.now()
+        )
+    # update() skips the save signals
+    user_cache.invalidate(user_id)
+
+@periodic_task(every=timedelta(hours=1))
+def purge_revoked_tokens():
+    """Drop revocations for tokens that have expired; the table only holds live tokens"""
+    purge_expired()
@@ -0,0 +1,70 @@
+import json
+import unittest
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from forums.models import ForumCategory, ForumPost, ForumTopic
+from jobs.models import Company
+from users.models import User
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'EXPLAIN checks need PostgreSQL')
+class ExplainHotQueriesTests(TestCase):
+    """Every hot query's plan names its index once the tables hold enough rows for the planner to care"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        users = User.objects.bulk_create(
+            User(username=f'learner{n}', email=f'learner{n}@example.com') for n in range(200)
+        )
+        categories = ForumCategory.objects.bulk_create(
+            ForumCategory(name=f'Category {n}', description='') for n in range(5)
+        )
+        topics = ForumTopic.objects.bulk_create(
+            ForumTopic(title=f'Topic {n}', content='', category=categories[n % 5], author=users[n % 200], hot_score=n)
+            for n in range(5000)
+        )
+        ForumPost.objects.bulk_create(
+            ForumPost(topic=topics[n % 5], author=users[n % 200], content='', position=n // 5 + 1)
+            for n in range(5000)
+        )
+        Company.objects.bulk_create(
+            Company(name=f'Company {n}', description='', industry='', location='') for n in range(200)
+        )
+        with connection.cursor() as cursor:
+            for model in (User, ForumCategory, ForumTopic, ForumPost, Company):
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
+    
+    def test_every_plan_uses_its_index(self):
+        out = StringIO()
+        try:
+            call_command('explain_hot_queries', stdout=out)
+        except CommandError:
+            self.fail(out.getvalue())
+
+class ExportTests(TestCase):
+    """The export streams row by row: a sync generator under WSGI, an async one under ASGI"""
+    url = '/api/users/users/export/'
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='exporter', email='exporter@example.com', password='x')
+        cls.headers = {'Authorization': f'Bearer {AccessToken.for_user(cls.user)}'}
+    
+    def test_wsgi_streams_from_a_sync_generator(self):
+        response = self.client.get(self.url, {'dataset': 'profile'}, headers=self.headers, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.is_async)
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([row['username'] for row in rows], ['exporter'])
+    
+    async def test_asgi_streams_from_an_async_generator(self):
+        response = await self.async_client.get(
+            self.url, {'dataset': 'profile', 'file_format': 'csv'}, headers=self.headers, secure=True
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        lines = [line async for line in response.streaming_content]
+        self.assertEqual(len(lines), 2)
+        self.assertIn(b'exporter@example.com', lines[1])
@@ -0,0 +1,68 @@
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from .models import RevokedToken
+
+# Revoked jtis are also marked in the cache, so replays stop before the database
+CACHE_PREFIX = 'revoked-jti:'
+
+# Rows deleted per statement when purging
+PURGE_BATCH_SIZE = 10000
+
+def seconds_left(token):
+    return max(1, int(token['exp'] - time.time()))
+
+def mark_revoked(jti, token):
+    cache.set(CACHE_PREFIX + jti, 1, timeout=seconds_left(token))
+
+def revoke(token):
+    """
+    Revoke a token; returns False if it already was. The INSERT on the jti
+    primary key is the check itself, so of two concurrent refreshes with the
+    same token exactly one succeeds.
+    """
+    jti = token[api_settings.JTI_CLAIM]
+    if cache.get(CACHE_PREFIX + jti):
+        return False
+    
+    try:
+        with transaction.atomic():
+            RevokedToken.objects.create(
+                jti=jti,
+                expires_at=datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+            )
+    except IntegrityError:
+        revoked = False
+    else:
+        revoked = True
+    mark_revoked(jti, token)
+    return revoked
+
+def is_revoked(token):
+    jti = token.get(api_settings.JTI_CLAIM)
+    if jti is None:
+        return False
+    if cache.get(CACHE_PREFIX + jti):
+        return True
+    if RevokedToken.objects.filter(pk=jti).exists():
+        mark_revoked(jti, token)
+        return True
+    return False
+
+def purge_expired():
+    """Delete revocations for tokens past their expiry, in batches; returns the number deleted"""
+    # A little slack for clock skew between the app servers
+    cutoff = timezone.now() - timedelta(minutes=5)
+    total = 0
+    while True:
+        jtis = list(
+            RevokedToken.objects.filter(expires_at__lt=cutoff)
+            .values_list('jti', flat=True)[:PURGE_BATCH_SIZE]
+        )
+        if not jtis:
+            return total
+        deleted, _ = RevokedToken.objects.filter(jti__in=jtis).delete()
+        total += deleted
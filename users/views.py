@@ -2,6 +2,9 @@ from rest_framework import viewsets, generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.contrib.auth import get_user_model
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework_simplejwt.views import TokenObtainPairView
 from .serializers import (
     UserSerializer, 
     UserProfileSerializer, 
@@ -9,6 +12,8 @@ from .serializers import (
     ChangePasswordSerializer
 )
 from .permissions import IsOwnerOrReadOnly
+from .exports import DATASETS, stream_export
+from .hashing import LoginBusy, hash_password, login_slot
 
 User = get_user_model()
 
@@ -49,7 +54,8 @@ class UserViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['put', 'patch'])
     def update_profile(self, request):
         """Update current user profile"""
-        user = request.user
+        # Write through a fresh row; request.user may come from token claims or the user cache
+        user = User.objects.get(pk=request.user.pk)
         serializer = UserSerializer(user, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
@@ -64,11 +70,43 @@ class UserViewSet(viewsets.ModelViewSet):
             context={'request': request}
         )
         if serializer.is_valid():
-            user = request.user
-            user.set_password(serializer.validated_data['new_password'])
+            user = User.objects.get(pk=request.user.pk)
+            user.password = hash_password(serializer.validated_data['new_password'])
             user.save()
             return Response({"detail": "Password changed successfully"})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream the current user's data (or everyone's, for admins with ?scope=all)"""
+        file_format = request.query_params.get('file_format', 'jsonl')
+        datasets = request.query_params.getlist('dataset') or list(DATASETS)
+        
+        user_id = request.user.id
+        if request.query_params.get('scope') == 'all':
+            if not request.user.is_staff:
+                return Response({'detail': 'Only admins can export all users.'}, status=status.HTTP_403_FORBIDDEN)
+            user_id = None
+        
+        try:
+            chunks = stream_export(
+                datasets, file_format, user_id=user_id,
+                asynchronous=isinstance(request._request, ASGIRequest)
+            )
+        except ValueError as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        content_type = 'text/csv' if file_format == 'csv' else 'application/x-ndjson'
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="export.{file_format}"'
+        return response
+
+def login_busy_response(exc):
+    return Response(
+        {'detail': 'Too many sign-ins in progress, please retry shortly.'},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={'Retry-After': str(exc.retry_after)}
+    )
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -77,3 +115,24 @@ class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
+    throttle_scope = 'register'
+    
+    def create(self, request, *args, **kwargs):
+        try:
+            with login_slot():
+                return super().create(request, *args, **kwargs)
+        except LoginBusy as exc:
+            return login_busy_response(exc)
+
+class LoginView(TokenObtainPairView):
+    """
+    API endpoint issuing a JWT pair for email and password
+    """
+    throttle_scope = 'login'
+    
+    def post(self, request, *args, **kwargs):
+        try:
+            with login_slot():
+                return super().post(request, *args, **kwargs)
+        except LoginBusy as exc:
+            return login_busy_response(exc)